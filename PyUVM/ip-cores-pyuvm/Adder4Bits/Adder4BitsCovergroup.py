@@ -9,7 +9,7 @@ UVM uses this to track when 100% of interesting scenarios have been exercised.
 """
 
 from pyuvm import *
-from vsc import covergroup, coverpoint, bit_t, bin, cross, bin_array, report_coverage
+from CoverageEngine import covergroup, coverpoint, bit_t, bin, cross, bin_array, report_coverage
 
 @covergroup
 class Adder4BitsCovergroup():
@@ -16,10 +16,23 @@ class GoldenModel():
     the scoreboard to verify DUT outputs are correct.
     """
 
+    # Pkt attributes of the predict() outputs, in order
+    OUTPUTS = ("sum_o", "carry_o")
+
     def __init__(self):
         self.s = 0
         self.c = 0
 
+    def predict(self, a_i, b_i):
+        """
+        Compute the expected sum and carry.
+
+        Returns:
+            Tuple (sum_o, carry_o)
+        """
+        total_sum = int(a_i) + int(b_i)
+        return total_sum & 0xF, total_sum >> 4
+
     def check(self, packet):
         """
         Check if DUT outputs match expected sum and carry.
@@ -30,7 +43,5 @@ class GoldenModel():
         Returns:
             True if outputs match expected; False otherwise.
         """
-        total_sum = int(packet.a_i) + int(packet.b_i)
-        self.s = total_sum & 0xF
-        self.c = total_sum >> 4
+        self.s, self.c = self.predict(packet.a_i, packet.b_i)
         return (packet.sum_o == self.s and packet.carry_o == self.c)
\ No newline at end of file
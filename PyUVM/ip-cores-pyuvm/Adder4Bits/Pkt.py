@@ -10,6 +10,7 @@ driver -> BFM -> DUT, and back through monitor for scoreboard checking.
 
 from pyuvm import *
 import random
+from Transaction import SlottedItem
 
 class Pkt(uvm_sequence_item):
     """
@@ -20,6 +21,9 @@ class Pkt(uvm_sequence_item):
     - carry_o, sum_o: output results (set by monitor after DUT execution)
     """
 
+    # Input fields as (name, width), used to enumerate the input space
+    inputs = (("a_i", 4), ("b_i", 4))
+
     def __init__(self, name):
         super().__init__(name)
         self.a_i = 0
@@ -36,4 +40,14 @@ class Pkt(uvm_sequence_item):
         """
         self.a_i = random.randint(0, 15)
         self.b_i = random.randint(0, 15)
-    
\ No newline at end of file
+
+
+class SlottedPkt(SlottedItem):
+    """
+    Slotted Pkt (TRANSACTION=slotted): same fields and randomize(), without
+    the per-object __dict__ and uvm_sequence_item bookkeeping.
+    """
+
+    __slots__ = ("a_i", "b_i", "carry_o", "sum_o")
+    inputs = Pkt.inputs
+    randomize = Pkt.randomize
@@ -0,0 +1,185 @@
+"""
+BatchCheck: Vectorized scoreboard checking with NumPy (SCOREBOARD=batch).
+
+Checking every packet as it arrives leaves the Python overhead per
+transaction in charge of a long random regression. BatchChecker only stores
+each monitored transaction as one row of integer column arrays (packed input
+index, observed outputs). The rows are checked all at once against the
+compiled TruthTable with NumPy, when the batch is flushed.
+
+Flush triggers:
+- count: the batch holds SCOREBOARD_BATCH transactions
+- sim time: SCOREBOARD_FLUSH_NS have passed since the last flush (0 = off)
+- end of test: MyScoreboard flushes what is left in extract_phase, so
+  check_phase sees every mismatch
+
+Mismatches are reported with the index of the transaction in arrival order
+(0 = first transaction seen by the scoreboard), through the scoreboard's
+ScoreboardReport, so FAIL details follow the same rate limit. Results are
+counted per category (the scoreboard's CATEGORY fields) as in per-packet
+mode: a category input is decoded from the packed index and a category
+output is an observed column, so only other fields cost a column of their
+own.
+
+With WAVE_CAPTURE=fail the scoreboard passes its FailureWindow: every
+transaction is recorded as it is added, and the first mismatch of a flush
+writes the window ending at that transaction (WaveCapture), as the
+per-packet scoreboard does.
+
+Requires numpy (pip install numpy).
+"""
+
+import numpy as np
+
+
+class BatchChecker:
+    """
+    Column buffer and batch comparison for one scoreboard.
+
+    Attributes:
+        n_checked: Transactions compared so far
+        n_errors: Mismatches found so far
+        n_batches: Flushes that compared at least one transaction
+    """
+
+    def __init__(self, table, results, batch_size=4096, window=None, category=()):
+        """
+        Args:
+            table: Compiled TruthTable of the bench
+            results: Scoreboard ScoreboardReport (counters, FAIL details)
+            batch_size: Transactions per batch (count trigger)
+            window: FailureWindow to record into (WAVE_CAPTURE=fail), with
+                at least batch_size transactions of history
+            category: Packet fields the results are counted by
+        """
+        self.table = table
+        self.results = results
+        self.window = window
+        self.logger = results.logger
+        self.batch_size = batch_size
+        self.expected = np.array(table.table, dtype=np.int64).reshape(len(table), len(table.outputs))
+        self.index = np.zeros(batch_size, dtype=np.int64)
+        self.observed = np.zeros((batch_size, len(table.outputs)), dtype=np.int64)
+        self.category = tuple(category)
+        self.fields = {}
+        shift = 0
+        for name, width in reversed(table.inputs):
+            self.fields[name] = (shift, (1 << width) - 1)
+            shift += width
+        self.extra = [name for name in self.category
+                      if name not in self.fields and name not in table.outputs]
+        self.extra_values = np.zeros((batch_size, len(self.extra)), dtype=np.int64)
+        self.n = 0
+        self.n_checked = 0
+        self.n_errors = 0
+        self.n_batches = 0
+
+    def add(self, packet):
+        """
+        Append one transaction to the batch.
+
+        Returns:
+            Mismatches found (non-zero only when this call filled the batch,
+            or for a transaction with unresolved X/Z values)
+        """
+        if self.window is not None:
+            self.window.record(packet)
+        try:
+            row = self.n
+            self.index[row] = self.table.index(packet)
+            self.observed[row] = [int(getattr(packet, name)) for name in self.table.outputs]
+            if self.extra:
+                self.extra_values[row] = [int(getattr(packet, name)) for name in self.extra]
+        except ValueError:
+            errors = self.flush()
+            if self.window is not None:
+                self.window.failed(self.logger, self.n_checked)
+            category = tuple(getattr(packet, name) for name in self.category)
+            if len(category) <= 1:
+                category = category[0] if category else None
+            self.results.failed(category, "FAIL #%d: unresolved value in %s", self.n_checked, packet)
+            self.n_checked += 1
+            self.n_errors += 1
+            return errors + 1
+        self.n += 1
+        if self.n == self.batch_size:
+            return self.flush()
+        return 0
+
+    def flush(self):
+        """
+        Compare the buffered transactions against the table.
+
+        Returns:
+            Number of mismatches in the batch
+        """
+        n = self.n
+        if n == 0:
+            return 0
+        index = self.index[:n]
+        expected = self.expected[index]
+        observed = self.observed[:n]
+        bad = np.flatnonzero((expected != observed).any(axis=1))
+        categories = self._categories(index, observed, n)
+
+        first = self.n_checked
+        if len(bad) and self.window is not None:
+            self.window.failed(self.logger, first + int(bad[0]))
+        for row in bad:
+            self._report(first + int(row), int(index[row]), expected[row], observed[row],
+                         None if categories is None else self._key(categories[row]))
+
+        self.n = 0
+        self.n_checked += n
+        self.n_errors += len(bad)
+        self.n_batches += 1
+        if categories is None:
+            self.results.passed_many(None, n - len(bad))
+        else:
+            ok = np.ones(n, dtype=bool)
+            ok[bad] = False
+            values, counts = np.unique(categories[ok], axis=0, return_counts=True)
+            for value, count in zip(values, counts):
+                self.results.passed_many(self._key(value), int(count))
+        self.logger.debug(
+            "Batch #%d: transactions %d..%d checked, %d mismatches",
+            self.n_batches, first, first + n - 1, len(bad))
+        return len(bad)
+
+    def _categories(self, index, observed, n):
+        """Category columns of the first n rows, or None without a category."""
+        if not self.category:
+            return None
+        columns = []
+        for name in self.category:
+            if name in self.fields:
+                shift, mask = self.fields[name]
+                columns.append((index >> shift) & mask)
+            elif name in self.table.outputs:
+                columns.append(observed[:, self.table.outputs.index(name)])
+            else:
+                columns.append(self.extra_values[:n, self.extra.index(name)])
+        return np.stack(columns, axis=1)
+
+    @staticmethod
+    def _key(values):
+        """Category of one row, in the form the per-packet scoreboard counts."""
+        if len(values) == 1:
+            return int(values[0])
+        return tuple(int(v) for v in values)
+
+    def _report(self, number, index, expected, observed, category):
+        if self.results.n_failed >= self.results.fail_details:
+            self.results.failed(category, None)
+            return
+        inputs = []
+        shift = 0
+        for name, width in reversed(self.table.inputs):
+            inputs.append(f"{name}={(index >> shift) & ((1 << width) - 1)}")
+            shift += width
+        outputs = self.table.outputs
+        self.results.failed(
+            category, "FAIL #%d: %s. EXPECTED %s. RECEIVED %s", number,
+            ", ".join(reversed(inputs)),
+            ", ".join(f"{o}={int(v)}" for o, v in zip(outputs, expected)),
+            ", ".join(f"{o}={int(v)}" for o, v in zip(outputs, observed)))
@@ -0,0 +1,217 @@
+"""
+BoundedQueue: Bounded monitor queues and analysis FIFOs with overflow policies.
+
+The BFM mon_queue and the scoreboard uvm_tlm_analysis_fifo used to be
+unbounded, so a consumer that falls behind in a long run makes memory grow
+without limit. BoundedQueue is a drop-in UVMQueue with a maximum depth and
+an overflow policy:
+
+- block: the producer waits for room. The BFM monitor awaits put(), which
+  holds back the acknowledgment. MyMonitor waits for room
+  in bounded subscriber FIFOs (wait_for_subscribers) before it fetches the
+  next BFM result, so back-pressure reaches the sequence.
+- drop: items that do not fit are discarded and counted
+- spill: items that do not fit are pickled to a temporary file and read back
+  in order as the consumer catches up. Values are stored as int (str for
+  X/Z values), since cocotb logic values do not pickle.
+
+Every queue tracks its high-water mark (items in memory plus spilled), which
+report() logs at report_phase, also for unbounded queues, to size soak runs.
+
+Make variables:
+- BFM_QUEUE_DEPTH: BFM mon_queue depth (0 = unbounded, default)
+- ANALYSIS_FIFO_DEPTH: scoreboard analysis FIFO depth (0 = unbounded, default)
+- QUEUE_POLICY: block (default), drop or spill
+- QUEUE_SPILL_DIR: directory of the spill files (default: system temp dir)
+"""
+
+import os
+from cocotb.queue import QueueFull
+from cocotb.task import current_task
+from cocotb.triggers import Event
+from pyuvm import UVMQueue, uvm_tlm_analysis_fifo
+from Transaction import POOLED
+
+BFM_QUEUE_DEPTH = int(os.environ.get("BFM_QUEUE_DEPTH", "0"))
+ANALYSIS_FIFO_DEPTH = int(os.environ.get("ANALYSIS_FIFO_DEPTH", "0"))
+QUEUE_POLICY = os.environ.get("QUEUE_POLICY", "block").lower()
+QUEUE_SPILL_DIR = os.environ.get("QUEUE_SPILL_DIR", "")
+
+POLICIES = ("block", "drop", "spill")
+
+
+def _plain(value):
+    """int of a cocotb value, or its str when it holds X/Z."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def tuple_codec():
+    """Spill codec for BFM result tuples."""
+    return (lambda item: tuple([_plain(v) for v in item])), None
+
+
+def packet_codec(slotted_type):
+    """
+    Spill codec for monitored packets.
+
+    Only the bench fields (slotted_type.__slots__) are written; spilled
+    packets come back as unpooled slotted_type items.
+    """
+    fields = slotted_type.__slots__
+
+    def encode(pkt):
+        values = tuple([_plain(getattr(pkt, name)) for name in fields])
+        if POOLED:
+            pkt.release()
+        return values
+
+    def decode(values):
+        pkt = slotted_type()
+        for name, value in zip(fields, values):
+            setattr(pkt, name, value)
+        return pkt
+
+    return encode, decode
+
+
+class BoundedQueue(UVMQueue):
+    """
+    UVMQueue with a depth bound, an overflow policy and usage counters.
+
+    Attributes:
+        high_water: Largest number of queued items (memory + spilled)
+        n_dropped: Items discarded (drop policy)
+        n_spilled: Items written to disk (spill policy)
+    """
+
+    def __init__(self, name, maxsize=0, policy=QUEUE_POLICY, codec=None):
+        """
+        Args:
+            name: Name used in report()
+            maxsize: Items held in memory (0 = unbounded)
+            policy: block, drop or spill
+            codec: (encode, decode) pair for spilled items; decode None
+                keeps the encoded value
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown QUEUE_POLICY '{policy}' (expected one of {', '.join(POLICIES)})")
+        super().__init__(maxsize)
+        self.name = name
+        self.policy = policy
+        self.high_water = 0
+        self.n_dropped = 0
+        self.n_spilled = 0
+        self._encode, self._decode = codec or (None, None)
+        self._spill = None
+        self._spill_count = 0
+        self._read_pos = 0
+        self._write_pos = 0
+
+    def _size(self):
+        return len(self._queue) + self._spill_count
+
+    def full(self):
+        # Only the block policy makes producers wait
+        return self.policy == "block" and 0 < self._maxsize <= self._size()
+
+    def put_nowait(self, item):
+        """Queue item, or apply the overflow policy when memory is full."""
+        queue = self._queue
+        if self._spill_count or 0 < self._maxsize <= len(queue):
+            if self.policy == "drop":
+                self.n_dropped += 1
+                return
+            if self.policy != "spill":
+                raise QueueFull()
+            self._spill_item(item)
+        else:
+            queue.append(item)
+        size = len(queue) + self._spill_count
+        if size > self.high_water:
+            self.high_water = size
+        self._wakeup_next(self._getters)
+
+    def _get(self):
+        item = self._queue.popleft()
+        if self._spill_count:
+            self._queue.append(self._unspill_item())
+        return item
+
+    def _spill_item(self, item):
+        import pickle
+        import tempfile
+
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(prefix="queue-spill-", dir=QUEUE_SPILL_DIR or None)
+        if self._encode is not None:
+            item = self._encode(item)
+        self._spill.seek(self._write_pos)
+        pickle.dump(item, self._spill, pickle.HIGHEST_PROTOCOL)
+        self._write_pos = self._spill.tell()
+        self._spill_count += 1
+        self.n_spilled += 1
+
+    def _unspill_item(self):
+        import pickle
+
+        self._spill.seek(self._read_pos)
+        item = pickle.load(self._spill)
+        self._read_pos = self._spill.tell()
+        self._spill_count -= 1
+        if self._spill_count == 0:
+            # Everything read back: reuse the file from the start
+            self._spill.seek(0)
+            self._spill.truncate()
+            self._read_pos = self._write_pos = 0
+        if self._decode is not None:
+            item = self._decode(item)
+        return item
+
+    async def wait_for_room(self):
+        """Wait until one more item fits (block policy only)."""
+        while self.policy == "block" and 0 < self._maxsize <= self._size():
+            event = Event()
+            self._putters.append((event, current_task()))
+            await event.wait()
+
+    def report(self, logger):
+        """Log depth, policy, high-water mark and overflow counters."""
+        depth = self._maxsize if self._maxsize > 0 else "unbounded"
+        logger.info(
+            "Queue %s: depth %s, policy %s, high-water %d, dropped %d, spilled %d, left %d",
+            self.name, depth, self.policy, self.high_water, self.n_dropped,
+            self.n_spilled, self._size())
+        if self.n_dropped:
+            logger.warning("Queue %s dropped %d items: they were never checked", self.name, self.n_dropped)
+
+
+class BoundedAnalysisFifo(uvm_tlm_analysis_fifo):
+    """
+    uvm_tlm_analysis_fifo backed by a BoundedQueue (ANALYSIS_FIFO_DEPTH).
+
+    The analysis write() cannot wait, so with the block policy the producer
+    calls wait_for_subscribers() before producing the next item.
+    """
+
+    def __init__(self, name, parent, maxsize=ANALYSIS_FIFO_DEPTH, policy=QUEUE_POLICY, codec=None):
+        super().__init__(name, parent)
+        old_queue = self.queue
+        self.queue = BoundedQueue(self.get_full_name(), maxsize, policy, codec)
+        # Point every export built by uvm_tlm_fifo at the bounded queue
+        for export in vars(self).values():
+            if getattr(export, "queue", None) is old_queue:
+                export.queue = self.queue
+
+    def report(self, logger):
+        self.queue.report(logger)
+
+
+async def wait_for_subscribers(ap):
+    """Wait until every bounded FIFO connected to ap has room."""
+    for export in ap.subscribers:
+        queue = getattr(export, "queue", None)
+        if isinstance(queue, BoundedQueue):
+            await queue.wait_for_room()
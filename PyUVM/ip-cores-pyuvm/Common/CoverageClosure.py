@@ -0,0 +1,155 @@
+"""
+CoverageClosure: Event-driven coverage goal tracking.
+
+Replaces per-packet get_coverage() polling in the sequences. MyCoverage
+calls update() after every sample in write(); the goal_reached event is set
+once coverage reaches the goal, so sequences only test a flag (or await the
+event) instead of recomputing the coverage model for every packet.
+
+The coverage is only re-read when a bin is hit for the first time: the
+native engine reports first hits through on_first_hit(), and for pyvsc the
+covergroup model's coverage_ev() hook (called by every coverpoint and cross
+on a first hit) is wrapped to do the same (watch_first_hits).
+
+At the end of every run, report_phase saves the per-bin counts and the run
+metadata (seed, bench, engine, sequence, timestamp) to COVERAGE_DB, a
+CoverageDB file. If COVERAGE_DB names a directory (the Makefile default,
+coverage_db/), the file is named <covergroup>-seed<seed>.json, so the runs
+of different seeds accumulate there for covmerge.py.
+
+Sharded runs (shards.py) launch several seeds of one bench against a merged
+coverage goal. Every COVERAGE_SYNC_EVERY samples, each shard writes its
+per-bin counts to COVERAGE_DB (CoverageDB) and checks COVERAGE_STOP_FILE.
+Once the runner creates that file, because the merged coverage reached the
+target, goal_reached is set and the shard's stimulus ends normally.
+"""
+
+import os
+import time
+from cocotb.triggers import Event
+import CoverageDB
+from RunSeed import regression_seed
+
+COVERAGE_DB = os.environ.get("COVERAGE_DB", "")
+COVERAGE_STOP_FILE = os.environ.get("COVERAGE_STOP_FILE", "")
+COVERAGE_SYNC_EVERY = int(os.environ.get("COVERAGE_SYNC_EVERY", "256"))
+
+
+def watch_first_hits(cg, callback):
+    """
+    Call callback(item_name, bin_name) the first time each bin or cross cell
+    of cg is hit.
+
+    Native covergroups support this directly (on_first_hit). A pyvsc
+    covergroup model calls coverage_ev(item, bin_idx) on its instance model
+    for every first hit, so that method is wrapped on the instance.
+    """
+    if hasattr(cg, "on_first_hit"):
+        cg.on_first_hit(callback)
+        return
+    if not hasattr(cg, "get_model"):
+        raise TypeError(f"{type(cg).__name__} is neither a native nor a pyvsc covergroup")
+    model = cg.get_model()
+    coverage_ev = model.coverage_ev
+
+    def first_hit(item, bin_idx):
+        coverage_ev(item, bin_idx)
+        callback(item.name, item.get_bin_name(bin_idx))
+
+    model.coverage_ev = first_hit
+
+
+class CoverageClosure:
+    """
+    Coverage goal tracker attached to one covergroup.
+
+    Attributes:
+        goal_reached: cocotb Event set when coverage >= goal
+        goal: Target coverage percentage
+        sharded: True when run as one shard of shards.py (COVERAGE_STOP_FILE)
+        stopped: True once the runner asked this shard to stop
+        replay: True when replaying a failure window (SEQUENCE=window);
+            such partial runs neither check the goal nor save a DB
+        fixed_length: True when the sequence sends a fixed number of items
+            (SEQUENCE_ITEMS, benchmark.py); the goal is not checked
+    """
+
+    def __init__(self, cg, goal=100.0):
+        """
+        Args:
+            cg: Covergroup instance (pyvsc or native)
+            goal: Target coverage percentage
+        """
+        self.cg = cg
+        self.goal = goal
+        self.goal_reached = Event()
+        self._dirty = True
+        self.n_samples = 0
+        self._sample_event = Event()
+        self.sharded = bool(COVERAGE_STOP_FILE)
+        self.stopped = False
+        self.replay = os.environ.get("SEQUENCE", "").lower() == "window"
+        self.fixed_length = int(os.environ.get("SEQUENCE_ITEMS", "0")) > 0
+        self._sync = COVERAGE_SYNC_EVERY if COVERAGE_STOP_FILE else 0
+        self._db_dirty = True
+        watch_first_hits(cg, self._mark_dirty)
+
+    def _mark_dirty(self, item_name, bin_name):
+        self._dirty = True
+        self._db_dirty = True
+
+    def update(self):
+        """Re-evaluate the goal after a sample (called from write())."""
+        self.n_samples += 1
+        self._sample_event.set()
+        if self._sync and self.n_samples % self._sync == 0:
+            self.sync()
+        if self.goal_reached.is_set() or not self._dirty:
+            return
+        self._dirty = False
+        if self.cg.get_coverage() >= self.goal:
+            self.goal_reached.set()
+
+    def on_first_hit(self, callback):
+        """
+        Register callback(item_name, bin_name) for the first hit of each bin
+        (either coverage engine, see watch_first_hits).
+        """
+        watch_first_hits(self.cg, callback)
+
+    def sync(self):
+        """Write COVERAGE_DB (if new bins were hit) and honour COVERAGE_STOP_FILE."""
+        self.save()
+        if COVERAGE_STOP_FILE and not self.stopped and os.path.exists(COVERAGE_STOP_FILE):
+            self.stopped = True
+            self.goal_reached.set()
+
+    def save(self, force=False):
+        """
+        Write the per-bin counts and run metadata to COVERAGE_DB. The file
+        is only rewritten after a new first hit (or with force).
+        """
+        if not COVERAGE_DB or self.replay or not (force or self._db_dirty):
+            return
+        seed = regression_seed()
+        path = COVERAGE_DB
+        if path.endswith(os.sep) or os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+            path = os.path.join(path, f"{type(self.cg).__name__}-seed{seed}.json")
+        CoverageDB.write(path, CoverageDB.make_db(
+            self.cg, seed=seed, samples=self.n_samples,
+            bench=os.path.basename(os.environ.get("PWD", os.getcwd())),
+            engine=os.environ.get("COVERAGE_ENGINE", "pyvsc"),
+            sequence=os.environ.get("SEQUENCE", "random"),
+            timestamp=time.strftime("%Y-%m-%dT%H:%M:%S")))
+        self._db_dirty = False
+
+    async def wait(self):
+        """Block until the coverage goal is reached."""
+        await self.goal_reached.wait()
+
+    async def wait_for_samples(self, n):
+        """Block until at least n transactions have been sampled."""
+        while self.n_samples < n:
+            self._sample_event.clear()
+            await self._sample_event.wait()
@@ -0,0 +1,211 @@
+"""
+CoverageDB: Per-bin coverage snapshots as JSON files, and their merge.
+
+A coverage DB holds the hit count of every bin of one covergroup:
+
+    {
+      "covergroup": "MealyCovergroup",
+      "seed": 1234,              # cocotb random seed of the run
+      "samples": 5120,           # transactions sampled
+      "coverage": 88.89,         # coverage of this DB alone
+      "bench": "Mealy", "engine": "native", "sequence": "random",
+      "timestamp": "2026-10-18T12:00:00",
+      "items": {"cp1": {"kind": "cvp", "bins": ["valid_states[0]", ...], "counts": [12, ...]}}
+    }
+
+snapshot() reads the counts from either engine: NativeCoverage counters, or
+the pyvsc model (get_model()). Bin and item names identify bins, so DBs of
+different runs of the same bench merge by adding counts. coverage()
+recomputes the percentage the way both engines do: the mean over items of
+the fraction of bins hit.
+
+A merged DB lists the "seeds" and the metadata of every "runs" entry it
+adds up. unique_bins() tells which bins only one run (seed) hit, and
+minimal_runs() picks a small set of runs with the same merged coverage, to
+prune redundant seeds. covmerge.py at the repository root is the command
+line front end.
+
+This module does not import cocotb or pyvsc, so the runner scripts at the
+repository root use it as well.
+"""
+
+import json
+import os
+
+# Metadata kept for every run of a merged DB
+RUN_FIELDS = ("seed", "bench", "engine", "sequence", "timestamp", "samples", "coverage")
+
+
+def snapshot(cg):
+    """
+    Bin names and hit counts of every coverpoint and cross of cg.
+
+    Returns:
+        Dict item name -> {"bins": [...], "counts": [...]}
+    """
+    items = {}
+    if hasattr(cg, "_items"):
+        for item in cg._items:
+            if hasattr(item, "cell_name"):
+                kind, names = "cross", [item.cell_name(b) for b in range(item.n_bins)]
+            else:
+                kind, names = "cvp", list(item.bin_names)
+            items[item.name] = {"kind": kind, "bins": names, "counts": list(item.counts)}
+        return items
+    model = cg.get_model()
+    for kind, model_items in (("cvp", model.coverpoint_l), ("cross", model.cross_l)):
+        for item in model_items:
+            n = item.get_n_bins()
+            items[item.name] = {"kind": kind, "bins": [item.get_bin_name(b) for b in range(n)],
+                                "counts": [item.get_bin_hits(b) for b in range(n)]}
+    return items
+
+
+def coverage(items):
+    """Coverage percentage of an items dict (mean of per-item hit ratios)."""
+    ratios = [sum(1 for c in item["counts"] if c) / len(item["counts"])
+              for item in items.values() if item["counts"]]
+    return 100.0 * sum(ratios) / len(ratios) if ratios else 0.0
+
+
+def make_db(cg, seed=None, samples=0, **extra):
+    """Build a DB dict from a covergroup instance."""
+    items = snapshot(cg)
+    db = {"covergroup": type(cg).__name__, "seed": seed, "samples": samples,
+          "coverage": round(coverage(items), 4), "items": items}
+    db.update(extra)
+    return db
+
+
+def write(path, db):
+    """Write db atomically (readers never see a partial file)."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(db, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def read(path):
+    """Read a DB, or None if it does not exist (yet) or is unreadable."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def merge(dbs):
+    """
+    Add the counts of several DBs of the same covergroup.
+
+    Returns:
+        Merged DB: counts summed per item and bin, samples summed, seeds
+        listed, coverage recomputed
+
+    Raises:
+        ValueError: if the DBs do not share the same items and bins
+    """
+    dbs = [db for db in dbs if db is not None]
+    if not dbs:
+        return None
+    items = {name: dict(item, counts=list(item["counts"])) for name, item in dbs[0]["items"].items()}
+    for db in dbs[1:]:
+        if db["items"].keys() != items.keys():
+            raise ValueError(f"Coverage DBs of different covergroups: {sorted(db['items'])} vs {sorted(items)}")
+        for name, item in db["items"].items():
+            merged = items[name]
+            if item["bins"] != merged["bins"]:
+                raise ValueError(f"Coverage DBs disagree on the bins of {name}")
+            merged["counts"] = [a + b for a, b in zip(merged["counts"], item["counts"])]
+    return {
+        "covergroup": dbs[0]["covergroup"],
+        "seeds": [s for db in dbs for s in db.get("seeds", [db.get("seed")])],
+        "runs": [run for db in dbs for run in runs(db)],
+        "samples": sum(db.get("samples", 0) for db in dbs),
+        "coverage": round(coverage(items), 4),
+        "items": items,
+    }
+
+
+def runs(db):
+    """Metadata of the runs behind db (one entry unless db is a merge)."""
+    if "runs" in db:
+        return db["runs"]
+    return [{name: db.get(name) for name in RUN_FIELDS}]
+
+
+def label(db):
+    """Short name of a DB in reports: its seed, or the seeds it merges."""
+    seeds = db.get("seeds", [db.get("seed")])
+    return str(seeds[0]) if len(seeds) == 1 else "+".join(map(str, seeds))
+
+
+def hit_masks(db):
+    """Dict item name -> int whose bit b is set if bin b was hit."""
+    masks = {}
+    for name, item in db["items"].items():
+        mask = 0
+        for b, count in enumerate(item["counts"]):
+            if count:
+                mask |= 1 << b
+        masks[name] = mask
+    return masks
+
+
+def unique_bins(dbs):
+    """
+    Bins hit by exactly one of dbs (all of the same covergroup).
+
+    Returns:
+        List parallel to dbs: dict item name -> names of the bins that
+        only this DB hit (empty dict if it hit nothing on its own)
+    """
+    masks = [hit_masks(db) for db in dbs]
+    unique = [{} for _ in dbs]
+    for name in dbs[0]["items"] if dbs else ():
+        # OR of every DB before (prefix) and after (suffix) index i
+        prefix = [0]
+        for m in masks[:-1]:
+            prefix.append(prefix[-1] | m[name])
+        suffix = 0
+        for i in range(len(dbs) - 1, -1, -1):
+            only = masks[i][name] & ~(prefix[i] | suffix)
+            suffix |= masks[i][name]
+            if only:
+                bins = dbs[i]["items"][name]["bins"]
+                unique[i][name] = [bins[b] for b in range(len(bins)) if only >> b & 1]
+    return unique
+
+
+def minimal_runs(dbs):
+    """
+    Greedy set cover: indices of a small subset of dbs whose union hits
+    every bin any of them hits, largest contribution first.
+    """
+    masks = [hit_masks(db) for db in dbs]
+    missing = {name: 0 for name in (dbs[0]["items"] if dbs else ())}
+    for m in masks:
+        for name in missing:
+            missing[name] |= m[name]
+    chosen = []
+    while any(missing.values()):
+        _, best = max((sum(bin(m[name] & missing[name]).count("1") for name in missing), -i)
+                      for i, m in enumerate(masks) if i not in chosen)
+        best = -best
+        chosen.append(best)
+        for name in missing:
+            missing[name] &= ~masks[best][name]
+    return chosen
+
+
+def report(db, details=False):
+    """Text report in the layout of get_coverage_report(), for a (merged) DB."""
+    lines = [f"TYPE {db['covergroup']} : {db['coverage']:f}% "
+             f"(seeds {label(db)}, {db.get('samples', 0)} samples)"]
+    for name, item in db["items"].items():
+        counts = item["counts"]
+        item_coverage = 100.0 * sum(1 for c in counts if c) / len(counts) if counts else 0.0
+        lines.append(f"    {item.get('kind', 'cvp').upper()} {name} : {item_coverage:f}%")
+        if details:
+            lines.extend(f"        BIN {b} : {c}" for b, c in zip(item["bins"], counts))
+    return "\n".join(lines)
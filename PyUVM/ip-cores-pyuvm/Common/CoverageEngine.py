@@ -0,0 +1,36 @@
+"""
+CoverageEngine: Selects the coverage backend used by the bench covergroups.
+
+Covergroup files import the declaration API from here instead of from vsc,
+so each bench can be switched between backends for A/B comparison:
+- COVERAGE_ENGINE=pyvsc (default): pyvsc covergroups
+- COVERAGE_ENGINE=native: bitmap-backed NativeCoverage engine
+
+Example:
+    make COVERAGE_ENGINE=native
+"""
+
+import os
+
+ENGINE = os.environ.get("COVERAGE_ENGINE", "pyvsc").lower()
+
+if ENGINE == "native":
+    from NativeCoverage import (covergroup, coverpoint, bit_t, bin, bin_array, cross,
+                                get_coverage_report, report_coverage)
+elif ENGINE == "pyvsc":
+    from vsc import (covergroup, coverpoint, bit_t, bin, bin_array, cross,
+                     get_coverage_report, report_coverage)
+else:
+    raise ValueError(f"Unknown COVERAGE_ENGINE '{ENGINE}' (expected 'pyvsc' or 'native')")
+
+__all__ = [
+    "ENGINE",
+    "covergroup",
+    "coverpoint",
+    "bit_t",
+    "bin",
+    "bin_array",
+    "cross",
+    "get_coverage_report",
+    "report_coverage"
+]
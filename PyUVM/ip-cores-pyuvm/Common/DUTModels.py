@@ -0,0 +1,154 @@
+"""
+DUTModels: Python behavioural models of the PyUVM bench DUTs.
+
+PySim runs a bench against one of these models instead of the compiled RTL
+(make SIM=python). Each model declares every signal the wrappers reach
+through cocotb.top, ports and probed internal signals alike, and computes
+what the RTL drives:
+
+    class HalfAdderModel(DUTModel):
+        TOPLEVEL = "half_adder"
+        SIGNALS = {"a": 1, "b": 1, "c": 1, "s": 1}
+
+        def evaluate(self, v, rose, fell):
+            return {"s": v["a"] ^ v["b"], "c": v["a"] & v["b"]}
+
+PySim calls evaluate() after the bench or a clock wrote signals, before
+the next read or at the end of the delta cycle, with the current values
+(dict name -> int) and the names of the written 1-bit signals that rose or
+fell. Sequential models update their registers when their clock (or
+asynchronous reset) edge is in rose/fell, from the values before the
+edge, then return the combinational outputs of the new state. Values are
+2-state, as in Verilator.
+"""
+
+
+class DUTModel:
+    """
+    Behavioural model of one toplevel.
+
+    Attributes:
+        TOPLEVEL: COCOTB_TOPLEVEL the model stands in for
+        SIGNALS: Signal name -> width in bits
+    """
+
+    TOPLEVEL = ""
+    SIGNALS = {}
+
+    def evaluate(self, v, rose, fell):
+        """
+        React to the writes since the last evaluation.
+
+        Args:
+            v: Current signal values (name -> int)
+            rose: Written 1-bit signals that changed to 1
+            fell: Written 1-bit signals that changed to 0
+
+        Returns:
+            Dict name -> value of the signals the model drives
+        """
+        raise NotImplementedError
+
+
+class HalfAdderModel(DUTModel):
+    """half_adder: s = a ^ b, c = a & b."""
+
+    TOPLEVEL = "half_adder"
+    SIGNALS = {"a": 1, "b": 1, "c": 1, "s": 1}
+
+    def evaluate(self, v, rose, fell):
+        return {"s": v["a"] ^ v["b"], "c": v["a"] & v["b"]}
+
+
+class FullAdderModel(DUTModel):
+    """full_adder: two half adders and an or gate."""
+
+    TOPLEVEL = "full_adder"
+    SIGNALS = {"a_i": 1, "b_i": 1, "carry_i": 1, "sum_o": 1, "carry_o": 1}
+
+    def evaluate(self, v, rose, fell):
+        total = v["a_i"] + v["b_i"] + v["carry_i"]
+        return {"sum_o": total & 1, "carry_o": total >> 1}
+
+
+class Adder4BitsModel(DUTModel):
+    """adder_4bits: ripple-carry adder, s_o = a_i + b_i, c_o = carry out."""
+
+    TOPLEVEL = "adder_4bits"
+    SIGNALS = {"a_i": 4, "b_i": 4, "s_o": 4, "c_o": 1}
+
+    def evaluate(self, v, rose, fell):
+        total = v["a_i"] + v["b_i"]
+        return {"s_o": total & 0xF, "c_o": total >> 4}
+
+
+class MuxModel(DUTModel):
+    """mux4x1: y_o = x<sel_i>_i."""
+
+    TOPLEVEL = "mux4x1"
+    SIGNALS = {"x0_i": 1, "x1_i": 1, "x2_i": 1, "x3_i": 1, "sel_i": 2, "y_o": 1}
+    DATA = ("x0_i", "x1_i", "x2_i", "x3_i")
+
+    def evaluate(self, v, rose, fell):
+        # always_comb: y_o follows the selected input even if the bench wrote it
+        return {"y_o": v[self.DATA[v["sel_i"]]]}
+
+
+class DemuxModel(DUTModel):
+    """demux1x4: y<sel_i>_o = x_i, the other outputs 0."""
+
+    TOPLEVEL = "demux1x4"
+    SIGNALS = {"x_i": 1, "sel_i": 2, "y0_o": 1, "y1_o": 1, "y2_o": 1, "y3_o": 1}
+    OUTPUTS = ("y0_o", "y1_o", "y2_o", "y3_o")
+
+    def evaluate(self, v, rose, fell):
+        outputs = dict.fromkeys(self.OUTPUTS, 0)
+        outputs[self.OUTPUTS[v["sel_i"]]] = v["x_i"]
+        return outputs
+
+
+class MealyModel(DUTModel):
+    """
+    mealy_fsm: 2-bit state register, asynchronous active-low reset
+    (always_ff @(posedge clk_i or negedge rst_i)); mealy_o is 1 in S3 with
+    mealy_i = 0.
+    """
+
+    TOPLEVEL = "mealy_fsm"
+    SIGNALS = {"clk_i": 1, "rst_i": 1, "mealy_i": 1, "mealy_o": 1, "state": 2, "next_state": 2}
+    # NEXT[state][mealy_i]
+    NEXT = ((0, 1), (2, 1), (0, 3), (0, 1))
+
+    def evaluate(self, v, rose, fell):
+        state = v["state"]
+        if "clk_i" in rose or "rst_i" in fell:
+            state = self.NEXT[state][v["mealy_i"]] if v["rst_i"] else 0
+        mealy_i = v["mealy_i"]
+        return {"state": state, "next_state": self.NEXT[state][mealy_i],
+                "mealy_o": int(state == 3 and not mealy_i)}
+
+
+class MooreModel(DUTModel):
+    """
+    moore_fsm: 5 states (S0..S4), synchronous active-high reset; out_o is
+    registered and goes to 1 on the clock edge leaving S4.
+    """
+
+    TOPLEVEL = "moore_fsm"
+    SIGNALS = {"clk_i": 1, "rst_i": 1, "next_i": 1, "out_o": 1, "state_moore": 3}
+    # NEXT[state][next_i]
+    NEXT = ((0, 1), (2, 1), (0, 3), (2, 4), (2, 1))
+
+    def evaluate(self, v, rose, fell):
+        if "clk_i" not in rose:
+            return {}
+        state = v["state_moore"]
+        if v["rst_i"]:
+            return {"state_moore": 0, "out_o": 0}
+        if state >= len(self.NEXT):
+            return {"state_moore": 0, "out_o": 0}
+        return {"state_moore": self.NEXT[state][v["next_i"]], "out_o": int(state == 4)}
+
+
+MODELS = {model.TOPLEVEL: model for model in (
+    HalfAdderModel, FullAdderModel, Adder4BitsModel, MuxModel, DemuxModel, MealyModel, MooreModel)}
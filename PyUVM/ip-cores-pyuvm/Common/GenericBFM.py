@@ -0,0 +1,272 @@
+"""
+GenericBFM: Reusable Bus Functional Model driven by a signal map.
+
+Every bench wrapper used to repeat the same driver_queue / mon_queue /
+ack_event / stimulus_event machinery and re-resolve DUT handles through
+self.dut.<name> on every access. GenericBFM keeps the machinery in one place
+and resolves each port once, at construction; the driver and monitor then
+only touch the cached handles.
+
+A bench wrapper only declares its ports:
+
+    class HalfAdderWrapper(GenericBFM):
+        INPUTS = ("a", "b")     # driven from the packet attribute of the same name
+        OUTPUTS = ("s", "c")    # sampled after the inputs
+
+Result tuples follow INPUTS + OUTPUTS order; RESULT names the tuple fields
+(the Pkt attributes the shared MyMonitor fills) when they differ. Clocked
+benches also set CLOCK (started with CLOCK_PERIOD_NS) and list internal
+signals they read in PROBES; they override the driver/monitor tasks for
+their own timing and use the cached handles through self.handles.
+
+BFM modes (BFM_MODE make variable):
+- lockstep (default): one transaction in flight, acknowledged by the monitor
+  (one transaction per clock on the clocked benches)
+- fast: combinational benches only; send_pkt() drives the inputs, waits one
+  simulation step and samples the outputs inline, without driver/monitor
+  coroutines or handshake events
+
+mon_queue is a BoundedQueue (BFM_QUEUE_DEPTH, QUEUE_POLICY): with the block
+policy a full queue holds back the acknowledgment (lockstep) or send_pkt()
+(fast).
+
+With BFM_HANDLE_COST=1, report() also times one monitor sample through
+self.dut.<name> and through the cached handles (handle_cost); the
+micro-benchmark is off by default so normal runs do not pay for it.
+
+With RECORD set, get_result() also records every result tuple in a binary
+columnar file (TransactionRecorder), with the RESULT fields as columns.
+report() closes the file.
+
+With STAGE_TIMING set, driving a packet and sampling a result are timed as
+the <Wrapper>.driver_task and <Wrapper>.monitor_task stages (StageTiming).
+"""
+
+import os
+import time
+import cocotb
+from cocotb.triggers import Event, Timer
+from cocotb.queue import Queue
+from cocotb.clock import Clock
+from cocotb.utils import get_sim_time
+from Transaction import POOLED
+from BoundedQueue import BoundedQueue, BFM_QUEUE_DEPTH, tuple_codec
+from TransactionRecorder import RECORD, TransactionRecorder, record_path
+from StageTiming import TIMING, stage_timer
+from RunSeed import regression_seed
+
+BFM_MODE = os.environ.get("BFM_MODE", "lockstep").lower()
+HANDLE_COST = os.environ.get("BFM_HANDLE_COST", "0") == "1"
+
+
+class GenericBFM:
+    """
+    Bus Functional Model with cached DUT handles.
+
+    Operation:
+    - send_pkt() hands a packet to driver_task (after the previous ack)
+    - driver_task applies the packet to the INPUTS handles
+    - monitor_task samples INPUTS + OUTPUTS and publishes the tuple on mon_queue
+    - get_result() is called by the UVM monitor
+    """
+
+    INPUTS = ()
+    OUTPUTS = ()
+    PROBES = ()
+    # Result tuple field names, when not INPUTS + OUTPUTS (Pkt attributes, recorder columns)
+    RESULT = ()
+    CLOCK = None
+    CLOCK_PERIOD_NS = 10
+
+    def __init__(self):
+        """
+        Resolve all ports once and set up queues and events.
+        """
+        self.dut = cocotb.top
+        names = self.INPUTS + self.OUTPUTS + self.PROBES
+        self.handles = {name: getattr(self.dut, name) for name in names}
+        self.clock = getattr(self.dut, self.CLOCK) if self.CLOCK else None
+        self._drive = tuple((self.handles[name], name) for name in self.INPUTS)
+        self._sample = tuple(self.handles[name] for name in self.INPUTS + self.OUTPUTS)
+        self.fields = self.RESULT or self.INPUTS + self.OUTPUTS
+
+        self.fast = BFM_MODE == "fast" and self.clock is None
+        # Mode in effect: clocked benches ignore BFM_MODE=fast
+        self.mode = "fast" if self.fast else "lockstep"
+        self.driver_queue = Queue(maxsize=1)
+        self.mon_queue = BoundedQueue("bfm.mon_queue", BFM_QUEUE_DEPTH, codec=tuple_codec())
+        self.ack_event = Event()
+        self.stimulus_event = Event()
+        self.ack_event.set()
+
+        self.n_transactions = 0
+        self.first_time = None
+        self.last_time = None
+
+        self.recorder = None
+        if RECORD:
+            bench = os.path.basename(os.environ.get("PWD", os.getcwd()))
+            seed = regression_seed()
+            self.recorder = TransactionRecorder(
+                record_path(RECORD, bench, seed), self.fields,
+                bench=bench, seed=seed, bfm_mode=self.mode)
+
+        self.drive_timer = stage_timer(f"{type(self).__name__}.driver_task", "driver_task")
+        self.sample_timer = stage_timer(f"{type(self).__name__}.monitor_task", "monitor_task")
+
+    def drive(self, packet):
+        """
+        Apply packet attributes to the INPUTS handles. A pooled packet is
+        released here, since the BFM is its last user.
+        """
+        if TIMING:
+            self.drive_timer.start()
+        for handle, name in self._drive:
+            handle.value = getattr(packet, name)
+        if POOLED:
+            packet.release()
+        if TIMING:
+            self.drive_timer.stop()
+
+    def sample(self):
+        """Read INPUTS + OUTPUTS as a tuple."""
+        if TIMING:
+            self.sample_timer.start()
+        result = tuple([handle.value for handle in self._sample])
+        if TIMING:
+            self.sample_timer.stop()
+        return result
+
+    async def send_pkt(self, packet):
+        """
+        Send packet to driver task (called by MyDriver).
+
+        Lockstep mode waits for the previous acknowledgment; fast mode runs
+        the whole transaction here (fast_transaction).
+        """
+        if self.fast:
+            return await self.fast_transaction(packet)
+        await self.ack_event.wait()
+        self.ack_event.clear()
+        await self.driver_queue.put(packet)
+
+    async def fast_transaction(self, packet):
+        """
+        Drive, settle and sample one packet in a single coroutine call.
+
+        The result goes straight to mon_queue, in send order, so the UVM
+        monitor publishes exactly what the lockstep tasks would.
+
+        Returns:
+            The result tuple
+        """
+        self.drive(packet)
+        await Timer(1, unit='step')
+        result = self.sample()
+        await self.mon_queue.put(result)
+        return result
+
+    async def driver_task(self):
+        """
+        Driver coroutine: apply each queued packet and signal the monitor.
+        """
+        queue = self.driver_queue
+        stimulus_event = self.stimulus_event
+        while True:
+            packet = await queue.get()
+            self.drive(packet)
+            stimulus_event.set()
+
+    async def get_result(self):
+        """
+        Fetch monitored result (called by MyMonitor), recording it with
+        RECORD set.
+        """
+        result = await self.mon_queue.get()
+        if self.recorder is not None:
+            self.recorder.record(result)
+        return result
+
+    async def monitor_task(self):
+        """
+        Monitor coroutine: sample the ports after each stimulus and
+        acknowledge the driver.
+        """
+        mon_queue = self.mon_queue
+        stimulus_event = self.stimulus_event
+        ack_event = self.ack_event
+        while True:
+            await stimulus_event.wait()
+            stimulus_event.clear()
+            await mon_queue.put(self.sample())
+            ack_event.set()
+
+    async def drain(self):
+        """Wait until every transaction sent has been monitored."""
+        if self.fast:
+            return
+        await self.ack_event.wait()
+
+    def count_transaction(self):
+        """Record the sim time of a completed transaction for report()."""
+        now = get_sim_time(unit='ns')
+        if self.first_time is None:
+            self.first_time = now
+        self.last_time = now
+        self.n_transactions += 1
+
+    def handle_cost(self, n=1000):
+        """
+        Time one monitor sample through self.dut.<name> and through the
+        cached handles.
+
+        Returns:
+            Tuple (lookup_us, cached_us) per sample
+        """
+        names = self.INPUTS + self.OUTPUTS
+        dut = self.dut
+        start = time.perf_counter()
+        for _ in range(n):
+            tuple([getattr(dut, name).value for name in names])
+        lookup = time.perf_counter() - start
+
+        sample = self._sample
+        start = time.perf_counter()
+        for _ in range(n):
+            tuple([handle.value for handle in sample])
+        cached = time.perf_counter() - start
+        return 1e6 * lookup / n, 1e6 * cached / n
+
+    def report(self, logger):
+        """
+        Log mon_queue usage, handle access cost (BFM_HANDLE_COST=1) and,
+        for clocked benches, throughput. Closes the transaction recording.
+        """
+        if self.recorder is not None:
+            path = self.recorder.close()
+            logger.info(f"Recorded {self.recorder.rows} transactions "
+                        f"({self.recorder.n_xz} with X/Z) to {path}")
+        if HANDLE_COST:
+            lookup, cached = self.handle_cost()
+            logger.info(
+                f"BFM sample: {lookup:.2f} us via dut.<name>, {cached:.2f} us via cached handles")
+        self.mon_queue.report(logger)
+        if self.clock is None or self.n_transactions < 2:
+            return
+        cycles = (self.last_time - self.first_time) / self.CLOCK_PERIOD_NS + 1
+        logger.info(
+            f"BFM {self.mode}: {self.n_transactions} transactions in {cycles:.0f} clock cycles "
+            f"({self.n_transactions / cycles:.2f} per clock)")
+
+    def start_bfm(self):
+        """
+        Launch the clock (if any) and the driver and monitor tasks
+        (none in fast mode).
+        """
+        if self.clock is not None:
+            c = Clock(self.clock, self.CLOCK_PERIOD_NS, unit="ns")
+            cocotb.start_soon(c.start())
+        if self.fast:
+            return
+        cocotb.start_soon(self.driver_task())
+        cocotb.start_soon(self.monitor_task())
@@ -0,0 +1,376 @@
+"""
+NativeCoverage: Bitmap-backed functional coverage engine.
+
+Drop-in replacement for the subset of pyvsc used by the PyUVM benches:
+@covergroup, with_sample(), coverpoint() with bin/bin_array, and cross().
+All bins are preallocated when the covergroup is built:
+- Each coverpoint owns a value -> bin lookup table (list indexed by value)
+- Each cross owns a flat count array indexed by the mixed-radix bin tuple
+- A per-item hit bitmap and hit counter are updated on first hits only
+
+sample() is therefore a table lookup per coverpoint plus one index
+computation per cross, and get_coverage() returns a cached value that is
+only refreshed when a bin is hit for the first time.
+"""
+
+from array import array
+
+MAX_TABLE_WIDTH = 16
+MAX_AUTO_BINS = 64
+
+_covergroups = []
+
+
+class bit_t:
+    """Sample field type: unsigned value of the given bit width."""
+
+    def __init__(self, width=1):
+        self.width = width
+
+
+def _to_ranges(values):
+    """Normalize bin arguments (ints or [lo, hi] pairs) into (lo, hi) tuples."""
+    ranges = []
+    for v in values:
+        if isinstance(v, (list, tuple)):
+            lo, hi = v
+            ranges.append((int(lo), int(hi)))
+        else:
+            ranges.append((int(v), int(v)))
+    return ranges
+
+
+class bin:
+    """Single bin covering every listed value or [lo, hi] range."""
+
+    def __init__(self, *values):
+        self.ranges = _to_ranges(values)
+
+    def expand(self, name):
+        values = []
+        for lo, hi in self.ranges:
+            values.extend(range(lo, hi + 1))
+        return [(name, values)]
+
+
+class bin_array:
+    """
+    Array of bins over the listed values or [lo, hi] ranges.
+
+    - bin_array([], ...): one bin per value, named name[0], name[1], ...
+    - bin_array([n], ...): values split into n bins (remainder in the last)
+    """
+
+    def __init__(self, nbins, *values):
+        self.nbins = nbins
+        self.ranges = _to_ranges(values)
+
+    def expand(self, name):
+        values = []
+        for lo, hi in self.ranges:
+            values.extend(range(lo, hi + 1))
+
+        if not self.nbins:
+            return [(f"{name}[{i}]", [v]) for i, v in enumerate(values)]
+
+        n = self.nbins[0]
+        size = max(len(values) // n, 1)
+        bins = []
+        for i in range(n):
+            start = i * size
+            stop = len(values) if i == n - 1 else start + size
+            bins.append((f"{name}[{i}]", values[start:stop]))
+        return bins
+
+
+class _SampleField:
+    """Handle returned for each with_sample() field (e.g. self.a)."""
+
+    def __init__(self, name, width, index):
+        self.name = name
+        self.width = width
+        self.index = index
+
+
+class coverpoint:
+    """
+    Coverpoint over one sample field.
+
+    Operation:
+    - Expands bins/bin_arrays into a flat list of named bins
+    - Builds a lookup table from sampled value to the tuple of bins it hits
+    - Keeps a count array, a hit bitmap and a hit counter
+    """
+
+    def __init__(self, target, bins=None):
+        self.target = target
+        self.name = None
+        self.bin_names = []
+        self.bin_values = []
+
+        if bins is None:
+            self._auto_bins(target.width)
+        else:
+            for bin_name, spec in bins.items():
+                for name, values in spec.expand(bin_name):
+                    self.bin_names.append(name)
+                    self.bin_values.append(values)
+
+        self.n_bins = len(self.bin_names)
+        self.counts = array("Q", bytes(8 * self.n_bins))
+        self.hit_mask = 0
+        self.n_hit = 0
+        self.last = ()
+        self.lookup = None
+
+    def _auto_bins(self, width):
+        """Default bins when none are given: one per value, capped at 64."""
+        n_values = 1 << width
+        n_bins = min(n_values, MAX_AUTO_BINS)
+        size = n_values // n_bins
+        for i in range(n_bins):
+            self.bin_names.append(f"auto[{i}]")
+            self.bin_values.append(list(range(i * size, (i + 1) * size)))
+
+    def _build_lookup(self):
+        """
+        Preallocate the value -> bins table (dict for very wide fields).
+
+        Called by the covergroup once the coverpoint is named, so that a bin
+        value outside the field's range is reported as a ValueError naming
+        the coverpoint, the bin and the value.
+        """
+        width = self.target.width
+        if width <= MAX_TABLE_WIDTH:
+            self.lookup = [()] * (1 << width)
+        else:
+            self.lookup = {}
+        for b, values in enumerate(self.bin_values):
+            for v in values:
+                if not 0 <= v < 1 << width:
+                    raise ValueError(
+                        f"coverpoint {self.name}: bin {self.bin_names[b]} value {v} is outside "
+                        f"the {width}-bit range of sample field {self.target.name} "
+                        f"(0..{(1 << width) - 1})")
+                self.lookup[v] = self._find(v) + (b,)
+
+    def _find(self, value):
+        if isinstance(self.lookup, dict):
+            return self.lookup.get(value, ())
+        if 0 <= value < len(self.lookup):
+            return self.lookup[value]
+        return ()
+
+    def sample(self, value, group):
+        """Record one value; returns the tuple of bins hit."""
+        hits = self._find(value)
+        counts = self.counts
+        for b in hits:
+            if counts[b] == 0:
+                self.hit_mask |= 1 << b
+                self.n_hit += 1
+                group._first_hit(self, b)
+            counts[b] += 1
+        self.last = hits
+        return hits
+
+    def get_coverage(self):
+        return 100.0 * self.n_hit / self.n_bins if self.n_bins else 0.0
+
+
+class cross:
+    """
+    Cross of two or more coverpoints.
+
+    Cells are stored in a flat count array; the cell index is the
+    mixed-radix number formed by the bin index of each coverpoint.
+    """
+
+    def __init__(self, coverpoints):
+        self.coverpoints = list(coverpoints)
+        self.name = None
+        self.strides = []
+        stride = 1
+        for cp in reversed(self.coverpoints):
+            self.strides.insert(0, stride)
+            stride *= cp.n_bins
+        self.n_bins = stride
+        self.counts = array("Q", bytes(8 * self.n_bins))
+        self.hit_mask = 0
+        self.n_hit = 0
+
+    def cell_bins(self, cell):
+        """Decode a cell index into the bin index of each coverpoint."""
+        return tuple((cell // s) % cp.n_bins for s, cp in zip(self.strides, self.coverpoints))
+
+    def cell_name(self, cell):
+        """Name of a cell in pyvsc's format, "<bin_a,bin_b,...>", so DBs of both engines merge."""
+        return "<" + ",".join(cp.bin_names[b] for cp, b in zip(self.coverpoints, self.cell_bins(cell))) + ">"
+
+    def sample(self, group):
+        """Record the cell(s) formed by the coverpoints' last sampled bins."""
+        cells = [0]
+        for cp, stride in zip(self.coverpoints, self.strides):
+            if not cp.last:
+                return
+            if len(cp.last) == 1:
+                offset = cp.last[0] * stride
+                cells = [c + offset for c in cells]
+            else:
+                cells = [c + b * stride for c in cells for b in cp.last]
+
+        counts = self.counts
+        for cell in cells:
+            if counts[cell] == 0:
+                self.hit_mask |= 1 << cell
+                self.n_hit += 1
+                group._first_hit(self, cell)
+            counts[cell] += 1
+
+    def get_coverage(self):
+        return 100.0 * self.n_hit / self.n_bins if self.n_bins else 0.0
+
+
+class NativeCovergroup:
+    """
+    Base behaviour mixed into every @covergroup class.
+
+    Operation:
+    - with_sample() declares the positional sample fields
+    - Coverpoints/crosses assigned as attributes are collected after __init__
+    - sample() updates every coverpoint and cross in O(1) per item
+    - get_coverage() returns the cached weighted average of all items
+    """
+
+    def _init_model(self):
+        self._fields = []
+        self._coverpoints = []
+        self._crosses = []
+        self._coverage = 0.0
+        self._n_samples = 0
+        self._hit_callbacks = []
+
+    def with_sample(self, **fields):
+        for name, field_type in fields.items():
+            field = _SampleField(name, field_type.width, len(self._fields))
+            self._fields.append(field)
+            setattr(self, name, field)
+
+    def _build(self):
+        for name, item in list(vars(self).items()):
+            if isinstance(item, coverpoint):
+                item.name = name
+                item._build_lookup()
+                self._coverpoints.append(item)
+            elif isinstance(item, cross):
+                item.name = name
+                self._crosses.append(item)
+        self._items = self._coverpoints + self._crosses
+        _covergroups.append(self)
+
+    def sample(self, *values):
+        """Sample one transaction; arguments follow with_sample() order."""
+        self._n_samples += 1
+        values = [int(v) for v in values]
+        for cp in self._coverpoints:
+            cp.sample(values[cp.target.index], self)
+        for cr in self._crosses:
+            cr.sample(self)
+
+    def _first_hit(self, item, bin_index):
+        """Refresh the cached coverage when a bin is hit for the first time."""
+        total = sum(i.get_coverage() for i in self._items)
+        self._coverage = total / len(self._items) if self._items else 0.0
+        if self._hit_callbacks:
+            name = item.cell_name(bin_index) if isinstance(item, cross) else item.bin_names[bin_index]
+            for callback in self._hit_callbacks:
+                callback(item.name, name)
+
+    def on_first_hit(self, callback):
+        """
+        Register callback(item_name, bin_name), called once per bin or cross
+        cell the first time it is hit.
+        """
+        self._hit_callbacks.append(callback)
+
+    def get_coverage(self):
+        """Return the cached coverage percentage (0.0 to 100.0)."""
+        return self._coverage
+
+    def holes(self):
+        """
+        List the unhit bins and cross cells.
+
+        Returns:
+            List of (key, constraints) where key is (item_name, bin_index) and
+            constraints maps sample field index -> values that hit the hole.
+        """
+        result = []
+        for cp in self._coverpoints:
+            if cp.n_hit == cp.n_bins:
+                continue
+            for b in range(cp.n_bins):
+                if not cp.counts[b]:
+                    result.append(((cp.name, b), {cp.target.index: cp.bin_values[b]}))
+        for cr in self._crosses:
+            if cr.n_hit == cr.n_bins:
+                continue
+            for cell in range(cr.n_bins):
+                if cr.counts[cell]:
+                    continue
+                constraints = {}
+                for cp, b in zip(cr.coverpoints, cr.cell_bins(cell)):
+                    values = cp.bin_values[b]
+                    if cp.target.index in constraints:
+                        values = [v for v in constraints[cp.target.index] if v in values]
+                    constraints[cp.target.index] = values
+                if all(constraints.values()):
+                    result.append(((cr.name, cell), constraints))
+        return result
+
+    def detach(self):
+        """Remove this instance from get_coverage_report() (scratch models)."""
+        if self in _covergroups:
+            _covergroups.remove(self)
+
+    def get_report(self, details=False):
+        """Build a text report in the same layout as pyvsc's report."""
+        lines = [f"TYPE {type(self).__name__} : {self._coverage:f}%"]
+        for item in self._items:
+            kind = "CROSS" if isinstance(item, cross) else "CVP"
+            lines.append(f"    {kind} {item.name} : {item.get_coverage():f}%")
+            if not details:
+                continue
+            for b in range(item.n_bins):
+                name = item.cell_name(b) if isinstance(item, cross) else item.bin_names[b]
+                lines.append(f"        BIN {name} : {item.counts[b]}")
+        return "\n".join(lines)
+
+
+def covergroup(cls):
+    """
+    Class decorator: turns a pyvsc-style covergroup declaration into a
+    NativeCovergroup with preallocated bins.
+    """
+    user_init = cls.__init__
+
+    def __init__(self, *args, **kwargs):
+        self._init_model()
+        user_init(self, *args, **kwargs)
+        self._build()
+
+    return type(cls.__name__, (cls, NativeCovergroup), {
+        "__init__": __init__,
+        "__doc__": cls.__doc__,
+        "__module__": cls.__module__,
+    })
+
+
+def get_coverage_report(details=False):
+    """Return the report of every native covergroup instance."""
+    return "\n".join(cg.get_report(details) for cg in _covergroups)
+
+
+def report_coverage(details=False):
+    """Print the report of every native covergroup instance."""
+    print(get_coverage_report(details))
@@ -0,0 +1,211 @@
+"""
+PhaseProfile: Sampling profiler scoped by UVM phase, with flamegraph output.
+
+With PROFILE=1 a background thread samples the Python stack of the cocotb
+thread PROFILE_HZ times per second, from MyTest.build_phase until
+MyTest.report_phase. Each sample is filed under the phase pyuvm is running
+(uvm_root().running_phase: build_phase, connect_phase, ..., run_phase,
+extract_phase, check_phase, report_phase), so setup, the cocotb scheduler
+loop of run_phase and the end-of-test phases get separate profiles.
+
+Frames are named by qualified function name. In testbench code (anything
+outside the Python installation: the bench directories and Common/), a
+frame whose self is a UVM component also carries the component path, and
+a frame of an inherited method carries the class of its object, so
+coroutines that share code stay apart:
+
+    MyCoverage.write [uvm_test_top.env.coverage]
+    GenericBFM.monitor_task [MuxWrapper]
+
+Samples taken while the cocotb thread runs no Python code (the simulator
+itself, between GPI callbacks) are counted as [simulator].
+
+MyTest.report_phase stops the sampler, logs the samples per phase and the
+components with the most samples, and writes one collapsed-stack file per
+phase to PROFILE_DIR (<phase>.folded), plus all.folded with the phase as
+the root frame. flamegraph.pl, inferno-flamegraph and speedscope read
+them:
+
+    flamegraph.pl profile/run_phase.folded > run_phase.svg
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from pyuvm import uvm_component, uvm_root
+
+PROFILE = os.environ.get("PROFILE", "0") == "1"
+PROFILE_HZ = int(os.environ.get("PROFILE_HZ", "1000"))
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "profile")
+
+SIMULATOR = "[simulator]"
+
+
+def library_paths():
+    """Directories of the Python installation (cocotb, pyuvm, pyvsc, the stdlib)."""
+    import sysconfig
+
+    return tuple({sysconfig.get_paths()[key] for key in ("stdlib", "platstdlib", "purelib", "platlib")})
+
+
+def frame_name(frame, library=()):
+    """
+    Flamegraph name of one frame: qualified function name, plus the
+    component path (or the class of self, for inherited methods).
+
+    Args:
+        frame: Python frame
+        library: Path prefixes of frames that are not tagged (library_paths())
+    """
+    code = frame.f_code
+    name = code.co_qualname
+    if (code.co_argcount and code.co_varnames[0] == "self"
+            and not code.co_filename.startswith(library)):
+        owner = frame.f_locals.get("self")
+        if isinstance(owner, uvm_component):
+            return f"{name} [{owner.get_full_name()}]"
+        cls = type(owner).__name__
+        if owner is not None and not name.startswith(cls + "."):
+            return f"{name} [{cls}]"
+    return name
+
+
+class PhaseProfiler:
+    """
+    Stack sampler of one thread, keyed by the running UVM phase.
+
+    Attributes:
+        stacks: Counter (phase, stack) -> samples, stack root first
+        n_samples: Samples taken
+    """
+
+    def __init__(self, hz=PROFILE_HZ, thread_id=None):
+        """
+        Args:
+            hz: Samples per second
+            thread_id: Thread to sample (default: the calling thread)
+        """
+        self.interval = 1.0 / hz
+        self.thread_id = thread_id or threading.get_ident()
+        self.root = uvm_root()
+        self.library = library_paths()
+        self.stacks = Counter()
+        self.n_samples = 0
+        self.wall = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="PhaseProfiler", daemon=True)
+        self._switch = None
+
+    def start(self):
+        """Start sampling."""
+        # The sampler needs the GIL between the interpreter's thread switches
+        self._switch = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch, self.interval))
+        self._start = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch)
+        self.wall = time.perf_counter() - self._start
+
+    def _run(self):
+        root = self.root
+        library = self.library
+        while not self._stop.wait(self.interval):
+            phase = root.running_phase
+            phase = str(phase.__name__[4:]) if phase is not None else "startup"
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame_name(frame, library))
+                frame = frame.f_back
+            stack.reverse()
+            self.stacks[phase, tuple(stack) or (SIMULATOR,)] += 1
+            self.n_samples += 1
+
+    def phases(self):
+        """Phases with samples, in the order they ran."""
+        seen = {}
+        for phase, _ in self.stacks:
+            seen.setdefault(phase, None)
+        return list(seen)
+
+    def write(self, directory):
+        """
+        Write <phase>.folded per phase and all.folded to directory.
+
+        Returns:
+            Paths written
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for phase in self.phases() + [None]:
+            path = os.path.join(directory, f"{phase or 'all'}.folded")
+            with open(path, "w") as f:
+                for (stack_phase, stack), count in self.stacks.items():
+                    if phase is None:
+                        f.write(f"{stack_phase};{';'.join(stack)} {count}\n")
+                    elif stack_phase == phase:
+                        f.write(f"{';'.join(stack)} {count}\n")
+            paths.append(path)
+        return paths
+
+    def owners(self):
+        """
+        Samples per owner: the innermost component (or BFM wrapper) on the
+        stack, [simulator], or (no component) for the scheduler and
+        library code outside any testbench object.
+
+        Returns:
+            Counter owner -> samples
+        """
+        owners = Counter()
+        for (_, stack), count in self.stacks.items():
+            owner = next((name[name.index("[") + 1:-1] for name in reversed(stack) if name.endswith("]")),
+                         None)
+            if owner is None and stack == (SIMULATOR,):
+                owner = SIMULATOR
+            owners[owner or "(no component)"] += count
+        return owners
+
+
+_profiler = None
+
+
+def start_profiling():
+    """Start the sampler on the calling (cocotb) thread (call in MyTest.build_phase)."""
+    global _profiler
+    if PROFILE and _profiler is None:
+        _profiler = PhaseProfiler()
+        _profiler.start()
+
+
+def report_profiling(logger, directory=PROFILE_DIR):
+    """Stop the sampler, log the per-phase summary and write the .folded files."""
+    global _profiler
+    if _profiler is None:
+        return
+    profiler, _profiler = _profiler, None
+    profiler.stop()
+    if not profiler.n_samples:
+        logger.warning("Profile: no samples taken")
+        return
+    per_phase = Counter()
+    for (phase, _), count in profiler.stacks.items():
+        per_phase[phase] += count
+    lines = [f"Profile: {profiler.n_samples} samples over {profiler.wall:.3f} s "
+             f"({profiler.n_samples / profiler.wall:.0f} Hz)"]
+    for phase in profiler.phases():
+        lines.append(f"  {phase:24} {per_phase[phase]:7} samples  {100 * per_phase[phase] / profiler.n_samples:5.1f}%")
+    lines.append("  Top owners (innermost component on the stack):")
+    for owner, count in profiler.owners().most_common(8):
+        lines.append(f"  {owner:40} {count:7} samples  {100 * count / profiler.n_samples:5.1f}%")
+    logger.info("\n".join(lines))
+    paths = profiler.write(directory)
+    logger.info(f"Profile: {len(paths)} collapsed-stack files written to {directory}")
@@ -0,0 +1,505 @@
+"""
+PySim: Pure-Python simulator backend for the PyUVM benches.
+
+With make SIM=python a bench runs without Verilator: PySim stands in for
+cocotb's GPI module (cocotb.simulator) and drives the behavioural model of
+the toplevel from DUTModels instead of the compiled RTL. cocotb, pyuvm,
+MyTest, MyEnv and the wrappers run unchanged, on the same triggers (Timer,
+RisingEdge/FallingEdge, ReadWrite, ReadOnly, NextTimeStep) and the same
+cocotb.top handles. This separates the testbench cost from the simulator
+cost, and profiles of the Python side are not diluted by Verilator.
+
+    make SIM=python
+    python3 regression.py PyUVM/ SIM=python
+
+Scheduler, per time step:
+- timed callbacks (Timer, clock toggles) due at the step, after the
+  NextTimeStep callbacks
+- delta cycles until nothing changes: value-change (edge) callbacks of the
+  signals changed in the delta fire, then ReadWrite callbacks
+- ReadOnly callbacks, then the next step
+
+A write marks the model dirty; the model evaluates the pending writes on
+the next read of any signal, or at the end of the delta. Combinational
+outputs therefore settle with zero delay: a monitor that samples right
+after the driver wrote the inputs reads the new outputs.
+
+Every callback fires once, as with the GPI. Time precision is 1 ps
+(COCOTB_HDL_TIMEPRECISION default). Values are 2-state: X/Z written by the
+bench read back as 0, as with Verilator.
+
+With WAVES=1 the settled values of every time step go to dump.vcd in the
+working directory, where Verilator writes its trace. PYSIM_FORCE holds
+signals at a value for the whole run (stuck-at faults), e.g. PYSIM_FORCE=c=1
+or PYSIM_FORCE=s=0,c=1.
+"""
+
+import heapq
+import importlib.abc
+import importlib.machinery
+import os
+import platform
+import sys
+import time
+import types
+
+from DUTModels import MODELS
+
+# GPI constants, as cocotb.simulator defines them
+UNKNOWN, MEMORY, MODULE, NETARRAY, ENUM, STRUCTURE, REAL, INTEGER = 0, 1, 2, 6, 7, 8, 9, 10
+STRING, FIXED_STRING, GENARRAY, PACKAGE, PACKED, LOGIC, LOGIC_ARRAY = 11, 12, 13, 14, 15, 16, 17
+OBJECTS, DRIVERS, LOADS = 1, 2, 3
+VALUE_CHANGE, RISING, FALLING = 0, 1, 2
+RANGE_DOWN, RANGE_NO_DIR, RANGE_UP = -1, 0, 1
+# _GPISetAction values
+DEPOSIT, FORCE, RELEASE, NO_DELAY = 0, 1, 2, 3
+
+PRECISION = -12
+_TYPE_STRINGS = {MODULE: "GPI_MODULE", LOGIC: "GPI_LOGIC", LOGIC_ARRAY: "GPI_LOGIC_ARRAY"}
+# 2-state: everything but 1 reads back as 0
+_TWO_STATE = str.maketrans("xXzZuUwWlLhH-", "0000000000010")
+
+
+class sim_callback:
+    """One-shot callback; deregister() before it fires cancels it."""
+
+    __slots__ = ("func", "args", "active", "edge")
+
+    def __init__(self, func, args, edge=VALUE_CHANGE):
+        self.func = func
+        self.args = args
+        self.edge = edge
+        self.active = True
+
+    def deregister(self):
+        self.active = False
+
+    def fire(self):
+        self.active = False
+        self.func(*self.args)
+
+
+class sim_obj:
+    """GPI handle: the toplevel module or one of its signals."""
+
+    def __init__(self, sim, name, kind, width=1, children=()):
+        self.sim = sim
+        self.name = name
+        self.kind = kind
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.children = {child.name: child for child in children}
+        self.forced = False
+
+    def get_name_string(self):
+        return self.name
+
+    def get_type(self):
+        return self.kind
+
+    def get_type_string(self):
+        return _TYPE_STRINGS.get(self.kind, "GPI_UNKNOWN")
+
+    def get_definition_name(self):
+        return self.name if self.kind == MODULE else ""
+
+    def get_definition_file(self):
+        return ""
+
+    def get_const(self):
+        return False
+
+    def get_signed(self):
+        return 0
+
+    def get_indexable(self):
+        return False
+
+    def get_num_elems(self):
+        return self.width
+
+    def get_range(self):
+        return self.width - 1, 0, RANGE_DOWN
+
+    def get_handle_by_name(self, name, discovery_method=None):
+        return self.children.get(name)
+
+    def get_handle_by_index(self, index):
+        return None
+
+    def iterate(self, mode):
+        return iter(list(self.children.values()) if mode == OBJECTS else [])
+
+    def get_signal_val_long(self):
+        if self.sim._pending:
+            self.sim._evaluate()
+        return self.sim.values[self.name]
+
+    def get_signal_val_binstr(self):
+        return format(self.get_signal_val_long(), f"0{self.width}b")
+
+    def set_signal_val_int(self, action, value):
+        self.sim.write(self, value & self.mask, action)
+
+    def set_signal_val_binstr(self, action, value):
+        self.sim.write(self, int(value.translate(_TWO_STATE), 2), action)
+
+
+class cpp_clock:
+    """Clock driven by the scheduler itself, without a cocotb task."""
+
+    def __init__(self, signal):
+        self.signal = signal
+        self.callback = None
+
+    def start(self, period_steps, high_steps, start_high, set_action):
+        sim = self.signal.sim
+        times = (high_steps, period_steps - high_steps)
+
+        def toggle(level):
+            sim.write(self.signal, level, set_action)
+            self.callback = sim.register_timed_callback(times[1 - level], toggle, 1 - level)
+
+        toggle(1 if start_high else 0)
+
+    def stop(self):
+        if self.callback is not None:
+            self.callback.deregister()
+            self.callback = None
+
+
+class PySim:
+    """
+    Scheduler and signal store for one DUT model.
+
+    Attributes:
+        values: Signal name -> current value
+        now: Current time in steps (ps)
+        n_steps: Time steps simulated
+        n_deltas: Delta cycles with signal changes
+        n_evaluations: Model evaluations
+        n_callbacks: Callbacks fired
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.values = dict.fromkeys(model.SIGNALS, 0)
+        signals = [sim_obj(self, name, LOGIC if width == 1 else LOGIC_ARRAY, width)
+                   for name, width in model.SIGNALS.items()]
+        self.top = sim_obj(self, model.TOPLEVEL, MODULE, children=signals)
+        self.signals = {signal.name: signal for signal in signals}
+        self.now = 0
+        self.stopped = False
+        self._seq = 0
+        self._timed = []
+        self._readwrite = []
+        self._readonly = []
+        self._nextstep = []
+        self._watchers = {}
+        self._pending = {}
+        self._changed = {}
+        self._on_sim_event = None
+        self.n_steps = 0
+        self.n_deltas = 0
+        self.n_evaluations = 0
+        self.n_callbacks = 0
+        self.vcd = None
+
+    # -- cocotb.simulator API --------------------------------------------------
+
+    def register_timed_callback(self, steps, func, *args):
+        callback = sim_callback(func, args)
+        self._seq += 1
+        heapq.heappush(self._timed, (self.now + steps, self._seq, callback))
+        return callback
+
+    def register_rwsynch_callback(self, func, *args):
+        callback = sim_callback(func, args)
+        self._readwrite.append(callback)
+        return callback
+
+    def register_readonly_callback(self, func, *args):
+        callback = sim_callback(func, args)
+        self._readonly.append(callback)
+        return callback
+
+    def register_nextstep_callback(self, func, *args):
+        callback = sim_callback(func, args)
+        self._nextstep.append(callback)
+        return callback
+
+    def register_value_change_callback(self, signal, func, edge, *args):
+        callback = sim_callback(func, args, edge)
+        self._watchers.setdefault(signal.name, []).append(callback)
+        return callback
+
+    def get_sim_time(self):
+        return self.now >> 32, self.now & 0xFFFFFFFF
+
+    def get_precision(self):
+        return PRECISION
+
+    def get_root_handle(self, name):
+        return self.top if name is None or name == self.top.name else None
+
+    def root_iterate(self):
+        return iter([self.top])
+
+    def package_iterate(self):
+        return None
+
+    def get_simulator_args(self):
+        return sys.argv[1:]
+
+    def get_simulator_product(self):
+        return "PySim"
+
+    def get_simulator_version(self):
+        return platform.python_version()
+
+    def is_running(self):
+        return not self.stopped
+
+    def stop_simulator(self):
+        self.stopped = True
+
+    def set_sim_event_callback(self, func):
+        self._on_sim_event = func
+
+    def clock_create(self, signal):
+        return cpp_clock(signal)
+
+    def initialize_logger(self, log_func, get_logger):
+        pass
+
+    def set_gpi_log_level(self, level):
+        pass
+
+    def module(self):
+        """This scheduler as a stand-in for the cocotb.simulator module."""
+        module = types.ModuleType("cocotb.simulator", __doc__)
+        for name, value in globals().items():
+            if name.isupper() and not name.startswith("_"):
+                setattr(module, name, value)
+        module.sim_obj = sim_obj
+        module.sim_callback = sim_callback
+        module.cpp_clock = cpp_clock
+        for name in ("register_timed_callback", "register_rwsynch_callback", "register_readonly_callback",
+                     "register_nextstep_callback", "register_value_change_callback", "get_sim_time",
+                     "get_precision", "get_root_handle", "root_iterate", "package_iterate",
+                     "get_simulator_args", "get_simulator_product", "get_simulator_version", "is_running",
+                     "stop_simulator", "set_sim_event_callback", "clock_create", "initialize_logger",
+                     "set_gpi_log_level"):
+            setattr(module, name, getattr(self, name))
+        return module
+
+    # -- scheduler -------------------------------------------------------------
+
+    def write(self, signal, value, action=DEPOSIT):
+        """Set a signal from the bench or a clock; marks the model dirty."""
+        name = signal.name
+        old = self.values[name]
+        if action == RELEASE:
+            signal.forced = False
+            self._pending.setdefault(name, old)
+            return
+        if action == FORCE:
+            signal.forced = True
+        elif signal.forced:
+            return
+        if old != value:
+            self._pending.setdefault(name, old)
+            self._changed.setdefault(name, old)
+            self.values[name] = value
+
+    def _fire(self, callbacks):
+        for callback in callbacks:
+            if callback.active:
+                self.n_callbacks += 1
+                callback.fire()
+                if self.stopped:
+                    return
+
+    def _evaluate(self):
+        """Run the model on the pending writes and apply what it drives."""
+        pending, self._pending = self._pending, {}
+        values = self.values
+        rose = {name for name, old in pending.items() if values[name] == 1 and old != 1}
+        fell = {name for name, old in pending.items() if values[name] == 0 and old != 0}
+        self.n_evaluations += 1
+        signals = self.signals
+        changed = self._changed
+        for name, value in self.model.evaluate(values, rose, fell).items():
+            value &= signals[name].mask
+            old = values[name]
+            if old != value and not signals[name].forced:
+                changed.setdefault(name, old)
+                values[name] = value
+
+    def _settle(self):
+        """Delta cycles of the current step, until nothing changes."""
+        while not self.stopped:
+            if self._pending:
+                self._evaluate()
+            if self._changed:
+                self.n_deltas += 1
+                changed, self._changed = self._changed, {}
+                self._edges(changed)
+            elif self._readwrite:
+                callbacks, self._readwrite = self._readwrite, []
+                self._fire(callbacks)
+            else:
+                return
+
+    def _edges(self, changed):
+        """Fire the value-change callbacks of the signals changed in a delta."""
+        values = self.values
+        for name, old in changed.items():
+            value = values[name]
+            if value == old or name not in self._watchers:
+                continue
+            due = []
+            waiting = []
+            for callback in self._watchers.pop(name):
+                if not callback.active:
+                    continue
+                if (callback.edge == VALUE_CHANGE or (callback.edge == RISING and value == 1)
+                        or (callback.edge == FALLING and value == 0)):
+                    due.append(callback)
+                else:
+                    waiting.append(callback)
+            # Callbacks registered while these fire wait for the next change
+            if waiting:
+                self._watchers[name] = waiting
+            self._fire(due)
+            if self.stopped:
+                return
+
+    def run(self, start):
+        """
+        Evaluate the initial state, call start() (cocotb's entry points) at
+        time 0 and simulate until stop_simulator() or no more events.
+        """
+        self._evaluate()
+        self._changed = {}
+        start()
+        ended = False
+        while not self.stopped:
+            self._settle()
+            if self.stopped:
+                break
+            callbacks, self._readonly = self._readonly, []
+            self._fire(callbacks)
+            if self.stopped:
+                break
+            if self.vcd is not None:
+                self.vcd.sample(self.now, self.values)
+            while self._timed and not self._timed[0][2].active:
+                heapq.heappop(self._timed)
+            if not self._timed:
+                if ended or self._on_sim_event is None:
+                    break
+                # Out of events: cocotb fails the running test and tears down
+                ended = True
+                self._on_sim_event()
+                continue
+            self.now = self._timed[0][0]
+            self.n_steps += 1
+            callbacks, self._nextstep = self._nextstep, []
+            self._fire(callbacks)
+            due = []
+            while self._timed and self._timed[0][0] == self.now:
+                due.append(heapq.heappop(self._timed)[2])
+            self._fire(due)
+
+
+class VcdWriter:
+    """Value-change dump of the model signals, one sample per time step (WAVES=1)."""
+
+    def __init__(self, path, toplevel, signals):
+        self.file = open(path, "w")
+        self.widths = dict(signals)
+        # VCD identifier codes: one printable character per signal
+        self.ids = {name: chr(33 + n) for n, name in enumerate(signals)}
+        self.last = {}
+        self.file.write(f"$timescale 1ps $end\n$scope module {toplevel} $end\n")
+        for name, width in self.widths.items():
+            self.file.write(f"$var wire {width} {self.ids[name]} {name} $end\n")
+        self.file.write("$upscope $end\n$enddefinitions $end\n")
+
+    def sample(self, now, values):
+        """Write the signals that changed since the last sample, at time now."""
+        changes = []
+        for name, value in values.items():
+            if self.last.get(name) != value:
+                if self.widths[name] == 1:
+                    changes.append(f"{value}{self.ids[name]}\n")
+                else:
+                    changes.append(f"b{value:b} {self.ids[name]}\n")
+        if changes:
+            self.file.write(f"#{now}\n{''.join(changes)}")
+            self.last = dict(values)
+
+    def close(self):
+        self.file.close()
+
+
+def parse_force(spec):
+    """PYSIM_FORCE value "name=value,..." -> {name: int}."""
+    forced = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, value = item.partition("=")
+        forced[name.strip()] = int(value, 0)
+    return forced
+
+
+class _SimulatorFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Import hook that makes `import cocotb.simulator` return the PySim module."""
+
+    def __init__(self, module):
+        self.simulator = module
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != "cocotb.simulator":
+            return None
+        return importlib.machinery.ModuleSpec(fullname, self)
+
+    def create_module(self, spec):
+        return self.simulator
+
+    def exec_module(self, module):
+        pass
+
+
+def main():
+    toplevel = os.environ.get("COCOTB_TOPLEVEL", "").strip()
+    if toplevel not in MODELS:
+        sys.exit(f"PySim: no model for COCOTB_TOPLEVEL={toplevel!r} (models: {', '.join(sorted(MODELS))})")
+    if "cocotb" in sys.modules:
+        sys.exit("PySim: cocotb was imported before the simulator was installed")
+    sim = PySim(MODELS[toplevel]())
+    for name, value in parse_force(os.environ.get("PYSIM_FORCE", "")).items():
+        if name not in sim.signals:
+            sys.exit(f"PySim: PYSIM_FORCE names no signal of {toplevel}: {name!r}")
+        sim.write(sim.signals[name], value & sim.signals[name].mask, FORCE)
+    if os.environ.get("WAVES", "0") == "1":
+        sim.vcd = VcdWriter("dump.vcd", toplevel, sim.model.SIGNALS)
+    sys.meta_path.insert(0, _SimulatorFinder(sim.module()))
+
+    from pygpi.entry import load_entry
+
+    start = time.perf_counter()
+    sim.run(load_entry)
+    wall = time.perf_counter() - start
+    if sim.vcd is not None:
+        # the run may stop within a step, before its ReadOnly sample
+        sim.vcd.sample(sim.now, sim.values)
+        sim.vcd.close()
+    print(f"PySim: {toplevel}, {sim.now / 1000:.0f} ns in {wall:.2f} s wall "
+          f"({sim.n_steps} steps, {sim.n_deltas} deltas, {sim.n_evaluations} model evaluations, "
+          f"{sim.n_callbacks} callbacks)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""
+RunSeed: The seed a bench run was started with.
+
+Inside a running test cocotb 2.x sets cocotb.RANDOM_SEED to a per-test seed
+derived from the test name and the regression seed, so it is not the
+COCOTB_RANDOM_SEED the run was launched with. Coverage DBs, recordings,
+failure windows and timing reports record regression_seed() instead: the
+value that reproduces the run, that cocotb prints in "Test failed with
+COCOTB_RANDOM_SEED=..." and that shards.py and benchmark.py pass.
+"""
+
+import os
+import cocotb
+
+
+def regression_seed():
+    """
+    COCOTB_RANDOM_SEED of the run: the environment variable when set,
+    otherwise the seed cocotb picked for the regression (None outside a
+    cocotb run).
+    """
+    seed = os.environ.get("COCOTB_RANDOM_SEED", "").strip()
+    if seed:
+        try:
+            return int(seed, 0)
+        except ValueError:
+            pass
+    from cocotb import regression
+
+    manager = getattr(regression, "_manager_inst", None)
+    seed = getattr(manager, "_regression_seed", None)
+    if seed is not None:
+        return seed
+    return getattr(cocotb, "RANDOM_SEED", None)
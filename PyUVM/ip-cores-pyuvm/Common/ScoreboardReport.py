@@ -0,0 +1,119 @@
+"""
+ScoreboardReport: Aggregated, rate-limited scoreboard logging.
+
+Logging one INFO line per PASS turns long regressions into gigabytes of
+console output, and building each f-string costs time even when nobody reads
+it. ScoreboardReport keeps pass/fail counters per category instead:
+
+- PASS details are logged at DEBUG with lazy %-style arguments, so they are
+  only formatted when DEBUG is enabled
+- FAIL details are logged for the first SCOREBOARD_FAIL_DETAILS failures,
+  later failures are only counted
+- every SCOREBOARD_SUMMARY_EVERY transactions (0 = off) one INFO summary line
+  is emitted, and summary() prints the per-category table at the end
+
+Categories are any bench-specific value (e.g. sel_i, or an FSM transition);
+they are converted to int where possible so that cocotb values group
+together. None collects results without a category (batch checks).
+
+With SCOREBOARD_RESULTS set to a file name, summary() also writes the totals
+as JSON, so runners (shards.py) can add up the errors of several runs.
+"""
+
+import json
+import logging
+import os
+
+SCOREBOARD_FAIL_DETAILS = int(os.environ.get("SCOREBOARD_FAIL_DETAILS", "10"))
+SCOREBOARD_SUMMARY_EVERY = int(os.environ.get("SCOREBOARD_SUMMARY_EVERY", "10000"))
+SCOREBOARD_RESULTS = os.environ.get("SCOREBOARD_RESULTS", "")
+
+
+def _key(value):
+    if value is None:
+        return None
+    if isinstance(value, tuple):
+        return tuple(_key(v) for v in value)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+class ScoreboardReport:
+    """
+    Pass/fail counters and throttled detail logging for one scoreboard.
+
+    Attributes:
+        n_passed, n_failed: Totals over all categories
+        counts: Dict category -> [passed, failed]
+    """
+
+    def __init__(self, logger, category_label="category",
+                 fail_details=SCOREBOARD_FAIL_DETAILS, summary_every=SCOREBOARD_SUMMARY_EVERY):
+        """
+        Args:
+            logger: Scoreboard logger
+            category_label: Name printed before each category value
+            fail_details: Failures logged with full detail
+            summary_every: Transactions between summary lines (0 = off)
+        """
+        self.logger = logger
+        self.category_label = category_label
+        self.fail_details = fail_details
+        self.summary_every = summary_every
+        self.counts = {}
+        self.n_passed = 0
+        self.n_failed = 0
+        self._next_summary = summary_every
+
+    def _count(self, category, index, n=1):
+        counts = self.counts.get(category)
+        if counts is None:
+            counts = self.counts[category] = [0, 0]
+        counts[index] += n
+        if self.summary_every and self.n_passed + self.n_failed >= self._next_summary:
+            self._next_summary += self.summary_every
+            self.logger.info(
+                "Scoreboard: %d transactions, %d passed, %d failed",
+                self.n_passed + self.n_failed, self.n_passed, self.n_failed)
+
+    def passed(self, category, msg, *args):
+        """Count a PASS; msg % args is only formatted if DEBUG is enabled."""
+        self.n_passed += 1
+        self._count(_key(category), 0)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(msg, *args)
+
+    def passed_many(self, category, n):
+        """Count n PASS results at once (batch checks)."""
+        self.n_passed += n
+        self._count(_key(category), 0, n)
+
+    def failed(self, category, msg, *args):
+        """Count a FAIL; full detail only for the first fail_details failures."""
+        self.n_failed += 1
+        self._count(_key(category), 1)
+        if self.n_failed <= self.fail_details:
+            self.logger.error(msg, *args)
+            if self.n_failed == self.fail_details:
+                self.logger.warning(
+                    "Scoreboard: further FAIL details suppressed (SCOREBOARD_FAIL_DETAILS=%d)",
+                    self.fail_details)
+
+    def summary(self):
+        """Log the final per-category table (and write SCOREBOARD_RESULTS)."""
+        self.logger.info(
+            "Scoreboard summary: %d transactions, %d passed, %d failed",
+            self.n_passed + self.n_failed, self.n_passed, self.n_failed)
+        for category in sorted(self.counts, key=str):
+            passed, failed = self.counts[category]
+            if category is None:
+                name = "batch checks"
+            else:
+                name = f"{self.category_label}={category}"
+            self.logger.info("  %s: %d passed, %d failed", name, passed, failed)
+        if SCOREBOARD_RESULTS:
+            with open(SCOREBOARD_RESULTS, "w") as f:
+                json.dump({"passed": self.n_passed, "failed": self.n_failed,
+                           "categories": {str(k): v for k, v in self.counts.items()}}, f)
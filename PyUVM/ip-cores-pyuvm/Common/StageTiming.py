@@ -0,0 +1,194 @@
+"""
+StageTiming: Per-stage wall time of the agent pipeline.
+
+With STAGE_TIMING=1 every stage a transaction goes through records how long
+it took per transaction, keyed by component path:
+
+    sequence      creating and randomizing the item (MySequence)
+    sequencer     start_item(): handing the item to the driver (MySequencer)
+    driver        send_pkt() and item_done() (MyDriver)
+    driver_task   applying the packet to the DUT handles (Wrapper)
+    monitor_task  sampling the DUT handles into the result tuple (Wrapper)
+    monitor       turning the result into a packet (MyMonitor)
+    scoreboard    checking the packet (MyScoreboard)
+    coverage      sampling the packet (MyCoverage)
+
+Each stage brackets its own per-transaction code. Only sequencer and
+driver span awaits, so they also include waiting: the handoff through the
+pyuvm sequencer, and the BFM back-pressure (ack, full mon_queue),
+during which the other stages run. The table marks them with '*' and leaves
+them out of the unattributed time: the wall time no other stage claims
+(cocotb scheduling, pyuvm TLM, the simulator).
+
+MyTest.report_phase logs a table (calls, total, mean and p50/p90/p99/max
+latency per stage) and writes the same numbers to STAGE_TIMING_FILE (JSON).
+Latencies go into a log-scale histogram (5 significant bits, ~3%
+resolution), so memory does not grow with the run length.
+
+Call sites check the TIMING flag before touching a timer, so a run without
+STAGE_TIMING costs one global lookup per stage and transaction:
+
+    if TIMING:
+        self.timer.start()
+    ...
+    if TIMING:
+        self.timer.stop()
+"""
+
+import json
+import os
+import time
+
+from RunSeed import regression_seed
+
+STAGE_TIMING = os.environ.get("STAGE_TIMING", "0") == "1"
+STAGE_TIMING_FILE = os.environ.get("STAGE_TIMING_FILE", "stage_timing.json")
+
+# Call sites time their stage only when this is set
+TIMING = STAGE_TIMING
+
+# Table order: the order in which a transaction goes through the stages
+ROLES = ("sequence", "sequencer", "driver", "driver_task", "monitor_task", "monitor",
+         "scoreboard", "coverage")
+# Stages spanning awaits, which overlap the others
+WAITING = ("sequencer", "driver")
+
+_BITS = 5
+_timers = {}
+_start_ns = None
+
+
+class StageTimer:
+    """
+    Call count, total, maximum and latency histogram of one stage.
+
+    Attributes:
+        path: Component path (or Wrapper.<task> for the BFM tasks)
+        role: One of ROLES
+        count: Transactions timed
+        total: Sum of the latencies, in ns
+    """
+
+    __slots__ = ("path", "role", "count", "total", "max", "hist", "t0")
+
+    def __init__(self, path, role):
+        self.path = path
+        self.role = role
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.hist = {}
+        self.t0 = 0
+
+    def start(self):
+        """Start timing one transaction."""
+        self.t0 = time.perf_counter_ns()
+
+    def stop(self):
+        """Record the time since start()."""
+        self.add(time.perf_counter_ns() - self.t0)
+
+    def add(self, ns):
+        """Record one latency, in ns."""
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+        # Keep the top _BITS significant bits
+        shift = ns.bit_length() - _BITS
+        if shift > 0:
+            ns = ns >> shift << shift
+        self.hist[ns] = self.hist.get(ns, 0) + 1
+
+    def percentile(self, q):
+        """Latency (ns, histogram resolution) below which q% of the calls fall."""
+        if not self.count:
+            return 0
+        rank = q / 100 * self.count
+        seen = 0
+        for ns in sorted(self.hist):
+            seen += self.hist[ns]
+            if seen >= rank:
+                return ns
+        return self.max
+
+    def summary(self):
+        """Dict of the statistics, in seconds and microseconds."""
+        return {
+            "role": self.role,
+            "path": self.path,
+            "count": self.count,
+            "total_s": self.total / 1e9,
+            "mean_us": self.total / self.count / 1e3 if self.count else 0.0,
+            "p50_us": self.percentile(50) / 1e3,
+            "p90_us": self.percentile(90) / 1e3,
+            "p99_us": self.percentile(99) / 1e3,
+            "max_us": self.max / 1e3,
+        }
+
+
+def stage_timer(path, role):
+    """
+    The timer of a stage; components sharing a path share the timer.
+
+    Args:
+        path: Component path, e.g. self.get_full_name()
+        role: One of ROLES
+    """
+    timer = _timers.get(path)
+    if timer is None:
+        if role not in ROLES:
+            raise ValueError(f"Unknown stage role {role!r} (roles: {', '.join(ROLES)})")
+        timer = _timers[path] = StageTimer(path, role)
+    return timer
+
+
+def start_timing():
+    """Mark the start of the timed run (call in MyTest.build_phase)."""
+    global _start_ns
+    if TIMING:
+        _start_ns = time.perf_counter_ns()
+
+
+def report_timing(logger, path=STAGE_TIMING_FILE):
+    """
+    Log the stage table and write it to path (no-op without STAGE_TIMING).
+
+    Returns:
+        The report dict, or None when timing is off
+    """
+    if not TIMING or _start_ns is None:
+        return None
+    wall = (time.perf_counter_ns() - _start_ns) / 1e9
+    timers = sorted(_timers.values(), key=lambda t: ROLES.index(t.role))
+    stages = [t.summary() for t in timers if t.count]
+    attributed = sum(s["total_s"] for s in stages if s["role"] not in WAITING)
+    report = {
+        "bench": os.path.basename(os.environ.get("PWD", os.getcwd())),
+        "seed": regression_seed(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "wall_s": wall,
+        "unattributed_s": max(wall - attributed, 0.0),
+        "stages": stages,
+    }
+
+    width = max([len(s["path"]) + 1 for s in stages] + [len("Unattributed")])
+    lines = [f"Stage timing over {wall:.3f} s wall:",
+             f"  {'Stage':<{width}}  {'Calls':>8}  {'Total ms':>9}  {'Share':>6}  {'Mean us':>8}  "
+             f"{'p50 us':>8}  {'p90 us':>8}  {'p99 us':>8}  {'Max us':>9}"]
+    for s in stages:
+        share = 100 * s["total_s"] / wall if wall else 0.0
+        lines.append(
+            f"  {s['path'] + ('*' if s['role'] in WAITING else ''):<{width}}  {s['count']:8}  {1e3 * s['total_s']:9.1f}  {share:5.1f}%  "
+            f"{s['mean_us']:8.2f}  {s['p50_us']:8.2f}  {s['p90_us']:8.2f}  {s['p99_us']:8.2f}  "
+            f"{s['max_us']:9.1f}")
+    rest = report["unattributed_s"]
+    lines.append(f"  {'Unattributed':<{width}}  {'':8}  {1e3 * rest:9.1f}  "
+                 f"{100 * rest / wall if wall else 0.0:5.1f}%")
+    lines.append("  * includes waiting on the other stages")
+    logger.info("\n".join(lines))
+
+    with open(path, "w") as f:
+        json.dump(report, f, indent=1)
+    logger.info(f"Stage timing written to {path}")
+    return report
@@ -0,0 +1,66 @@
+"""
+Testbench: UVM components shared by every PyUVM bench.
+
+The agent, environment, scoreboard, coverage subscriber, stimulus sequence
+and top-level test are the same in every bench, so they live here once. A
+bench directory only declares what makes it different, under fixed module
+names:
+
+    Pkt.py                Pkt and SlottedPkt (fields, inputs, randomize())
+    GoldenModel.py        reference model (RESET for FSM benches)
+    <Bench>Covergroup.py  coverage model
+    MyCoverage.py         BenchCoverage naming the covergroup and sampled fields
+    MyScoreboard.py       BenchScoreboard naming the result categories
+                          (FSM benches: and the STATE field)
+    <Bench>Wrapper.py     GenericBFM signal map (INPUTS, OUTPUTS, RESULT, CLOCK)
+    MyTest.py             the cocotb test module: a BenchTest naming the wrapper
+
+    @pyuvm.test()
+    class MyTest(BenchTest):
+        WRAPPER = MuxWrapper
+
+The shared components import the bench modules by these names when the
+UVM phases need them, not when the package is imported.
+
+Imports are lazy: `from Testbench import MyEnv` loads only the submodule
+that defines MyEnv, and the bench modules, the covergroup (pyvsc), the
+truth table and the optional modules (HoleDirected, TransitionTour,
+WaveCapture, BatchCheck, ...) are imported in build_phase or in the
+sequence mode that uses them. Only the small helpers every run uses
+(Transaction, BoundedQueue, StageTiming, PhaseProfile, ScoreboardReport)
+are imported at module level. A simulator launch then pays for the modules
+its configuration runs, and little of that before cocotb has collected the
+test.
+"""
+
+import importlib
+
+# Exported name -> submodule. Submodules are lowercase so that importing one
+# never shadows the class of the same name on the package.
+_EXPORTS = {
+    "MySequencer": "agent",
+    "MyDriver": "agent",
+    "MyMonitor": "agent",
+    "MyAgent": "agent",
+    "MyEnv": "env",
+    "BenchScoreboard": "scoreboard",
+    "BenchCoverage": "coverage",
+    "MySequence": "sequence",
+    "BenchTest": "test",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the submodule that defines name on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,149 @@
+"""
+Agent components: sequencer, driver, monitor and the agent that holds them.
+
+The driver hands items to the BFM (GenericBFM.send_pkt); the monitor turns
+each BFM result tuple into a Pkt, filling the wrapper's RESULT fields (or
+INPUTS + OUTPUTS) in order, and publishes it on its analysis port.
+"""
+
+from pyuvm import ConfigDB, uvm_agent, uvm_analysis_port, uvm_driver, uvm_monitor, uvm_sequencer
+from Transaction import item_factory
+from BoundedQueue import wait_for_subscribers
+from StageTiming import TIMING, stage_timer
+
+
+class MySequencer(uvm_sequencer):
+    """
+    UVM sequencer: mediates between sequence and driver.
+
+    Operation:
+    - Receives items from sequences via sequence.start(sequencer)
+    - Delivers items to driver via driver.seq_item_port.get_next_item()
+    - Maintains proper handshaking for ordered, synchronized delivery
+    """
+
+
+class MyDriver(uvm_driver):
+    """
+    UVM driver: applies transactions to the DUT.
+
+    Operation:
+    - Waits for transactions from sequencer
+    - Sends each transaction to BFM for DUT input application
+    - Signals completion before requesting next transaction
+    """
+
+    def build_phase(self):
+        """
+        Build Phase: Retrieve DUT interface (BFM) from ConfigDB.
+
+        The BFM handles low-level DUT signal manipulation and timing.
+        """
+        self.bfm = ConfigDB().get(self, "", "BUS_BFM")
+        self.timer = stage_timer(self.get_full_name(), "driver")
+
+    async def run_phase(self):
+        """
+        Run Phase: Drive transactions to DUT as they arrive.
+
+        Loop:
+        1. Wait for transaction from sequencer
+        2. Send to BFM for DUT input application
+        3. Signal completion and request next
+        """
+        while True:
+            packet = await self.seq_item_port.get_next_item()
+            if TIMING:
+                self.timer.start()
+            await self.bfm.send_pkt(packet)
+            self.seq_item_port.item_done()
+            if TIMING:
+                self.timer.stop()
+
+
+class MyMonitor(uvm_monitor):
+    """
+    UVM monitor: observes DUT outputs and publishes transactions.
+
+    Operation:
+    - Waits for results from BFM (Bus Functional Model)
+    - Converts raw results into Pkt objects (bfm.fields names the slots)
+    - Writes packets to analysis port for verification/coverage
+    """
+
+    def build_phase(self):
+        """
+        Build Phase: Set up analysis port and retrieve BFM handle.
+
+        Analysis port enables broadcasting observed transactions to
+        multiple subscribers (scoreboard, coverage).
+        """
+        from Pkt import Pkt, SlottedPkt
+
+        self.ap = uvm_analysis_port("ap", self)
+        self.bfm = ConfigDB().get(self, "", "BUS_BFM")
+        self.new_packet = item_factory(lambda: Pkt("monitored_packet"), SlottedPkt)
+        self.timer = stage_timer(self.get_full_name(), "monitor")
+
+    async def run_phase(self):
+        """
+        Run Phase: Observe DUT outputs and publish as packets.
+
+        Continuously:
+        0. Wait for room in bounded subscriber FIFOs (back-pressure)
+        1. Wait for result from BFM
+        2. Convert result tuple into Pkt object
+        3. Write packet to analysis port
+        """
+        fields = self.bfm.fields
+        while True:
+            await wait_for_subscribers(self.ap)
+            result = await self.bfm.get_result()
+            if TIMING:
+                self.timer.start()
+            self.logger.debug("MONITORED %s", result)
+            packet = self.new_packet()
+            for name, value in zip(fields, result):
+                setattr(packet, name, value)
+            if TIMING:
+                self.timer.stop()
+            self.ap.write(packet)
+
+
+class MyAgent(uvm_agent):
+    """
+    UVM agent: coordinates sequencer, driver, and monitor.
+
+    Operation:
+    - Creates sequencer (transaction coordination)
+    - Creates driver (DUT input actuation) if agent is active
+    - Creates monitor (DUT output observation) always
+    - Connects driver to sequencer for transaction delivery
+    """
+
+    def __init__(self, name, parent, is_active=True):
+        super().__init__(name, parent)
+        self.sequencer = None
+        self.is_active = is_active
+
+    def build_phase(self):
+        """
+        Build Phase: Instantiate sequencer, driver (if active), and monitor.
+
+        Creates the core agent components. Active mode includes driver for
+        stimulus generation; passive mode only observes via monitor.
+        """
+        self.sequencer = MySequencer.create("sequencer", self)
+        if self.is_active:
+            self.driver = MyDriver.create("driver", self)
+        self.monitor = MyMonitor.create("monitor", self)
+
+    def connect_phase(self):
+        """
+        Connect Phase: Wire driver to sequencer if agent is active.
+
+        Establishes TLM connection so driver can retrieve transactions
+        from sequencer via get_next_item() calls.
+        """
+        if self.is_active:
+            self.driver.seq_item_port.connect(self.sequencer.seq_item_export)
@@ -0,0 +1,132 @@
+"""
+BenchCoverage: Coverage subscriber shared by the benches.
+
+Samples every monitored Pkt into the bench's covergroup and checks the
+coverage goal at the end of the test. Each bench's MyCoverage.py
+subclasses it and names its covergroup and the Pkt fields it samples:
+
+    class MyCoverage(BenchCoverage):
+        COVERGROUP = "MuxCovergroup"
+        sample_fields = ("x0_i", "x1_i", "x2_i", "x3_i", "sel_i")
+
+The FSM benches sample a derived transition code instead, by overriding
+sample().
+"""
+
+import importlib
+from operator import attrgetter
+from pyuvm import uvm_subscriber
+from CoverageClosure import CoverageClosure
+from StageTiming import TIMING, stage_timer
+
+
+class BenchCoverage(uvm_subscriber):
+    """
+    UVM coverage subscriber: collects functional coverage metrics.
+
+    Operation:
+    - Receives transactions via analysis export (connected to monitor)
+    - Samples each transaction into covergroup
+    - Tracks coverage percentage for stimulus termination condition
+    - Validates 100% coverage at end of test
+
+    Attributes:
+        COVERGROUP: Covergroup class, defined in the bench module of the
+            same name
+        sample_fields: Pkt attribute behind each cg.sample() argument
+            (None = derived value)
+        PRINT_REPORT: Print the covergroup report once the goal is met
+    """
+
+    COVERGROUP = None
+    sample_fields = ()
+    PRINT_REPORT = False
+
+    def build_phase(self):
+        """
+        Build Phase: Instantiate covergroup.
+        """
+        # Deferred: with COVERAGE_ENGINE=pyvsc this imports vsc
+        covergroup = getattr(importlib.import_module(self.COVERGROUP), self.COVERGROUP)
+
+        self.cg = covergroup()
+        self.closure = CoverageClosure(self.cg)
+        self.goal_reached = self.closure.goal_reached
+        self.timer = stage_timer(self.get_full_name(), "coverage")
+        if None not in self.sample_fields:
+            fields = attrgetter(*self.sample_fields)
+            if len(self.sample_fields) == 1:
+                self.sample_values = lambda pkt: (fields(pkt),)
+            else:
+                self.sample_values = fields
+
+    def write(self, pkt):
+        """
+        Called when monitor publishes a transaction.
+
+        Samples the packet into covergroup to update coverage metrics.
+        """
+        if TIMING:
+            self.timer.start()
+        self.sample(pkt)
+        self.closure.update()
+        if TIMING:
+            self.timer.stop()
+
+    def sample(self, pkt):
+        """Sample the sample_fields of pkt into the covergroup."""
+        self.cg.sample(*self.sample_values(pkt))
+
+    def report_phase(self):
+        """
+        Report Phase: Check if coverage goal is met.
+        - Logs PASS if 100% coverage achieved
+        - Logs FAIL and the detailed coverage report if coverage incomplete
+        """
+        cg_percent = self.cg.get_coverage()
+        if self.closure.replay:
+            self.logger.info(f"Failure window replay: coverage {cg_percent:.2f}% (goal not checked)")
+            return
+        self.closure.save(force=True)
+        if self.closure.fixed_length:
+            self.logger.info(
+                f"Fixed-length run: coverage {cg_percent:.2f}% after {self.closure.n_samples} samples "
+                f"(goal not checked)")
+            return
+        if self.closure.sharded:
+            self.logger.info(
+                f"Shard coverage {cg_percent:.2f}% after {self.closure.n_samples} samples "
+                f"(shards.py checks the goal on the merged coverage)")
+            return
+
+        if cg_percent < 100.0:
+            self.logger.error(
+                f"Coverage FAIL: {100 - cg_percent:.2f}% uncovered."
+            )
+            self.get_report()
+            assert False
+        else:
+            self.logger.info(f"Covered all operations (100.00%)")
+            if self.PRINT_REPORT:
+                self.cg.report()
+
+    def get_my_coverage(self):
+        """
+        Return current coverage percentage.
+        """
+        return self.cg.get_coverage()
+
+    def on_first_hit(self, callback):
+        """
+        Register callback(item_name, bin_name) for the first hit of each bin
+        (either coverage engine).
+        """
+        self.closure.on_first_hit(callback)
+
+    def get_report(self):
+        """
+        Print detailed coverage report.
+        """
+        from CoverageEngine import get_coverage_report
+
+        print(get_coverage_report(details=True))
@@ -1,22 +1,18 @@
-from pyuvm import *
-from MyAgent import MyAgent
-from MyScoreboard import MyScoreboard
-from MyCoverage import MyCoverage
-
-
-
 """
-MyEnv: UVM environment for 4-bit Adder verification.
+MyEnv: UVM environment shared by the benches.
 
-Instantiates and connects all verification components (agent, scoreboard,
-coverage) into a cohesive testbench architecture. Serves as the container
-for the entire verification infrastructure.
+Instantiates and connects the agent with the bench's scoreboard and coverage
+collector (MyScoreboard.py and MyCoverage.py of the bench directory).
 """
 
+from pyuvm import ConfigDB, uvm_env, uvm_root
+from .agent import MyAgent
+
+
 class MyEnv(uvm_env):
     """
     UVM environment: instantiates and connects testbench components.
-    
+
     Operation:
     - Creates agent (sequencer, driver, monitor coordination)
     - Creates scoreboard (reference model verification)
@@ -25,16 +21,16 @@ class MyEnv(uvm_env):
     - Connects monitor outputs to scoreboard and coverage inputs
     """
 
-    def __init__(self, name, parent):
-        super().__init__(name, parent)
-    
     def build_phase(self):
         """
         Build Phase: Instantiate all testbench components.
-        
+
         Creates agent, scoreboard, coverage and registers key handles
         in ConfigDB for access by sequences and other components.
         """
+        from MyScoreboard import MyScoreboard
+        from MyCoverage import MyCoverage
+
         self.agent = MyAgent.create("agent", self)
         self.scoreboard = MyScoreboard.create("scoreboard", self)
         self.coverage = MyCoverage.create("coverage", self)
@@ -44,7 +40,7 @@ class MyEnv(uvm_env):
     def connect_phase(self):
         """
         Connect Phase: Establish dataflow between components.
-        
+
         Connects monitor analysis port to scoreboard and coverage,
         ensuring observed transactions reach verification components.
         """
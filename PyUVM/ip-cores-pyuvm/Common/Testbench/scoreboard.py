@@ -0,0 +1,240 @@
+"""
+BenchScoreboard: Scoreboard shared by the benches.
+
+Checks every monitored Pkt against the bench's GoldenModel, through the
+TruthTable compiled from GoldenModel.predict() (SCOREBOARD=table, default),
+the golden model itself (SCOREBOARD=golden) or NumPy batches
+(SCOREBOARD=batch). Each bench's MyScoreboard.py subclasses it and names
+the Pkt fields its results are counted by:
+
+    class MyScoreboard(BenchScoreboard):
+        CATEGORY = ("sel_i",)
+
+The FSM benches (Mealy, Moore) also name the Pkt field holding the state
+before the clock edge, the first argument of their GoldenModel.predict().
+The truth table does not cover the state, so they always check through
+GoldenModel.check():
+
+    class MyScoreboard(BenchScoreboard):
+        CATEGORY = ("current_state", "next_state")
+        STATE = "current_state"
+
+The PASS/FAIL messages list the STATE field, the Pkt inputs and the
+GoldenModel.OUTPUTS fields.
+"""
+
+import os
+from operator import attrgetter
+import cocotb
+from cocotb.triggers import Timer
+from pyuvm import uvm_scoreboard
+from ScoreboardReport import ScoreboardReport
+from Transaction import POOLED
+from BoundedQueue import BoundedAnalysisFifo, packet_codec
+from StageTiming import TIMING, stage_timer
+
+SCOREBOARD = os.environ.get("SCOREBOARD", "table").lower()
+SCOREBOARD_DUMP = os.environ.get("SCOREBOARD_DUMP", "")
+SCOREBOARD_BATCH = int(os.environ.get("SCOREBOARD_BATCH", "4096"))
+SCOREBOARD_FLUSH_NS = int(os.environ.get("SCOREBOARD_FLUSH_NS", "0"))
+
+
+class BenchScoreboard(uvm_scoreboard):
+    """
+    UVM scoreboard: verifies DUT correctness via golden model comparison.
+
+    Operation:
+    - Receives transactions from monitor via analysis FIFO
+    - Runs golden model to compute expected result (SCOREBOARD=golden),
+      or looks it up in the truth table compiled at build_phase
+      (SCOREBOARD=table, default)
+    - SCOREBOARD=batch buffers transactions and checks them in NumPy
+      batches (BatchChecker)
+    - Compares expected vs actual outputs
+    - Counts PASS/FAIL per category (ScoreboardReport): PASS detail at
+      DEBUG, FAIL detail for the first failures, periodic summaries
+    - With WAVE_CAPTURE=fail, keeps the last transactions in a
+      FailureWindow and saves it on the first FAIL
+
+    Attributes:
+        CATEGORY: Pkt fields the results are counted by
+        STATE: Pkt field holding the FSM state before the clock edge
+            (None for combinational benches)
+    """
+
+    CATEGORY = ()
+    STATE = None
+
+    num_errors = 0
+
+    def build_phase(self):
+        """
+        Build Phase: Instantiate verification infrastructure.
+
+        Creates FIFO for async transaction reception (BoundedAnalysisFifo,
+        sized by ANALYSIS_FIFO_DEPTH) and golden model for reference
+        output computation. Unless the bench has a STATE, the golden model
+        is compiled into a TruthTable over every Pkt input vector;
+        SCOREBOARD_DUMP writes that table as a CSV file of expected
+        responses.
+        """
+        from GoldenModel import GoldenModel
+        from Pkt import Pkt, SlottedPkt
+        from WaveCapture import CAPTURE, FailureWindow
+        from TruthTable import compile_table
+
+        mode = SCOREBOARD if self.STATE is None else "golden"
+        self.fifo = BoundedAnalysisFifo("fifo", self, codec=packet_codec(SlottedPkt))
+        self.analysis_export = self.fifo.analysis_export
+        self.golden_model = GoldenModel()
+        self.results = ScoreboardReport(self.logger, ",".join(self.CATEGORY))
+        self.category = attrgetter(*self.CATEGORY)
+        self.capture = CAPTURE
+        self.window = FailureWindow([name for name, _ in SlottedPkt.inputs], self.STATE,
+                                    history=SCOREBOARD_BATCH if mode == "batch" else 0)
+        self.timer = stage_timer(self.get_full_name(), "scoreboard")
+
+        self.inputs = [name for name, _ in Pkt.inputs]
+        if self.STATE is not None:
+            self.inputs.insert(0, self.STATE)
+        self.outputs = GoldenModel.OUTPUTS
+        self.observed = attrgetter(*self.inputs, *self.outputs)
+        inputs = ", ".join(f"{name}=%s" for name in self.inputs)
+        outputs = ", ".join(f"{name}=%s" for name in self.outputs)
+        self.pass_msg = f"PASS: {inputs} -> {outputs}"
+        self.fail_msg = f"FAIL: {inputs}. EXPECTED {outputs}. RECEIVED {outputs}"
+
+        self.table = None
+        if mode in ("table", "batch") or SCOREBOARD_DUMP and self.STATE is None:
+            self.table = compile_table(Pkt.inputs, self.golden_model)
+        if self.table is not None and SCOREBOARD_DUMP:
+            self.table.dump(SCOREBOARD_DUMP)
+            self.logger.info(f"Expected responses for {len(self.table)} input vectors written to {SCOREBOARD_DUMP}")
+
+        self.batch = None
+        if mode == "batch":
+            from BatchCheck import BatchChecker
+            self.batch = BatchChecker(self.table, self.results, SCOREBOARD_BATCH,
+                                      self.window if CAPTURE else None, self.CATEGORY)
+        if mode != "table":
+            self.table = None
+
+    def check(self, pkt):
+        """
+        Check one transaction: one table lookup and compare, or the golden
+        model when no table is compiled.
+        """
+        if self.table is None:
+            return self.golden_model.check(pkt)
+        return self.table.check(pkt)
+
+    def expected(self, pkt):
+        """
+        GoldenModel.predict() of the state and inputs of pkt, for the FAIL
+        message ("X" for each output if an input is not a 0/1 value).
+        """
+        try:
+            return self.golden_model.predict(**{name: int(getattr(pkt, name)) for name in self.inputs})
+        except ValueError:
+            return ("X",) * len(self.outputs)
+
+    async def run_phase(self):
+        """
+        Run Phase: Verify transactions as they arrive.
+
+        Continuously:
+        1. Wait for transaction from monitor FIFO
+        2. Run golden model with same inputs
+        3. Compare outputs: PASS if match, FAIL otherwise
+        """
+        self.logger.info("Scoreboard starting checks...")
+        if self.batch is not None:
+            await self.batch_run()
+            return
+        while True:
+            pkt = await self.fifo.get()
+            if TIMING:
+                self.timer.start()
+            if self.capture:
+                self.window.record(pkt)
+
+            if self.check(pkt):
+                self.results.passed(self.category(pkt), self.pass_msg, *self.observed(pkt))
+            else:
+                self.num_errors += 1
+                if self.capture:
+                    self.window.failed(self.logger)
+                self.results.failed(
+                    self.category(pkt), self.fail_msg, *(getattr(pkt, name) for name in self.inputs),
+                    *self.expected(pkt), *(getattr(pkt, name) for name in self.outputs))
+            if POOLED:
+                pkt.release()
+            if TIMING:
+                self.timer.stop()
+
+    async def batch_run(self):
+        """
+        Batch mode: buffer every transaction in the BatchChecker, which
+        checks a batch when it holds SCOREBOARD_BATCH transactions or,
+        with SCOREBOARD_FLUSH_NS set, periodically in sim time.
+        """
+        if SCOREBOARD_FLUSH_NS > 0:
+            cocotb.start_soon(self.flush_timer())
+        while True:
+            pkt = await self.fifo.get()
+            if TIMING:
+                self.timer.start()
+            self.num_errors += self.batch.add(pkt)
+            if POOLED:
+                pkt.release()
+            if TIMING:
+                self.timer.stop()
+
+    async def flush_timer(self):
+        """Flush the batch every SCOREBOARD_FLUSH_NS of sim time."""
+        while True:
+            await Timer(SCOREBOARD_FLUSH_NS, unit="ns")
+            self.num_errors += self.batch.flush()
+
+    def extract_phase(self):
+        """
+        Extract Phase: End-of-test flush in batch mode, including packets
+        still waiting in the FIFO, so check_phase sees every error.
+        """
+        if self.batch is None:
+            return
+        while True:
+            success, pkt = self.fifo.try_get()
+            if not success:
+                break
+            self.num_errors += self.batch.add(pkt)
+            if POOLED:
+                pkt.release()
+        self.num_errors += self.batch.flush()
+        self.logger.info(f"Batch checks: {self.batch.n_checked} transactions, {self.batch.n_errors} mismatches")
+
+    def check_phase(self):
+        """
+        Check Phase: Report final test status.
+        - Logs PASS if no errors detected
+        - Logs FAIL with error count if errors occurred
+        """
+        self.results.summary()
+        if self.num_errors > 0:
+            self.logger.fatal(f"TEST FAILED: Scoreboard found {self.num_errors} errors.")
+        else:
+            self.logger.info("TEST PASS: All transactions were correct.")
+
+    def final_phase(self):
+        """
+        Final Phase: Fail the cocotb test if the scoreboard found errors.
+        Raised after report_phase, so a failing run still saves its
+        coverage, closes its recording and logs its reports.
+        """
+        assert self.num_errors == 0, f"Scoreboard found {self.num_errors} errors"
+
+    def report_phase(self):
+        """
+        Report Phase: Log analysis FIFO high-water mark and overflow counters.
+        """
+        self.fifo.report(self.logger)
@@ -0,0 +1,246 @@
+"""
+MySequence: Coverage-driven stimulus generator shared by the benches.
+
+Generates test vectors of the bench's Pkt until functional coverage reaches
+100%, or in the stimulus mode the SEQUENCE make variable selects. Each mode
+imports its helper module (HoleDirected, Exhaustive, TransitionTour,
+WaveCapture, TransactionRecorder) only when it runs.
+"""
+
+import os
+from cocotb.triggers import Timer
+from pyuvm import ConfigDB, uvm_root, uvm_sequence
+from Transaction import item_factory
+from StageTiming import TIMING, stage_timer
+
+SEQUENCE = os.environ.get("SEQUENCE", "random").lower()
+EXHAUSTIVE_ORDER = os.environ.get("EXHAUSTIVE_ORDER", "lexicographic").lower()
+EXHAUSTIVE_MAX = int(os.environ.get("EXHAUSTIVE_MAX", "4096"))
+SEQUENCE_ITEMS = int(os.environ.get("SEQUENCE_ITEMS", "0"))
+
+
+class MySequence(uvm_sequence):
+    """
+    Coverage-driven sequence: generates transactions until coverage goal is met.
+
+    Operation:
+    - Retrieves coverage handle from ConfigDB to monitor progress
+    - Loop: randomize packet, send to sequencer until coverage = 100%
+    - Ensures all functional scenarios are exercised
+    """
+
+    def __init__(self, name):
+        from Pkt import Pkt, SlottedPkt
+
+        super().__init__(name)
+        self.cov_handle = ConfigDB().get(uvm_root(), "", "COV_HANDLE")
+        self.pkt_type = Pkt
+        # Pkt, or SlottedPkt with TRANSACTION=slotted (Transaction)
+        self.new_item = item_factory(lambda: Pkt.create("packet"), SlottedPkt)
+
+    async def body(self):
+        """
+        Main stimulus generation: dispatch on the SEQUENCE make variable.
+
+        - random (default) / holes: coverage-driven loop (random_body)
+        - exhaustive: every input vector exactly once (exhaustive_body),
+          combinational benches only; falls back to random when the space
+          exceeds EXHAUSTIVE_MAX
+        - tour: minimal walk over every FSM transition (tour_body), FSM
+          benches only
+        - window: replay a failure window (window_body)
+        - replay: drive the inputs of a recording (replay_body)
+
+        With STAGE_TIMING=1, item creation is timed as the sequence
+        stage and start_item() as the sequencer handoff (StageTiming).
+        """
+        path = self.sequencer.get_full_name()
+        self.item_timer = stage_timer(f"{path}.{self.get_name()}", "sequence")
+        self.handoff_timer = stage_timer(path, "sequencer")
+        if SEQUENCE == "window":
+            await self.window_body()
+            return
+        if SEQUENCE == "replay":
+            await self.replay_body()
+            return
+        if SEQUENCE == "tour":
+            if self.fsm_reset() is not None:
+                await self.tour_body()
+                return
+            uvm_root().logger.warning(
+                "SEQUENCE=tour needs an FSM bench (GoldenModel.RESET); running random")
+        if SEQUENCE == "exhaustive" and self.fsm_reset() is not None:
+            uvm_root().logger.warning(
+                "SEQUENCE=exhaustive enumerates inputs regardless of the FSM state and "
+                "cannot close transition coverage; running random (use SEQUENCE=tour)")
+        elif SEQUENCE == "exhaustive":
+            from Exhaustive import space_size
+
+            if space_size(self.pkt_type.inputs) <= EXHAUSTIVE_MAX:
+                await self.exhaustive_body()
+                return
+            uvm_root().logger.warning(
+                f"Input space of {space_size(self.pkt_type.inputs)} vectors exceeds "
+                f"EXHAUSTIVE_MAX={EXHAUSTIVE_MAX}; running random")
+        await self.random_body()
+
+    @staticmethod
+    def fsm_reset():
+        """
+        Reset input vector of an FSM bench (GoldenModel.RESET), or None for
+        a combinational bench.
+        """
+        from GoldenModel import GoldenModel
+
+        return getattr(GoldenModel, "RESET", None)
+
+    async def random_body(self):
+        """
+        Coverage-driven stimulus loop.
+
+        Generates random test vectors until coverage goal is met:
+        1. Check the coverage goal_reached event (set by MyCoverage.write)
+        2. Create and randomize new packet
+        3. Send packet to sequencer for driver application
+        4. Repeat until 100% coverage achieved
+
+        SEQUENCE=holes steers each packet into an uncovered bin or
+        cross cell (HoleDirector) before it is sent.
+
+        With SEQUENCE_ITEMS set, exactly that many packets are sent,
+        whether coverage closes earlier or later (fixed-length runs for
+        benchmark.py); MyCoverage then reports the coverage without
+        checking the goal.
+        """
+        director = None
+        if SEQUENCE == "holes":
+            from HoleDirected import HoleDirector
+
+            director = HoleDirector(self.cov_handle.cg, self.cov_handle.sample_fields)
+        n_items = 0
+        start = self.cov_handle.closure.n_samples
+
+        while (n_items < SEQUENCE_ITEMS if SEQUENCE_ITEMS
+               else not self.cov_handle.goal_reached.is_set()):
+            if TIMING:
+                self.item_timer.start()
+            sequence_packet = self.new_item()
+            sequence_packet.randomize()
+            if director:
+                director.apply(sequence_packet)
+            if TIMING:
+                self.item_timer.stop()
+            await Timer(1, unit='step')
+            if TIMING:
+                self.handoff_timer.start()
+            await self.start_item(sequence_packet)
+            if TIMING:
+                self.handoff_timer.stop()
+            await self.finish_item(sequence_packet)
+            n_items += 1
+
+        if SEQUENCE_ITEMS:
+            await self.cov_handle.closure.wait_for_samples(start + n_items)
+        if director:
+            director.report(uvm_root().logger, n_items, self.pkt_type)
+
+    async def exhaustive_body(self):
+        """
+        Drive every input vector of Pkt exactly once.
+
+        Vectors follow EXHAUSTIVE_ORDER (lexicographic, gray, shuffled).
+        Returns once MyCoverage has sampled all of them, so the run length
+        is deterministic.
+        """
+        from Exhaustive import input_vectors
+
+        await self.drive_vectors(input_vectors(self.pkt_type.inputs, EXHAUSTIVE_ORDER))
+
+    async def drive_vectors(self, vectors):
+        """
+        Send one packet per {input: value} dict, in order, and wait until
+        MyCoverage has sampled all of them.
+        """
+        start = self.cov_handle.closure.n_samples
+        n_items = 0
+
+        for values in vectors:
+            if TIMING:
+                self.item_timer.start()
+            sequence_packet = self.new_item()
+            for name, value in values.items():
+                setattr(sequence_packet, name, value)
+            if TIMING:
+                self.item_timer.stop()
+            await Timer(1, unit='step')
+            if TIMING:
+                self.handoff_timer.start()
+            await self.start_item(sequence_packet)
+            if TIMING:
+                self.handoff_timer.stop()
+            await self.finish_item(sequence_packet)
+            n_items += 1
+
+        await self.cov_handle.closure.wait_for_samples(start + n_items)
+
+    async def tour_body(self):
+        """
+        Drive the minimal transition tour (SEQUENCE=tour).
+
+        The FSM graph comes from GoldenModel.predict(); the tour starts with
+        a reset and covers every transition in MyCoverage.transitions once
+        or along the shortest detours (TransitionTour).
+        """
+        from GoldenModel import GoldenModel
+        from TransitionTour import transition_tour
+
+        vectors, n_transitions = transition_tour(
+            GoldenModel().predict, self.pkt_type.inputs, GoldenModel.RESET,
+            targets=self.cov_handle.transitions)
+        uvm_root().logger.info(
+            f"Transition tour: {len(vectors)} cycles for {n_transitions} transitions")
+        await self.drive_vectors(vectors)
+
+    async def window_body(self):
+        """
+        Replay the failure window of WAVE_WINDOW_FILE (SEQUENCE=window, set
+        by WAVE_CAPTURE=replay).
+
+        On an FSM bench the window starts in the middle of a run, so it is
+        prefixed with the shortest input path from reset to the state it
+        started in; a combinational window is driven as is.
+        """
+        from WaveCapture import read_window, window_vectors
+
+        window = read_window()
+        prefix = None
+        if self.fsm_reset() is not None:
+            from GoldenModel import GoldenModel
+            from TransitionTour import path_to
+
+            golden = GoldenModel()
+            inputs = self.pkt_type.inputs
+            prefix = lambda state: path_to(golden.predict, inputs, GoldenModel.RESET, state)
+        vectors, n_prefix = window_vectors(window, prefix)
+        from_reset = f"{n_prefix} cycles from reset, then " if prefix else ""
+        uvm_root().logger.info(
+            f"Replaying the failure window of seed {window['seed']}: {from_reset}"
+            f"transactions #{window['transactions'][0]['index']}..#{window['fail_index']}")
+        await self.drive_vectors(vectors)
+
+    async def replay_body(self):
+        """
+        Drive the input columns of the REPLAY recording (SEQUENCE=replay).
+
+        The stimulus comes from a RECORD file of an earlier run, streamed
+        from disk (iter_rows), so no packet is randomized and coverage is
+        not polled; the recorded run is re-checked against the current RTL
+        and golden model.
+        """
+        from TransactionRecorder import REPLAY, iter_rows, read_footer
+
+        if not REPLAY:
+            raise ValueError("SEQUENCE=replay needs REPLAY=<recording file>")
+        names = [name for name, _ in self.pkt_type.inputs]
+        uvm_root().logger.info(f"Replaying {read_footer(REPLAY)['rows']} transactions from {REPLAY}")
+        await self.drive_vectors(dict(zip(names, row)) for row in iter_rows(REPLAY, names))
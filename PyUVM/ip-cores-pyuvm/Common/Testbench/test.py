@@ -0,0 +1,85 @@
+"""
+BenchTest: Top-level UVM test shared by the benches.
+
+Each bench's MyTest.py subclasses it, names its GenericBFM wrapper and
+registers the class with @pyuvm.test():
+
+    @pyuvm.test()
+    class MyTest(BenchTest):
+        WRAPPER = MuxWrapper
+"""
+
+import time
+from cocotb.triggers import Timer
+from pyuvm import ConfigDB, uvm_test
+from Transaction import start_tracing, report_tracing
+from StageTiming import start_timing, report_timing
+from PhaseProfile import start_profiling, report_profiling
+from .env import MyEnv
+from .sequence import MySequence
+
+
+class BenchTest(uvm_test):
+    """
+    Top-level test: coordinates all UVM components and test execution.
+
+    Responsibilities:
+    - Builds testbench hierarchy (environment, BFM)
+    - Registers BFM in ConfigDB for driver/monitor access
+    - Starts BFM background tasks (driver_task, monitor_task)
+    - Launches stimulus sequence and manages simulation objections
+
+    Attributes:
+        WRAPPER: GenericBFM subclass with the bench's signal map
+    """
+
+    WRAPPER = None
+
+    def build_phase(self):
+        """
+        Build Phase: Construct testbench hierarchy and register BFM.
+
+        Creates environment (agent, scoreboard, coverage), instantiates
+        BFM wrapper, registers it globally, and starts background tasks.
+        """
+        start_tracing()
+        start_timing()
+        start_profiling()
+        self.env = MyEnv.create("env", self)
+        self.bfm = self.WRAPPER()
+        ConfigDB().set(self, "*", "BUS_BFM", self.bfm)
+        self.bfm.start_bfm()
+
+    async def run_phase(self):
+        """
+        Run Phase: Execute stimulus until coverage goal is reached.
+
+        Logs the wall-clock start of the phase (Unix time), where
+        benchmark.py ends the start-up time of the run.
+
+        Flow:
+        1. Raise objection (prevent premature end)
+        2. Wait for DUT initialization
+        3. Start coverage-driven sequence
+        4. Wait until the BFM has monitored every transaction sent
+        5. Drop objection when complete (coverage = 100%)
+        """
+        self.logger.info(f"Run phase started at {time.time():.6f}")
+        self.raise_objection()
+        await Timer(2, unit="ns")
+        seqr = self.env.agent.sequencer
+        seq = MySequence.create("seq")
+        await seq.start(seqr)
+        await self.bfm.drain()
+        self.drop_objection()
+
+    def report_phase(self):
+        """
+        Report Phase: Log the BFM report (GenericBFM.report: queue usage,
+        throughput of clocked benches), then the optional tracing, timing
+        and profiling reports.
+        """
+        self.bfm.report(self.logger)
+        report_tracing(self.logger)
+        report_timing(self.logger)
+        report_profiling(self.logger)
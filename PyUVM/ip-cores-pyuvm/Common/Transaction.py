@@ -0,0 +1,145 @@
+"""
+Transaction: Slotted, optionally pooled transaction type.
+
+Every Pkt is a full uvm_sequence_item: a per-object __dict__, a factory
+lookup in Pkt.create(), a name, a transaction id and three cocotb Events for
+the sequencer handshake, allocated for every transaction of the sequence and
+again for every monitored transaction. In long soak runs that is most of the
+allocation and GC traffic of the bench.
+
+SlottedItem keeps the bench fields in __slots__ (declared once per bench in
+Pkt.py as SlottedPkt). It still carries the attributes that the pyuvm
+sequencer/driver handshake touches (start_condition, finish_condition,
+item_ready, parent_sequence_id, response_id, transaction_id). The three
+handshake Events are only created the first time the sequencer uses them,
+so monitored transactions never allocate them.
+
+TransactionPool recycles items: acquire() reuses a released item when one is
+free. The last consumer calls item.release(): GenericBFM once the inputs are
+driven, MyScoreboard once a monitored transaction is checked.
+
+Make variables:
+- TRANSACTION: uvm (default, Pkt) or slotted (SlottedPkt)
+- TRANSACTION_POOL: 1 to recycle slotted items through a TransactionPool
+- TRACEMALLOC: 1 to trace Python allocations for the whole test
+  (start_tracing/report_tracing, logged in MyTest.report_phase)
+"""
+
+import os
+from cocotb.triggers import Event
+
+TRANSACTION = os.environ.get("TRANSACTION", "uvm").lower()
+TRANSACTION_POOL = os.environ.get("TRANSACTION_POOL", "0") == "1"
+TRACEMALLOC = os.environ.get("TRACEMALLOC", "0") == "1"
+# Items come from a pool and must be released by their last consumer
+POOLED = TRANSACTION == "slotted" and TRANSACTION_POOL
+
+_HANDSHAKE_EVENTS = ("start_condition", "finish_condition", "item_ready")
+
+
+class SlottedItem:
+    """
+    Base class of the slotted per-bench transaction (SlottedPkt).
+
+    Subclasses declare their data fields in __slots__; every field starts
+    at 0, like the Pkt constructors.
+    """
+
+    __slots__ = _HANDSHAKE_EVENTS + (
+        "parent_sequence_id", "response_id", "transaction_id", "_pool")
+
+    def __init__(self, name=None):
+        """
+        Args:
+            name: Accepted for Pkt compatibility, not stored
+        """
+        self.parent_sequence_id = None
+        self.response_id = None
+        self.transaction_id = id(self)
+        self._pool = None
+        for field in type(self).__slots__:
+            setattr(self, field, 0)
+
+    def __getattr__(self, name):
+        # Only reached for unset slots: create handshake Events on first use
+        if name in _HANDSHAKE_EVENTS:
+            event = Event()
+            setattr(self, name, event)
+            return event
+        raise AttributeError(name)
+
+    def get_transaction_id(self):
+        return self.transaction_id
+
+    def release(self):
+        """Return the item to its pool (no-op for unpooled items)."""
+        if self._pool is not None:
+            self._pool.free.append(self)
+
+
+class TransactionPool:
+    """
+    Free list of SlottedItem objects of one type.
+
+    Attributes:
+        n_created: Items allocated by the pool
+        n_reused: acquire() calls served from the free list
+    """
+
+    def __init__(self, item_type):
+        self.item_type = item_type
+        self.free = []
+        self.n_created = 0
+        self.n_reused = 0
+
+    def acquire(self):
+        """Get a released item, or allocate a new one."""
+        if self.free:
+            self.n_reused += 1
+            return self.free.pop()
+        item = self.item_type()
+        item._pool = self
+        self.n_created += 1
+        return item
+
+
+def item_factory(default, slotted_type):
+    """
+    Return a zero-argument constructor for the configured transaction type.
+
+    Args:
+        default: Constructor used with TRANSACTION=uvm (e.g. Pkt.create)
+        slotted_type: Bench SlottedPkt
+    """
+    if TRANSACTION != "slotted":
+        return default
+    if TRANSACTION_POOL:
+        return TransactionPool(slotted_type).acquire
+    return slotted_type
+
+
+def start_tracing():
+    """Start tracemalloc when TRACEMALLOC=1 (call in build_phase)."""
+    if not TRACEMALLOC:
+        return
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def report_tracing(logger, top=5):
+    """Log current/peak traced memory and the top allocation sites."""
+    if not TRACEMALLOC:
+        return
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        return
+    current, peak = tracemalloc.get_traced_memory()
+    logger.info(
+        f"tracemalloc (TRANSACTION={TRANSACTION}, pool={int(TRANSACTION_POOL)}): "
+        f"current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB")
+    for stat in tracemalloc.take_snapshot().statistics("lineno")[:top]:
+        logger.info(f"  {stat}")
+    tracemalloc.stop()
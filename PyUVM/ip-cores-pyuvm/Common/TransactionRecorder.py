@@ -0,0 +1,295 @@
+"""
+TransactionRecorder: Binary columnar recording of the monitored transactions.
+
+With the RECORD make variable set, GenericBFM.get_result() hands every
+result tuple that reaches MyMonitor to a TransactionRecorder, e.g. the
+(mealy_i, rst_i, mealy_o, next_state, current_state) tuple of MealyWrapper.
+Offline analysis of long runs then reads typed columns instead of parsing
+console logs.
+
+    make RECORD=run.txr            # one file
+    make RECORD=records/           # records/<bench>-seed<seed>.txr
+
+Recording:
+- each field is converted to int and appended to a per-column array
+  (array module, smallest unsigned type for the field width). X/Z values
+  are stored as all ones and flagged in the _xz column (bit i = field i)
+- every RECORD_BUFFER rows the column buffers are handed to a background
+  thread, which appends them to one spool file per column, so the
+  simulation never waits for the disk
+- close() (GenericBFM.report) copies the spools into the final file
+
+File layout (little or native byte order, see the footer):
+
+    b"PYUVMTXR"
+    column 0 values | column 1 values | ... | _xz   (each 64-byte aligned)
+    footer: JSON schema (name, dtype, bit width, offset per column; rows;
+            bench, seed, timestamp)
+    uint64 footer offset, b"PYUVMTXR"
+
+Recording() memory-maps a file and returns the columns as NumPy arrays
+without copying them (requires numpy, which the recorder itself does not):
+
+    rec = Recording("run.txr")
+    rec["mealy_o"].mean(), len(rec), rec.xz("next_state").any()
+
+iter_rows() streams selected columns back chunk by chunk, without numpy and
+without loading the file. MySequence uses it for SEQUENCE=replay, which
+drives the input columns of the REPLAY recording through the driver/BFM.
+"""
+
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+from array import array
+
+RECORD = os.environ.get("RECORD", "")
+RECORD_BUFFER = int(os.environ.get("RECORD_BUFFER", "65536"))
+REPLAY = os.environ.get("REPLAY", "")
+
+MAGIC = b"PYUVMTXR"
+ALIGN = 64
+_TAIL = struct.Struct("<Q8s")
+
+
+def _typecode(bits):
+    """array typecode and dtype string of the smallest unsigned type holding bits."""
+    for code in ("B", "H", "I", "L", "Q"):
+        size = array(code).itemsize
+        if bits <= 8 * size:
+            return code, f"u{size}"
+    raise ValueError(f"Fields wider than 64 bits cannot be recorded ({bits} bits)")
+
+
+def _array_code(dtype):
+    """array typecode of a footer dtype string ("u1", "u2", ...)."""
+    size = int(dtype[1:])
+    return next(code for code in ("B", "H", "I", "L", "Q") if array(code).itemsize == size)
+
+
+def _width(value):
+    """Bit width of a monitored value (cocotb Logic/LogicArray, or int)."""
+    try:
+        return len(value)
+    except TypeError:
+        return 1 if isinstance(value, bool) else 64
+
+
+def record_path(path, bench, seed):
+    """RECORD as given, or <bench>-seed<seed>.txr inside it if it is a directory."""
+    if path.endswith(os.sep) or os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+        return os.path.join(path, f"{bench}-seed{seed}.txr")
+    return path
+
+
+class TransactionRecorder:
+    """
+    Buffered columnar writer for result tuples.
+
+    Attributes:
+        rows: Tuples recorded so far
+        n_xz: Rows holding at least one X/Z value
+    """
+
+    def __init__(self, path, names, buffer_rows=RECORD_BUFFER, **meta):
+        """
+        Args:
+            path: Output file
+            names: Column names, in result tuple order
+            buffer_rows: Rows buffered before a background write
+            meta: Extra footer entries (bench, seed, ...)
+        """
+        import queue
+
+        self.path = path
+        self.names = tuple(names)
+        self.buffer_rows = buffer_rows
+        self.meta = meta
+        self.rows = 0
+        self.n_xz = 0
+        self._columns = None
+        self._spools = []
+        self._pending = queue.Queue(maxsize=4)
+        self._writer = None
+        self._error = None
+
+    def _start(self, row):
+        """Fix the column types from the widths of the first row."""
+        if len(row) != len(self.names):
+            raise ValueError(f"Result of {len(row)} fields for columns {self.names}")
+        self._columns = []
+        for name, value in zip(self.names, row):
+            bits = _width(value)
+            code, dtype = _typecode(bits)
+            self._columns.append({"name": name, "bits": bits, "code": code, "dtype": dtype})
+        code, dtype = _typecode(len(self.names))
+        self._columns.append({"name": "_xz", "bits": len(self.names), "code": code, "dtype": dtype})
+        self._ones = [(1 << c["bits"]) - 1 for c in self._columns]
+        self._buffers = [array(c["code"]) for c in self._columns]
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._spools = [tempfile.TemporaryFile(dir=directory) for _ in self._columns]
+        self._writer = threading.Thread(target=self._write_loop, name="TransactionRecorder", daemon=True)
+        self._writer.start()
+
+    def record(self, row):
+        """Append one result tuple."""
+        if self._columns is None:
+            self._start(row)
+        buffers = self._buffers
+        xz = 0
+        for i, value in enumerate(row):
+            try:
+                buffers[i].append(int(value))
+            except ValueError:
+                buffers[i].append(self._ones[i])
+                xz |= 1 << i
+        buffers[-1].append(xz)
+        if xz:
+            self.n_xz += 1
+        self.rows += 1
+        if len(buffers[-1]) >= self.buffer_rows:
+            self._flush()
+
+    def _flush(self):
+        """Hand the filled buffers to the writer thread and start new ones."""
+        full = self._buffers
+        self._buffers = [array(c["code"]) for c in self._columns]
+        self._pending.put(full)
+
+    def _write_loop(self):
+        while True:
+            buffers = self._pending.get()
+            if buffers is None:
+                return
+            try:
+                for spool, buffer in zip(self._spools, buffers):
+                    buffer.tofile(spool)
+            except OSError as e:
+                self._error = e
+
+    def close(self):
+        """
+        Write the remaining rows and assemble the final file.
+
+        Returns:
+            Path of the file, or None if nothing was recorded
+        """
+        if self._columns is None:
+            return None
+        if len(self._buffers[-1]):
+            self._flush()
+        self._pending.put(None)
+        self._writer.join()
+        if self._error is not None:
+            raise self._error
+
+        tmp = f"{self.path}.tmp"
+        schema = []
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            for column, spool in zip(self._columns, self._spools):
+                f.write(b"\0" * (-f.tell() % ALIGN))
+                schema.append({"name": column["name"], "dtype": column["dtype"],
+                               "bits": column["bits"], "offset": f.tell()})
+                spool.seek(0)
+                shutil.copyfileobj(spool, f)
+                spool.close()
+            footer = {"version": 1, "rows": self.rows, "byteorder": sys.byteorder,
+                      "columns": schema, "n_xz": self.n_xz,
+                      "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")}
+            footer.update(self.meta)
+            offset = f.tell()
+            f.write(json.dumps(footer).encode())
+            f.write(_TAIL.pack(offset, MAGIC))
+        os.replace(tmp, self.path)
+        self._columns = None
+        return self.path
+
+
+def read_footer(path):
+    """Schema and metadata of a recording (no numpy needed)."""
+    with open(path, "rb") as f:
+        f.seek(-_TAIL.size, os.SEEK_END)
+        end = f.tell()
+        offset, magic = _TAIL.unpack(f.read(_TAIL.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a complete transaction recording")
+        f.seek(offset)
+        return json.loads(f.read(end - offset))
+
+
+def iter_rows(path, names, chunk_rows=RECORD_BUFFER):
+    """
+    Stream columns of a recording as row tuples.
+
+    Only chunk_rows rows of the selected columns are in memory at a time.
+
+    Args:
+        path: Recording file
+        names: Columns to read, in tuple order
+        chunk_rows: Rows read per column and chunk
+
+    Raises:
+        ValueError: if a column is not in the recording
+    """
+    footer = read_footer(path)
+    columns = {c["name"]: c for c in footer["columns"]}
+    missing = [name for name in names if name not in columns]
+    if missing:
+        raise ValueError(f"{path} has no column {', '.join(missing)} (columns: {', '.join(columns)})")
+    selected = [(columns[name]["offset"], _array_code(columns[name]["dtype"])) for name in names]
+    swap = footer["byteorder"] != sys.byteorder
+    rows = footer["rows"]
+    with open(path, "rb") as f:
+        for start in range(0, rows, chunk_rows):
+            n = min(chunk_rows, rows - start)
+            chunk = []
+            for offset, code in selected:
+                values = array(code)
+                f.seek(offset + start * values.itemsize)
+                values.fromfile(f, n)
+                if swap:
+                    values.byteswap()
+                chunk.append(values)
+            yield from zip(*chunk)
+
+
+class Recording:
+    """
+    Memory-mapped recording: columns are read-only NumPy views of the file.
+
+    Attributes:
+        footer: Schema and metadata (read_footer())
+        names: Column names, without _xz
+    """
+
+    def __init__(self, path):
+        import mmap
+        import numpy as np
+
+        self.footer = read_footer(path)
+        order = "<" if self.footer["byteorder"] == "little" else ">"
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        rows = self.footer["rows"]
+        self._columns = {c["name"]: np.frombuffer(self._map, dtype=order + c["dtype"], count=rows,
+                                                  offset=c["offset"])
+                         for c in self.footer["columns"]}
+        self.names = [c["name"] for c in self.footer["columns"] if c["name"] != "_xz"]
+
+    def __len__(self):
+        return self.footer["rows"]
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    def xz(self, name):
+        """Boolean array: rows where column name held X/Z."""
+        return (self._columns["_xz"] >> self.names.index(name)) & 1 == 1
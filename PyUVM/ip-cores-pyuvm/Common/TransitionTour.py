@@ -0,0 +1,198 @@
+"""
+TransitionTour: Minimal input sequence covering every FSM transition.
+
+Builds the FSM transition graph from a GoldenModel's predict() function and
+computes a shortest walk that traverses every targeted (state, next_state)
+transition at least once (open directed Chinese-postman tour):
+
+1. Explore states reachable from the reset state, one edge per distinct
+   transition (non-reset inputs preferred, reset only where required)
+2. Pick the end state and the duplicated shortest paths that balance
+   in/out degrees at minimum total cost
+3. Walk the balanced multigraph with Hierholzer's algorithm
+
+The tour starts with one reset cycle, so the DUT begins in a known state;
+that cycle also covers the reset_state -> reset_state transition.
+
+path_to() reuses the graph to reach one state from reset, e.g. to replay a
+failure window (WaveCapture) that started in the middle of a run.
+"""
+
+from itertools import permutations
+from Exhaustive import input_vectors
+
+MAX_EXACT_BALANCE = 8
+
+
+def _is_reset(vector, reset):
+    return all(vector[name] == value for name, value in reset.items())
+
+
+def build_graph(predict, inputs, reset, reset_state=0):
+    """
+    Explore the FSM from reset_state.
+
+    Args:
+        predict: predict(state, **inputs) -> (next_state, ...)
+        inputs: Pkt.inputs, (name, width) pairs
+        reset: Input values that assert reset (GoldenModel.RESET)
+        reset_state: State entered on reset
+
+    Returns:
+        Dict (state, next_state) -> input vector dict
+    """
+    vectors = sorted(input_vectors(inputs), key=lambda v: _is_reset(v, reset))
+    edges = {}
+    queue = [reset_state]
+    seen = {reset_state}
+    while queue:
+        state = queue.pop(0)
+        for vector in vectors:
+            next_state = predict(state, **vector)[0]
+            edges.setdefault((state, next_state), vector)
+            if next_state not in seen:
+                seen.add(next_state)
+                queue.append(next_state)
+    return edges
+
+
+def _shortest_paths(edges):
+    """All-pairs shortest paths (BFS, one clock per edge) as edge lists."""
+    adjacency = {}
+    for (s, t) in edges:
+        adjacency.setdefault(s, []).append(t)
+        adjacency.setdefault(t, [])
+
+    paths = {}
+    for source in adjacency:
+        paths[(source, source)] = []
+        queue = [source]
+        while queue:
+            s = queue.pop(0)
+            for t in adjacency[s]:
+                if (source, t) not in paths:
+                    paths[(source, t)] = paths[(source, s)] + [(s, t)]
+                    queue.append(t)
+    return paths
+
+
+def _balance(excess_in, excess_out, paths):
+    """
+    Pair nodes with surplus in-degree to nodes with surplus out-degree at
+    minimum total path length (exact for small graphs, greedy otherwise).
+    """
+    if not excess_in:
+        return 0, []
+
+    if len(excess_in) <= MAX_EXACT_BALANCE:
+        best = None
+        for targets in set(permutations(excess_out)):
+            cost = sum(len(paths[(s, t)]) for s, t in zip(excess_in, targets))
+            if best is None or cost < best[0]:
+                best = (cost, list(zip(excess_in, targets)))
+        return best
+
+    pairs = []
+    remaining = list(excess_out)
+    for s in excess_in:
+        t = min(remaining, key=lambda t: len(paths[(s, t)]))
+        remaining.remove(t)
+        pairs.append((s, t))
+    return sum(len(paths[p]) for p in pairs), pairs
+
+
+def _euler_path(multi_edges, start):
+    """Hierholzer's algorithm on a list of (s, t) edges."""
+    outgoing = {}
+    for s, t in multi_edges:
+        outgoing.setdefault(s, []).append(t)
+    stack = [start]
+    walk = []
+    while stack:
+        s = stack[-1]
+        if outgoing.get(s):
+            stack.append(outgoing[s].pop())
+        else:
+            walk.append(stack.pop())
+    walk.reverse()
+    return list(zip(walk, walk[1:]))
+
+
+def transition_tour(predict, inputs, reset, reset_state=0, targets=None):
+    """
+    Compute the shortest input sequence covering every transition.
+
+    Args:
+        predict, inputs, reset, reset_state: See build_graph()
+        targets: (state, next_state) pairs to cover; defaults to every
+            reachable transition (including reset-only ones)
+
+    Returns:
+        Tuple (vectors, n_transitions): list of input vector dicts to drive
+        in order (starting with a reset), and the number of transitions
+        covered
+    """
+    edges = build_graph(predict, inputs, reset, reset_state)
+    reset_vector = next(v for v in input_vectors(inputs) if _is_reset(v, reset))
+
+    if targets is None:
+        targets = set(edges)
+    missing = set(targets) - set(edges)
+    if missing:
+        raise ValueError(f"Transitions not reachable from state {reset_state}: {sorted(missing)}")
+
+    required = [e for e in edges if e in targets and e != (reset_state, reset_state)]
+    paths = _shortest_paths(edges)
+
+    best = None
+    for end in {t for _, t in edges} | {reset_state}:
+        # Closing edge end -> reset_state turns the open tour into a circuit
+        degree = {}
+        for s, t in required + [(end, reset_state)]:
+            degree[s] = degree.get(s, 0) + 1
+            degree[t] = degree.get(t, 0) - 1
+        excess_in = [n for n, d in degree.items() if d < 0 for _ in range(-d)]
+        excess_out = [n for n, d in degree.items() if d > 0 for _ in range(d)]
+        cost, pairs = _balance(excess_in, excess_out, paths)
+        if best is None or cost < best[0]:
+            best = (cost, end, pairs)
+
+    _, end, pairs = best
+    multi_edges = list(required)
+    for s, t in pairs:
+        multi_edges.extend(paths[(s, t)])
+
+    if multi_edges:
+        # Rotate the circuit so it starts right after the closing edge
+        circuit = _euler_path(multi_edges + [(end, reset_state)], reset_state)
+        cut = max(i for i, e in enumerate(circuit) if e == (end, reset_state))
+        walk = circuit[cut + 1:] + circuit[:cut]
+        if len(walk) != len(multi_edges):
+            raise ValueError("Targeted transitions do not form a connected tour")
+    else:
+        walk = []
+
+    vectors = [reset_vector] + [edges[e] for e in walk]
+    return vectors, len(targets)
+
+
+def path_to(predict, inputs, reset, state, reset_state=0):
+    """
+    Shortest input sequence from reset to state.
+
+    Args:
+        predict, inputs, reset, reset_state: See build_graph()
+        state: State to reach
+
+    Returns:
+        List of input vector dicts, starting with a reset
+
+    Raises:
+        ValueError: if state is not reachable from reset_state
+    """
+    edges = build_graph(predict, inputs, reset, reset_state)
+    paths = _shortest_paths(edges)
+    if (reset_state, state) not in paths:
+        raise ValueError(f"State {state} is not reachable from state {reset_state}")
+    reset_vector = next(v for v in input_vectors(inputs) if _is_reset(v, reset))
+    return [reset_vector] + [edges[e] for e in paths[(reset_state, state)]]
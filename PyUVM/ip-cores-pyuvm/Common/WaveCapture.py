@@ -0,0 +1,131 @@
+"""
+WaveCapture: Failure-triggered waveform capture.
+
+Dumping waves on every run costs simulation time and disk even when
+everything passes. With WAVE_CAPTURE=fail the bench runs without tracing
+(the Makefile sets WAVES=0). FailureWindow keeps a ring buffer of the last
+WAVE_WINDOW transactions checked by the scoreboard: their inputs, FSM state
+and sim time. On the first scoreboard FAIL, the window is written to
+WAVE_WINDOW_FILE (JSON). The batch scoreboard (SCOREBOARD=batch) finds a
+mismatch only when it flushes, so its ring also keeps the transactions of
+one batch (history) and failed() is given the number of the failing one.
+
+WAVE_CAPTURE=replay re-runs that window with tracing on (WAVES=1,
+VERILATOR_TRACE=1, SEQUENCE=window, SIM_BUILD=sim_build_waves):
+window_vectors() turns the file back into input vectors, prefixed for FSM
+benches by the shortest input path from reset to the state the window
+started in (TransitionTour.path_to). regression.py runs the replay by itself
+when a bench fails in fail mode.
+
+WAVE_CAPTURE=always (default) traces every run, as before.
+"""
+
+import json
+import os
+from collections import deque
+from cocotb.utils import get_sim_time
+from RunSeed import regression_seed
+
+WAVE_CAPTURE = os.environ.get("WAVE_CAPTURE", "always").lower()
+WAVE_WINDOW = int(os.environ.get("WAVE_WINDOW", "64"))
+WAVE_WINDOW_FILE = os.environ.get("WAVE_WINDOW_FILE", "wave_window.json")
+
+# Scoreboards record transactions only when this is set
+CAPTURE = WAVE_CAPTURE == "fail"
+
+
+def _plain(value):
+    """int of a DUT value, or its string when it holds X/Z."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+class FailureWindow:
+    """
+    Ring buffer of the last transactions checked by a scoreboard.
+
+    Attributes:
+        n_recorded: Transactions recorded so far
+        saved: True once the window of the first failure was written
+    """
+
+    def __init__(self, fields, state=None, size=WAVE_WINDOW, path=WAVE_WINDOW_FILE, history=0):
+        """
+        Args:
+            fields: Input field names to record (Pkt.inputs names)
+            state: Pkt field holding the FSM state before the transaction
+                (None for combinational benches)
+            size: Transactions in the written window (WAVE_WINDOW)
+            path: File written on the first failure (WAVE_WINDOW_FILE)
+            history: Extra transactions kept, for failures reported after
+                later transactions were recorded (SCOREBOARD_BATCH)
+        """
+        self.fields = tuple(fields)
+        self.state = state
+        self.path = path
+        self.size = size
+        self.ring = deque(maxlen=size + history)
+        self.n_recorded = 0
+        self.saved = False
+
+    def record(self, pkt):
+        """Add one checked transaction to the ring."""
+        state = _plain(getattr(pkt, self.state)) if self.state else None
+        self.ring.append((get_sim_time("ns"), self.n_recorded,
+                          [_plain(getattr(pkt, name)) for name in self.fields], state))
+        self.n_recorded += 1
+
+    def failed(self, logger, index=None):
+        """
+        Write the window ending at transaction number index (default: the
+        last recorded one), on the first failure only.
+        """
+        if self.saved:
+            return
+        self.saved = True
+        if index is None:
+            index = self.n_recorded - 1
+        ring = [entry for entry in self.ring if entry[1] <= index][-self.size:]
+        window = {
+            "seed": regression_seed(),
+            "fields": list(self.fields),
+            "state": self.state,
+            "fail_index": index,
+            "fail_time_ns": ring[-1][0] if ring else None,
+            "transactions": [{"time_ns": t, "index": i, "inputs": values, "state": state}
+                             for t, i, values, state in ring],
+        }
+        with open(self.path, "w") as f:
+            json.dump(window, f, indent=1)
+        logger.info(
+            f"Failure window of {len(ring)} transactions (#{window['transactions'][0]['index']}"
+            f"..#{window['fail_index']}) written to {self.path}; replay with WAVE_CAPTURE=replay")
+
+
+def read_window(path=WAVE_WINDOW_FILE):
+    """Load a failure window written by FailureWindow.failed()."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def window_vectors(window, path_to=None):
+    """
+    Input vectors that replay a failure window.
+
+    Args:
+        window: Dict from read_window()
+        path_to: For FSM benches, path_to(state) -> input vectors that take
+            the FSM from reset to state (TransitionTour.path_to)
+
+    Returns:
+        Tuple (vectors, n_prefix): input vector dicts in drive order, and
+        how many of them lead from reset to the window's first state
+    """
+    fields = window["fields"]
+    vectors = [dict(zip(fields, t["inputs"])) for t in window["transactions"]]
+    prefix = []
+    if path_to is not None and window["transactions"] and window["state"]:
+        prefix = path_to(window["transactions"][0]["state"])
+    return prefix + vectors, len(prefix)
@@ -29,6 +29,26 @@ class GoldenModel():
         self.y2=0
         self.y3=0
 
+    # Pkt attributes of the predict() outputs, in order
+    OUTPUTS = ("y0_o", "y1_o", "y2_o", "y3_o")
+
+    def predict(self, x_i, sel_i):
+        """Compute the expected outputs.
+        
+        Returns:
+            Tuple (y0_o, y1_o, y2_o, y3_o): x_i on the selected line, 0 elsewhere
+        """
+        match sel_i:
+            case 0:
+                return x_i, 0, 0, 0
+            case 1:
+                return 0, x_i, 0, 0
+            case 2:
+                return 0, 0, x_i, 0
+            case 3:
+                return 0, 0, 0, x_i
+        return self.y0, self.y1, self.y2, self.y3
+
     def check(self, packet):
         """Verify DUT output correctness for a transaction.
         
@@ -44,29 +64,7 @@ class GoldenModel():
         3. Compare expected vs actual outputs
         4. Return pass/fail for scoreboard
         """
-        match packet.sel_i:
-
-            case 0:
-                self.y0 = packet.x_i
-                self.y1 = 0
-                self.y2 = 0
-                self.y3 = 0
-            case 1:
-                self.y1 = packet.x_i
-                self.y0 = 0
-                self.y2 = 0
-                self.y3 = 0
-            case 2:
-                self.y2 = packet.x_i
-                self.y1 = 0
-                self.y0 = 0
-                self.y3 = 0
-            case 3:
-                self.y3 = packet.x_i
-                self.y1 = 0
-                self.y2 = 0
-                self.y0 = 0
-            
+        self.y0, self.y1, self.y2, self.y3 = self.predict(packet.x_i, packet.sel_i)
 
         if (packet.y0_o, packet.y1_o, packet.y2_o, packet.y3_o) == (self.y0, self.y1, self.y2, self.y3):
             return True
@@ -1,48 +1,16 @@
-from pyuvm import *
-from DemuxCovergroup import DemuxCovergroup
-import vsc
-
 """
-MyCoverage: Functional coverage collector for Demux.
+MyCoverage: Functional coverage of the Demux inputs.
 
-Samples transactions from monitor and records coverage metrics. Provides
-real-time coverage feedback to guide stimulus generation.
+BenchCoverage (Testbench) samples the fields named here into the
+covergroup and checks the coverage goal.
 """
 
-class MyCoverage(uvm_subscriber):
-    """
-    UVM coverage subscriber: collects functional coverage metrics.
-    
-    Operation:
-    - Receives transactions via analysis export (connected to monitor)
-    - Samples each transaction into covergroup
-    - Tracks coverage percentage for stimulus termination condition
-    """
-
-    def build_phase(self):
-        self.cg=DemuxCovergroup()
-
-    def write(self, pkt):
-        """
-        Called when monitor publishes a transaction.
-        
-        Samples the packet into covergroup to update coverage metrics.
-        """
-
-        self.cg.sample(pkt.x_i, pkt.sel_i)
-
-    def report_phase(self):
+from Testbench import BenchCoverage
 
-        cg_percent = self.cg.get_coverage()
 
-        if cg_percent < 100.0:
-            self.logger.error(
-                f"Coverage FAIL: {100 - cg_percent:.2f}% uncovered."
-            )
-            assert False
-        else:
-            self.logger.info(f"Covered all operations (100.00%)")
-            assert True
+class MyCoverage(BenchCoverage):
+    """Coverage subscriber of the Demux."""
 
-    def get_my_coverage(self):
-        return self.cg.get_coverage()
+    COVERGROUP = "DemuxCovergroup"
+    # Pkt attribute behind each cg.sample() argument
+    sample_fields = ("x_i", "sel_i")
@@ -11,6 +11,7 @@ Demux routing logic: sel_i selects which output receives x_i value, others = 0
 
 from pyuvm import *
 import random
+from Transaction import SlottedItem
 
 class Pkt(uvm_sequence_item):
     """
@@ -24,6 +25,9 @@ class Pkt(uvm_sequence_item):
     Randomization: Randomizes input and selector; outputs are DUT-generated.
     """
 
+    # Input fields as (name, width), used to enumerate the input space
+    inputs = (("x_i", 1), ("sel_i", 2))
+
 
     def __init__(self, name):
         super().__init__(name)
@@ -47,4 +51,15 @@ class Pkt(uvm_sequence_item):
         """
         self.x_i=random.randint(0, 1)
         self.sel_i=random.randint(0, 3)
-    
\ No newline at end of file
+
+
+class SlottedPkt(SlottedItem):
+    """
+    Slotted Pkt (TRANSACTION=slotted): same fields and randomize(), without
+    the per-object __dict__ and uvm_sequence_item bookkeeping.
+    """
+
+    __slots__ = ("x_i", "sel_i", "y0_o", "y1_o", "y2_o", "y3_o")
+    inputs = Pkt.inputs
+    randomize = Pkt.randomize
+    __str__ = Pkt.__str__
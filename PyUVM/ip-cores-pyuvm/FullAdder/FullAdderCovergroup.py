@@ -7,10 +7,10 @@ UVM uses this to track when 100% of interesting scenarios have been exercised.
 """
 
 from pyuvm import *
-from vsc import covergroup, coverpoint, bit_t, bin, cross
+from CoverageEngine import covergroup, coverpoint, bit_t, bin, cross
 
 @covergroup
-class HalfAdderCovergroup():
+class FullAdderCovergroup():
     """
     Coverage group: defines bins for Full Adder inputs (a_i, b_i, carry_i).
     
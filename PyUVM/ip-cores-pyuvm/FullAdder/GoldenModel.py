@@ -24,6 +24,19 @@ class GoldenModel():
         self.s=0
         self.c=0
 
+    # Pkt attributes of the predict() outputs, in order
+    OUTPUTS = ("sum_o", "carry_o")
+
+    def predict(self, a_i, b_i, carry_i):
+        """Compute the expected outputs.
+        
+        Returns:
+            Tuple (sum_o, carry_o)
+        """
+        s = a_i ^ b_i ^ carry_i
+        c = (a_i & b_i) | (a_i & carry_i) | (b_i & carry_i)
+        return s, c
+
     def check(self, packet):
         """Verify DUT output correctness for a transaction.
         
@@ -39,8 +52,7 @@ class GoldenModel():
         3. Compare expected vs actual outputs
         4. Return pass/fail for scoreboard
         """
-        self.s=packet.a_i ^ packet.b_i ^ packet.carry_i
-        self.c = (packet.a_i & packet.b_i) | (packet.a_i & packet.carry_i) | (packet.b_i & packet.carry_i)
+        self.s, self.c = self.predict(packet.a_i, packet.b_i, packet.carry_i)
 
         if packet.sum_o == self.s and packet.carry_o == self.c:
             return True
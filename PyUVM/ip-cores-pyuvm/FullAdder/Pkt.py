@@ -11,6 +11,7 @@ Full adder logic:
 
 from pyuvm import *
 import random
+from Transaction import SlottedItem
 
 class Pkt(uvm_sequence_item):
     """Transaction packet: Represents full adder inputs/outputs.
@@ -25,6 +26,9 @@ class Pkt(uvm_sequence_item):
     Randomization: Randomizes all 3 inputs; outputs are DUT-generated.
     """
 
+    # Input fields as (name, width), used to enumerate the input space
+    inputs = (("a_i", 1), ("b_i", 1), ("carry_i", 1))
+
 
     def __init__(self, name):
         super().__init__(name)
@@ -43,4 +47,14 @@ class Pkt(uvm_sequence_item):
         self.a_i=random.randint(0, 1)
         self.b_i=random.randint(0, 1)
         self.carry_i=random.randint(0, 1)
-    
\ No newline at end of file
+
+
+class SlottedPkt(SlottedItem):
+    """
+    Slotted Pkt (TRANSACTION=slotted): same fields and randomize(), without
+    the per-object __dict__ and uvm_sequence_item bookkeeping.
+    """
+
+    __slots__ = ("a_i", "b_i", "carry_i", "carry_o", "sum_o")
+    inputs = Pkt.inputs
+    randomize = Pkt.randomize
@@ -15,10 +15,22 @@ class GoldenModel():
     - carry_o = a_i AND b_i
     """
 
+    # Pkt attributes of the predict() outputs, in order
+    OUTPUTS = ("s", "c")
+
     def __init__(self):
         self.s=0
         self.c=0
 
+    def predict(self, a, b):
+        """
+        Compute the expected outputs.
+
+        Returns:
+        - Tuple (s, c)
+        """
+        return a ^ b, a & b
+
     def check(self, packet):
         """
         Verify packet against expected Half Adder behavior.
@@ -27,8 +39,7 @@ class GoldenModel():
         - True if DUT outputs match expected values
         - False otherwise
         """
-        self.s=packet.a ^ packet.b
-        self.c = packet.a & packet.b
+        self.s, self.c = self.predict(packet.a, packet.b)
 
         if packet.s == self.s and packet.c == self.c:
             return True
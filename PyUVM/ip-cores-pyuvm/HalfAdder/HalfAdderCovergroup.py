@@ -6,7 +6,7 @@ input combinations (2x2 = 4 cases) are tested.
 """
 
 from pyuvm import *
-from vsc import covergroup, coverpoint, bit_t, bin, cross
+from CoverageEngine import covergroup, coverpoint, bit_t, bin, cross
 
 @covergroup
 class HalfAdderCovergroup():
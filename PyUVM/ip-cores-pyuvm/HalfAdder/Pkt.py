@@ -8,6 +8,7 @@ driver -> BFM -> DUT, and back through monitor for scoreboard checking.
 
 from pyuvm import *
 import random
+from Transaction import SlottedItem
 
 class Pkt(uvm_sequence_item):
     """
@@ -18,6 +19,9 @@ class Pkt(uvm_sequence_item):
     - sum_o, carry_o: output results (set by monitor after DUT execution)
     """
 
+    # Input fields as (name, width), used to enumerate the input space
+    inputs = (("a", 1), ("b", 1))
+
     def __init__(self, name):
         super().__init__(name)
         self.c=0
@@ -37,4 +41,15 @@ class Pkt(uvm_sequence_item):
         """
         self.a=random.randint(0, 1)
         self.b=random.randint(0, 1)
-    
\ No newline at end of file
+
+
+class SlottedPkt(SlottedItem):
+    """
+    Slotted Pkt (TRANSACTION=slotted): same fields and randomize(), without
+    the per-object __dict__ and uvm_sequence_item bookkeeping.
+    """
+
+    __slots__ = ("a", "b", "s", "c")
+    inputs = Pkt.inputs
+    randomize = Pkt.randomize
+    __str__ = Pkt.__str__
@@ -38,6 +38,50 @@ class GoldenModel():
         self.next_state=0
         self.current_state=0
 
+    # Input values that force the FSM back to S0 (rst_i is active low)
+    RESET = {"rst_i": 0}
+    # Pkt attributes of the predict() outputs, in order
+    OUTPUTS = ("next_state", "mealy_o")
+
+    def predict(self, current_state, mealy_i, rst_i):
+        """
+        Compute one clock cycle of the Mealy FSM.
+
+        Args:
+            current_state: State before the clock edge (0-3)
+            mealy_i: Data input
+            rst_i: Reset (active low)
+
+        Returns:
+            Tuple (next_state, mealy_o)
+        """
+        if(rst_i == 0):
+            return 0, 0
+
+        match current_state:
+            case 0:
+                if(mealy_i):
+                    return 1, 0
+                else:
+                    return 0, 0
+            case 1:
+                if(mealy_i):
+                    return 1, 0
+                else:
+                    return 2, 0
+            case 2:
+                if(mealy_i):
+                    return 3, 0
+                else:
+                    return 0, 0
+            case 3:
+                if(mealy_i):
+                    return 1, 0
+                else:
+                    return 0, 1
+            case _:
+                return 0, 0
+
     def check(self, packet):
         """
         Verify packet against expected Mealy FSM behavior.
@@ -51,42 +95,10 @@ class GoldenModel():
         Logic:
         - Reset (rst_i=0): next_state=0, mealy_o=0
         - Normal operation: compute next_state and mealy_o based on
-          current_state and mealy_i (Mealy characteristic)
+          current_state and mealy_i (Mealy characteristic), see predict()
         """
         self.current_state = packet.current_state
-        self.mealy_o = 0
-
-        if(packet.rst_i == 0):
-            self.next_state = 0
-            self.mealy_o = 0
-                
-        else:
-            match packet.current_state:
-                case 0:
-                    if(packet.mealy_i):
-                        self.next_state = 1
-                    else:
-                        self.next_state = 0
-                case 1:
-                    if(packet.mealy_i):
-                        self.next_state = 1
-                    else:
-                        self.next_state = 2
-                case 2:
-                    if(packet.mealy_i):
-                        self.next_state = 3
-                    else:
-                        self.next_state = 0
-                case 3:
-                    if(packet.mealy_i):
-                        self.next_state = 1
-                    else:
-                        self.next_state = 0
-                        self.mealy_o = 1
-                case _:
-                    self.mealy_o = 0
-                    self.next_state = 0
-
+        self.next_state, self.mealy_o = self.predict(packet.current_state, packet.mealy_i, packet.rst_i)
 
         if (self.mealy_o, self.current_state, self.next_state) == (packet.mealy_o, packet.current_state, packet.next_state):
             return True
@@ -15,7 +15,7 @@ Valid Transitions:
 """
 
 from pyuvm import *
-from vsc import covergroup, coverpoint, bit_t, bin, cross, bin_array
+from CoverageEngine import covergroup, coverpoint, bit_t, bin, cross, bin_array
 
 
 
@@ -8,14 +8,15 @@ Key features:
 - Synchronous driver: applies inputs on clock edge
 - Monitor: captures outputs (combinational based on state + input)
 - State tracking: records current_state before transitions
+
+The driver applies the next input as soon as the monitor acknowledges the
+previous cycle, so lockstep already runs at one transaction per clock.
 """
 
-from cocotb.triggers import Timer, Event, RisingEdge, FallingEdge
-import cocotb
-from cocotb.queue import Queue
-from cocotb.clock import Clock
+from cocotb.triggers import Timer, RisingEdge
+from GenericBFM import GenericBFM
 
-class MealyWrapper:
+class MealyWrapper(GenericBFM):
     """
     Bus Functional Model for Mealy FSM
     
@@ -25,29 +26,20 @@ class MealyWrapper:
     - Event synchronization: coordinates driver/monitor activity
     - State tracking: captures current_state before transitions
     """
+
+    INPUTS = ("mealy_i", "rst_i")
+    OUTPUTS = ("mealy_o",)
+    PROBES = ("state", "next_state")
+    RESULT = ("mealy_i", "rst_i", "mealy_o", "next_state", "current_state")
+    CLOCK = "clk_i"
+
     def __init__(self):
         """
-        Initialize BFM with queues, events, and DUT reference.
+        Initialize BFM (GenericBFM) and state tracking.
         """
-        self.dut = cocotb.top
-        self.driver_queue = Queue(maxsize=1)
-        self.mon_queue = Queue(maxsize=0) 
-        self.ack_event = Event()
-        self.stimulus_event = Event()
-        self.ack_event.set() 
+        super().__init__()
         self.current_state=0
 
-    async def send_pkt(self, packet):
-        """
-        Send packet from driver to BFM driver task.
-        
-        Args:
-            packet: Transaction item containing mealy_i, rst_i
-        """
-        await self.ack_event.wait()
-        self.ack_event.clear()
-        await self.driver_queue.put(packet)
-
     async def driver_task(self):
         """
         Driver coroutine: apply inputs to DUT.
@@ -58,24 +50,15 @@ class MealyWrapper:
         3. Apply mealy_i and rst_i to DUT
         4. Signal monitor to capture outputs
         """
+        state = self.handles["state"]
         while True:
             packet = await self.driver_queue.get() 
 
-            self.current_state=self.dut.state.value
-            self.dut.mealy_i.value = packet.mealy_i
-            self.dut.rst_i.value = packet.rst_i
+            self.current_state=state.value
+            self.drive(packet)
             
             self.stimulus_event.set()
 
-    async def get_result(self):
-        """
-        Retrieve monitored result (called by monitor).
-        
-        Returns:
-            Tuple: (mealy_i, rst_i, mealy_o, next_state, current_state)
-        """
-        return await self.mon_queue.get()
-    
     async def monitor_task(self):
         """
         Monitor coroutine: capture DUT outputs and states.
@@ -87,36 +70,22 @@ class MealyWrapper:
         4. Capture next_state after clock
         5. Put result tuple in monitor queue
         6. Signal acknowledgment for next transaction
+
+        Result tuple: (mealy_i, rst_i, mealy_o, next_state, current_state)
         """
+        state = self.handles["state"]
         while True:
             await self.stimulus_event.wait()
             self.stimulus_event.clear()
             await Timer(1, unit='ns')
-            self.NEXT_STATE_x = self.dut.next_state.value
-            self.MEALY_o = self.dut.mealy_o.value 
-            self.MEALY_i = self.dut.mealy_i.value
-            self.RST_i = self.dut.rst_i.value
-            self.CURRENT_STATE_x = self.current_state
-            await RisingEdge(self.dut.clk_i)
+            next_state = self.handles["next_state"].value
+            mealy_i, rst_i, mealy_o = self.sample()
+            await RisingEdge(self.clock)
             await Timer(1, unit='ps')
 
-            if(self.dut.rst_i.value == 0):
-                self.NEXT_STATE_x = self.dut.state.value
+            if(rst_i == 0):
+                next_state = state.value
 
-            self.mon_queue.put_nowait((self.MEALY_i, self.RST_i, self.MEALY_o, self.NEXT_STATE_x, self.CURRENT_STATE_x))
-            
+            await self.mon_queue.put((mealy_i, rst_i, mealy_o, next_state, self.current_state))
+            self.count_transaction()
             self.ack_event.set()
-            
-    def start_bfm(self):
-        """
-        Start BFM coroutines and clock generation.
-        
-        Launches:
-        - Clock generator (10ns period)
-        - Driver task
-        - Monitor task
-        """
-        c = Clock(self.dut.clk_i, 10, unit="ns")
-        cocotb.start_soon(c.start())
-        cocotb.start_soon(self.driver_task())
-        cocotb.start_soon(self.monitor_task())
\ No newline at end of file
@@ -1,30 +0,0 @@
-"""
-MyPackage: Aggregates all UVM components for Mealy FSM verification.
-
-Provides single import point consolidating all testbench classes and packet
-definitions, simplifying top-level imports.
-"""
-
-from Pkt import Pkt
-from MySequence import MySequence
-from MySequencer import MySequencer
-from MyDriver import MyDriver
-from MyMonitor import MyMonitor
-from MyAgent import MyAgent
-from MyEnv import MyEnv
-from MyScoreboard import MyScoreboard
-from MealyWrapper import MealyWrapper
-from MyCoverage import MyCoverage
-
-__all__ = [
-    "Pkt",
-    "MySequence",
-    "MySequencer",
-    "MyDriver",
-    "MyMonitor",
-    "MyAgent",
-    "MyEnv",
-    "MyScoreboard",
-    "MealyWrapper",
-    "MyCoverage"
-]
\ No newline at end of file
@@ -14,6 +14,7 @@ Signals:
 
 from pyuvm import *
 import random
+from Transaction import SlottedItem
 
 class Pkt(uvm_sequence_item):
     """
@@ -26,6 +27,9 @@ class Pkt(uvm_sequence_item):
     - State tracking: current_state, next_state
     """
 
+    # Input fields as (name, width), used to enumerate the input space
+    inputs = (("mealy_i", 1), ("rst_i", 1))
+
     def __init__(self, name):
         """
         Initialize transaction packet.
@@ -59,4 +63,15 @@ class Pkt(uvm_sequence_item):
         """
         self.mealy_i=random.randint(0, 1)
         self.rst_i=random.randint(0, 1)
-    
\ No newline at end of file
+
+
+class SlottedPkt(SlottedItem):
+    """
+    Slotted Pkt (TRANSACTION=slotted): same fields and randomize(), without
+    the per-object __dict__ and uvm_sequence_item bookkeeping.
+    """
+
+    __slots__ = ("mealy_i", "rst_i", "mealy_o", "next_state", "current_state")
+    inputs = Pkt.inputs
+    randomize = Pkt.randomize
+    __str__ = Pkt.__str__
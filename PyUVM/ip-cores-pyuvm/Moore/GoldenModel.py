@@ -35,60 +35,71 @@ class GoldenModel():
         self.previous_state=0
         self.current_state=0
 
-    def check(self, packet):
-        """Check DUT transaction against golden model.
+    # Input values that force the FSM back to S0 (rst_i is active high)
+    RESET = {"rst_i": 1}
+    # Pkt attributes of the predict() outputs, in order
+    OUTPUTS = ("current_state", "out_o")
+
+    def predict(self, previous_state, next_i, rst_i):
+        """Compute one clock cycle of the Moore FSM.
         
         Args:
-            packet: Transaction packet from monitor
+            previous_state: State before the clock edge (0-4)
+            next_i: Transition input
+            rst_i: Synchronous reset (active high)
         
         Returns:
-            True if DUT matches expected behavior, False otherwise
-        
-        Process:
-            1. Determine output based on previous state (Moore)
-            2. Calculate next state based on previous state and next_i
-            3. Apply reset if rst_i is active
-            4. Compare with DUT's output and state
+            Tuple (current_state, out) after the clock edge
         """
-        self.previous_state = packet.previous_state
+        if rst_i == 1:
+            return 0, 0
 
-        match packet.previous_state:
+        match previous_state:
             case 0:
-                self.out = 0
-                if(packet.next_i):
-                    self.current_state = 1
+                if(next_i):
+                    return 1, 0
+                else:
+                    return 0, 0
             case 1:
-                self.out = 0
-                if(not packet.next_i):
-                    self.current_state = 2
+                if(not next_i):
+                    return 2, 0
                 else:
-                    self.current_state = 1
+                    return 1, 0
             case 2:
-                self.out = 0
-                if(packet.next_i):
-                    self.current_state = 3
+                if(next_i):
+                    return 3, 0
                 else:
-                    self.current_state = 0
+                    return 0, 0
             case 3:
-                self.out = 0
-                if(packet.next_i):
-                    self.current_state = 4
+                if(next_i):
+                    return 4, 0
                 else:
-                    self.current_state = 2
+                    return 2, 0
             case 4:
-                self.out = 1
-                if(packet.next_i):
-                    self.current_state = 1
+                if(next_i):
+                    return 1, 1
                 else:
-                    self.current_state = 2
+                    return 2, 1
             case _:
-                self.out = 0
-                self.current_state = 0
+                return 0, 0
 
-        match packet.rst_i:
-            case 1:
-                self.out = 0
-                self.current_state = 0
+    def check(self, packet):
+        """Check DUT transaction against golden model.
+        
+        Args:
+            packet: Transaction packet from monitor
+        
+        Returns:
+            True if DUT matches expected behavior, False otherwise
+        
+        Process:
+            1. Determine output based on previous state (Moore)
+            2. Calculate next state based on previous state and next_i
+            3. Apply reset if rst_i is active
+            4. Compare with DUT's output and state
+        """
+        self.previous_state = packet.previous_state
+        self.current_state, self.out = self.predict(packet.previous_state, packet.next_i, packet.rst_i)
 
         if (self.out, self.previous_state, self.current_state) == (packet.out_o, packet.previous_state, packet.current_state):
             return True
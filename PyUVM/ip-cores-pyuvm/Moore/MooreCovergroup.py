@@ -16,7 +16,7 @@ Valid State Transitions (encoded):
 """
 
 from pyuvm import *
-from vsc import covergroup, coverpoint, bit_t, bin, cross, bin_array
+from CoverageEngine import covergroup, coverpoint, bit_t, bin, cross, bin_array
 
 
 
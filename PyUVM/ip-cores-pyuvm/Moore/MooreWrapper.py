@@ -13,14 +13,16 @@ Moore Machine Interface:
 - Inputs: clk_i, next_i, rst_i
 - Output: out_o
 - State: state_moore (internal state register)
+
+Each packet waits for the monitor acknowledgment of the previous one, which
+arrives right after the rising edge, so lockstep already runs at one
+transaction per clock.
 """
 
-from cocotb.triggers import Timer, Event, RisingEdge, FallingEdge
-import cocotb
-from cocotb.queue import Queue
-from cocotb.clock import Clock
+from cocotb.triggers import Timer, RisingEdge
+from GenericBFM import GenericBFM
 
-class MooreWrapper:
+class MooreWrapper(GenericBFM):
     """Bus Functional Model wrapper for Moore FSM DUT.
     
     Manages:
@@ -29,37 +31,27 @@ class MooreWrapper:
         - Output and state monitoring
         - Synchronization between driver and monitor
     
-    Uses queues and events for proper sequencing of transactions.
+    Ports are declared for GenericBFM, which caches their handles.
     """
+
+    INPUTS = ("next_i", "rst_i")
+    OUTPUTS = ("out_o",)
+    PROBES = ("state_moore",)
+    RESULT = ("next_i", "rst_i", "out_o", "previous_state", "current_state")
+    CLOCK = "clk_i"
+
     def __init__(self):
         """Initialize Moore FSM BFM.
         
-        Sets up:
-            - DUT reference (cocotb.top)
+        Sets up (GenericBFM):
+            - DUT reference and cached handles
             - Driver and monitor queues
             - Synchronization events
-            - Previous state tracking
+        Plus previous state tracking.
         """
-        self.dut = cocotb.top
-        self.driver_queue = Queue(maxsize=1)
-        self.mon_queue = Queue(maxsize=0) 
-        self.ack_event = Event()
-        self.stimulus_event = Event()
-        self.ack_event.set() 
+        super().__init__()
         self.previous_state=0
 
-    async def send_pkt(self, packet):
-        """Send transaction packet to driver queue.
-        
-        Args:
-            packet: Pkt object with next_i and rst_i values
-        
-        Waits for acknowledgment before queuing new packet.
-        """
-        await self.ack_event.wait()
-        self.ack_event.clear()
-        await self.driver_queue.put(packet)
-
     async def driver_task(self):
         """Driver coroutine - applies inputs to Moore FSM.
         
@@ -69,22 +61,14 @@ class MooreWrapper:
             - Captures previous state
             - Signals monitor that stimulus is ready
         """
+        state = self.handles["state_moore"]
         while True:
             packet = await self.driver_queue.get() 
             
-            self.dut.next_i.value = packet.next_i
-            self.dut.rst_i.value = packet.rst_i
-            self.previous_state=self.dut.state_moore.value
+            self.drive(packet)
+            self.previous_state=state.value
             self.stimulus_event.set()
 
-    async def get_result(self):
-        """Retrieve monitored result from queue.
-        
-        Returns:
-            Tuple: (next_i, rst_i, out_o, previous_state, current_state)
-        """
-        return await self.mon_queue.get()
-    
     async def monitor_task(self):
         """Monitor coroutine - captures Moore FSM outputs and states.
         
@@ -94,34 +78,19 @@ class MooreWrapper:
             - Captures inputs, output, and state transition
             - Sends results to monitor queue
             - Acknowledges completion
+
+        Result tuple: (next_i, rst_i, out_o, previous_state, current_state)
         """
+        state = self.handles["state_moore"]
         while True:
             await self.stimulus_event.wait()
             self.stimulus_event.clear()
-            await RisingEdge(self.dut.clk_i)
+            await RisingEdge(self.clock)
             await Timer(1, unit='ps')
-            
-            NEXT_i = self.dut.next_i.value
-            RST_i = self.dut.rst_i.value
-            OUT_o = self.dut.out_o.value
-            PREVIOUS_STATE_x = self.previous_state
-            CURRENT_STATE_x = self.dut.state_moore.value
 
-            self.mon_queue.put_nowait((NEXT_i, RST_i, OUT_o, PREVIOUS_STATE_x, CURRENT_STATE_x))
-            
+            NEXT_i, RST_i, OUT_o = self.sample()
+            CURRENT_STATE_x = state.value
+
+            await self.mon_queue.put((NEXT_i, RST_i, OUT_o, self.previous_state, CURRENT_STATE_x))
+            self.count_transaction()
             self.ack_event.set()
-            
-    def start_bfm(self):
-        """Start the Bus Functional Model.
-        
-        Launches:
-            - Clock generator (10 ns period)
-            - Driver task coroutine
-            - Monitor task coroutine
-        
-        Called during build phase to initialize BFM operation.
-        """
-        c = Clock(self.dut.clk_i, 10, unit="ns")
-        cocotb.start_soon(c.start())
-        cocotb.start_soon(self.driver_task())
-        cocotb.start_soon(self.monitor_task())
\ No newline at end of file
@@ -1,68 +1,23 @@
 """
-MyCoverage: Functional coverage collector for Moore FSM.
+MyCoverage: Functional coverage of the Moore FSM input and state transitions.
 
-Samples transactions from monitor and records coverage metrics. Provides
-real-time coverage feedback to guide stimulus generation.
+BenchCoverage (Testbench) samples each monitored Pkt into MooreCovergroup
+and checks the coverage goal; sample() encodes the transition.
 """
 
-from pyuvm import *
-from MooreCovergroup import MooreCovergroup
-import vsc
-from vsc import get_coverage_report
+from Testbench import BenchCoverage
 
-class MyCoverage(uvm_subscriber):
-    """
-    UVM coverage subscriber: collects functional coverage metrics.
-    
-    Operation:
-    - Receives transactions via analysis export (connected to monitor)
-    - Samples each transaction into covergroup
-    - Tracks coverage percentage for stimulus termination condition
-    """
-    def build_phase(self):
-        self.cg=MooreCovergroup()
 
-    def write(self, pkt):
+class MyCoverage(BenchCoverage):
+    """Coverage subscriber of the Moore FSM."""
 
-        prev=int(pkt.previous_state)
-        curr=int(pkt.current_state)
+    COVERGROUP = "MooreCovergroup"
+    # Pkt attribute behind each cg.sample() argument (None = derived value)
+    sample_fields = ("next_i", None)
 
-        state=(prev << 3) | curr
+    # (previous_state, next_state) pairs encoded by the valid_states bins
+    transitions = ((0, 0), (0, 1), (1, 1), (1, 2), (2, 0), (2, 3), (3, 2), (3, 4), (4, 1), (4, 2))
 
-        self.cg.sample(pkt.next_i, state)
-
-    def report_phase(self):
-        """Report phase - check and report coverage results.
-        
-        Checks:
-            - Coverage percentage against 100% target
-            - Reports uncovered scenarios if incomplete
-            - Asserts PASS/FAIL based on coverage
-        """
-
-        cg_percent = self.cg.get_coverage()
-
-        if cg_percent < 100.0:
-            self.logger.error(
-                f"Coverage FAIL: {100 - cg_percent:.2f}% uncovered."
-            )
-            self.get_report()
-            assert False
-        else:
-            self.logger.info(f"Covered all operations (100.00%)")
-            assert True
-
-    def get_my_coverage(self):
-        """Get current coverage percentage.
-        
-        Returns:
-            Coverage percentage (0.0 to 100.0)
-        """
-        return self.cg.get_coverage()
-    
-    def get_report(self):
-        """Print detailed coverage report.
-        
-        Shows which bins are covered and which are missing.
-        """
-        print(get_coverage_report(details=True))
+    def sample(self, pkt):
+        """Sample next_i and the transition, encoded as (prev_state << 3) | curr_state."""
+        self.cg.sample(pkt.next_i, (int(pkt.previous_state) << 3) | int(pkt.current_state))
@@ -13,6 +13,7 @@ Moore Machine Characteristics:
 
 from pyuvm import *
 import random
+from Transaction import SlottedItem
 
 class Pkt(uvm_sequence_item):
     """Transaction packet for Moore FSM verification.
@@ -27,6 +28,9 @@ class Pkt(uvm_sequence_item):
     The Moore machine has 5 states (S0-S4) with output depending only on state.
     """
 
+    # Input fields as (name, width), used to enumerate the input space
+    inputs = (("next_i", 1), ("rst_i", 1))
+
     def __init__(self, name):
         """Initialize Moore FSM transaction packet.
         
@@ -57,4 +61,15 @@ class Pkt(uvm_sequence_item):
         """
         self.next_i=random.randint(0, 1)
         self.rst_i=random.randint(0, 1)
-    
\ No newline at end of file
+
+
+class SlottedPkt(SlottedItem):
+    """
+    Slotted Pkt (TRANSACTION=slotted): same fields and randomize(), without
+    the per-object __dict__ and uvm_sequence_item bookkeeping.
+    """
+
+    __slots__ = ("next_i", "rst_i", "out_o", "previous_state", "current_state")
+    inputs = Pkt.inputs
+    randomize = Pkt.randomize
+    __str__ = Pkt.__str__
@@ -24,6 +24,28 @@ class GoldenModel():
         """
         self.y=0
 
+    # Pkt attributes of the predict() outputs, in order
+    OUTPUTS = ("y_o",)
+
+    def predict(self, x0_i, x1_i, x2_i, x3_i, sel_i):
+        """
+        Compute the expected output.
+
+        Returns:
+            Tuple (y_o,): the input line selected by sel_i
+        """
+        match sel_i:
+
+            case 0:
+                return (x0_i,)
+            case 1:
+                return (x1_i,)
+            case 2:
+                return (x2_i,)
+            case 3:
+                return (x3_i,)
+        return (self.y,)
+
     def check(self, packet):
         """
         Verify DUT output correctness for a transaction.
@@ -39,17 +61,7 @@ class GoldenModel():
         2. Compare expected vs actual y_o
         3. Return pass/fail for scoreboard
         """
-        match packet.sel_i:
-
-            case 0:
-                self.y = packet.x0_i
-            case 1:
-                self.y = packet.x1_i
-            case 2:
-                self.y = packet.x2_i
-            case 3:
-                self.y = packet.x3_i
-            
+        self.y, = self.predict(packet.x0_i, packet.x1_i, packet.x2_i, packet.x3_i, packet.sel_i)
 
         if packet.y_o == self.y:
             return True
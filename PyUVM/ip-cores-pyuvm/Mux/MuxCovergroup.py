@@ -12,7 +12,7 @@ Coverage bins:
 """
 
 from pyuvm import *
-from vsc import covergroup, coverpoint, bit_t, bin, cross
+from CoverageEngine import covergroup, coverpoint, bit_t, bin, cross
 
 
 
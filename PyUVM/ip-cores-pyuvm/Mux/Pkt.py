@@ -8,6 +8,7 @@ driver -> BFM -> DUT, and back through monitor for scoreboard checking.
 
 from pyuvm import *
 import random
+from Transaction import SlottedItem
 
 class Pkt(uvm_sequence_item):
     """
@@ -19,6 +20,9 @@ class Pkt(uvm_sequence_item):
     - y_o: output result (set by monitor after DUT execution)
     """
 
+    # Input fields as (name, width), used to enumerate the input space
+    inputs = (("x0_i", 1), ("x1_i", 1), ("x2_i", 1), ("x3_i", 1), ("sel_i", 2))
+
     def __init__(self, name):
         super().__init__(name)
         self.x0_i = 0
@@ -43,4 +47,15 @@ class Pkt(uvm_sequence_item):
         self.x2_i = random.randint(0, 1)
         self.x3_i = random.randint(0, 1)
         self.sel_i = random.randint(0, 3)
-    
\ No newline at end of file
+
+
+class SlottedPkt(SlottedItem):
+    """
+    Slotted Pkt (TRANSACTION=slotted): same fields and randomize(), without
+    the per-object __dict__ and uvm_sequence_item bookkeeping.
+    """
+
+    __slots__ = ("x0_i", "x1_i", "x2_i", "x3_i", "sel_i", "y_o")
+    inputs = Pkt.inputs
+    randomize = Pkt.randomize
+    __str__ = Pkt.__str__
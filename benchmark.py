@@ -0,0 +1,496 @@
+"""
+benchmark: Testbench throughput benchmarks with a SQLite history.
+
+Runs each bench in a fixed configuration (one seed, a fixed number of
+transactions), one bench at a time so the runs do not compete for cores,
+and measures per bench:
+
+    transactions/s   transactions per second of test wall time
+    sim ns/s         simulated time per second of test wall time
+    startup s        process wall time until the first transaction: make,
+                     simulator start-up, Python imports and the UVM build
+                     phases, up to the "Run phase started at" line BenchTest
+                     logs (CocoTb benches: wall time outside the test)
+    peak RSS         largest resident set of make and the simulator
+
+Every bench first runs once unmeasured (it compiles the model, through the
+build cache, and warms the file cache), then --repeat times; the median of
+the repeats is recorded. PyUVM benches send exactly --items transactions
+(SEQUENCE_ITEMS) and report them through SCOREBOARD_RESULTS; the CocoTb
+benches run the fixed loop of their test and log one [SCOREBOARD PASS] or
+[SCOREBOARD FAIL] line per transaction.
+
+Each `run` appends one run (configuration, commit, host) and its per-bench
+results to the history database (default .bench_history.sqlite). `compare`
+checks a run against the median of the previous N runs with the same
+configuration on the same host, and flags every metric that got worse by
+more than the threshold; it exits non-zero on a regression, like a failing
+regression run.
+
+Output of the last run (default: regression/benchmark/):
+
+    regression/benchmark/PyUVM/Mux/
+    ├── sim_build/              # SIM_BUILD shared by the runs
+    ├── warmup/                 # console.log, results.xml, ...
+    └── run0/ ... run<N-1>/
+
+Usage:
+    python3 benchmark.py run PyUVM/ SIM=python COVERAGE_ENGINE=native
+    python3 benchmark.py run Mux --items 5000 --repeat 5 --compare
+    python3 benchmark.py compare --last 5 --threshold 10
+    python3 benchmark.py history PyUVM/Mux
+"""
+
+import argparse
+import json
+import os
+import re
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+from regression import REPO, discover, parse_results, select
+from buildcache import BuildCache, DEFAULT_CACHE
+
+DEFAULT_DB = os.path.join(REPO, ".bench_history.sqlite")
+
+# Logged by BenchTest.run_phase: the end of the start-up time
+RUN_PHASE_STARTED = re.compile(r"Run phase started at (\d+\.\d+)")
+
+# Recorded metric -> (label, +1 if higher is better else -1)
+METRICS = {
+    "txn_per_s": ("transactions/s", 1),
+    "sim_ns_per_s": ("sim ns/s", 1),
+    "startup_s": ("startup s", -1),
+    "peak_rss_kb": ("peak RSS kB", -1),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    label TEXT,
+    git_commit TEXT,
+    host TEXT,
+    seed INTEGER,
+    items INTEGER,
+    repeat INTEGER,
+    make_args TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    bench TEXT NOT NULL,
+    status TEXT NOT NULL,
+    transactions INTEGER,
+    sim_ns REAL,
+    test_s REAL,
+    wall_s REAL,
+    startup_s REAL,
+    txn_per_s REAL,
+    sim_ns_per_s REAL,
+    peak_rss_kb INTEGER,
+    PRIMARY KEY (run_id, bench)
+);
+"""
+
+
+def open_db(path=DEFAULT_DB):
+    """Open (and create) the history database."""
+    db = sqlite3.connect(path)
+    db.row_factory = sqlite3.Row
+    db.executescript(SCHEMA)
+    return db
+
+
+def git_commit():
+    """Short commit of the work tree (with -dirty), or None outside git."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO,
+                               capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("-dirty" if dirty else "")
+
+
+def parse_timing(path):
+    """
+    Test wall time and simulated time of a cocotb results.xml.
+
+    Returns:
+        Tuple (test_s, sim_ns), summed over the test cases, or None
+    """
+    try:
+        tree = ET.parse(path)
+    except (OSError, ET.ParseError):
+        return None
+    test_s = sim_ns = 0.0
+    scale = {"fs": 1e-6, "ps": 1e-3, "ns": 1.0, "us": 1e3, "ms": 1e6, "sec": 1e9, "s": 1e9}
+    for case in tree.iter("testcase"):
+        test_s += float(case.get("time", 0.0))
+        props = {p.get("name"): p.get("value") for p in case.iter("property")}
+        sim_ns += float(props.get("sim_time_duration", 0.0)) * scale.get(props.get("sim_time_unit", "ns"), 1.0)
+    return test_s, sim_ns
+
+
+def count_transactions(run_dir):
+    """
+    Transactions checked in one run: the SCOREBOARD_RESULTS totals of a
+    PyUVM bench, or the [SCOREBOARD PASS/FAIL] lines of a CocoTb bench.
+    """
+    try:
+        with open(os.path.join(run_dir, "scoreboard.json")) as f:
+            totals = json.load(f)
+        return totals["passed"] + totals["failed"]
+    except (OSError, ValueError, KeyError):
+        pass
+    try:
+        with open(os.path.join(run_dir, "console.log"), errors="replace") as f:
+            return sum("[SCOREBOARD PASS]" in line or "[SCOREBOARD FAIL]" in line for line in f)
+    except OSError:
+        return None
+
+
+def run_phase_start(run_dir):
+    """
+    Unix time at which the test's run_phase started ("Run phase started at"
+    line of BenchTest in console.log), or None.
+    """
+    try:
+        with open(os.path.join(run_dir, "console.log"), errors="replace") as f:
+            for line in f:
+                match = RUN_PHASE_STARTED.search(line)
+                if match:
+                    return float(match.group(1))
+    except OSError:
+        pass
+    return None
+
+
+def measure(path, run_dir, sim_build, seed, items, make_args=(), timeout=None):
+    """
+    Run a bench once and measure it.
+
+    Args:
+        path: Bench directory
+        run_dir: Output directory of this run
+        sim_build: SIM_BUILD (shared by the runs of the bench)
+        seed: COCOTB_RANDOM_SEED
+        items: SEQUENCE_ITEMS (PyUVM benches)
+        make_args: Extra VAR=value make arguments
+        timeout: Seconds before the run is killed (None = no limit)
+
+    Returns:
+        Result dict with status and the raw measurements
+    """
+    os.makedirs(run_dir, exist_ok=True)
+    for stale in ("results.xml", "scoreboard.json"):
+        if os.path.exists(os.path.join(run_dir, stale)):
+            os.remove(os.path.join(run_dir, stale))
+    results_file = os.path.join(run_dir, "results.xml")
+    cmd = ["make", f"SIM_BUILD={sim_build}", f"COCOTB_RESULTS_FILE={results_file}",
+           "WAVE_CAPTURE=fail", f"WAVE_WINDOW_FILE={os.path.join(run_dir, 'wave_window.json')}",
+           f"COVERAGE_DB={os.path.join(run_dir, 'coverage_db')}/",
+           f"SEQUENCE_ITEMS={items}", *make_args]
+    env = dict(os.environ, PWD=path, COCOTB_RANDOM_SEED=str(seed),
+               SCOREBOARD_RESULTS=os.path.join(run_dir, "scoreboard.json"))
+
+    with open(os.path.join(run_dir, "console.log"), "w") as log:
+        start = time.perf_counter()
+        start_time = time.time()
+        try:
+            proc = subprocess.Popen(cmd, cwd=path, env=env, stdout=log, stderr=subprocess.STDOUT)
+        except OSError as e:
+            log.write(f"{e}\n")
+            return {"status": "ERROR"}
+        timer = threading.Timer(timeout, proc.kill) if timeout else None
+        if timer:
+            timer.start()
+        # wait4: the rusage of make includes the simulator it waited for
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        if timer:
+            timer.cancel()
+
+    counts = parse_results(results_file)
+    timing = parse_timing(results_file)
+    if counts is None or timing is None:
+        return {"status": "TIMEOUT" if proc.returncode < 0 and timeout else "ERROR"}
+    ok = proc.returncode == 0 and counts["tests"] and not counts["failures"]
+    test_s, sim_ns = timing
+    started = run_phase_start(run_dir)
+    startup = started - start_time if started is not None else wall - test_s
+    return {"status": "PASS" if ok else "FAIL", "transactions": count_transactions(run_dir),
+            "sim_ns": sim_ns, "test_s": test_s, "wall_s": wall, "startup_s": max(startup, 0.0),
+            "peak_rss_kb": usage.ru_maxrss}
+
+
+def summarize(runs):
+    """
+    Median of the measurements of a bench's repeats, plus the derived rates.
+
+    The status is the worst status of the repeats.
+    """
+    status = next((r["status"] for r in runs if r["status"] != "PASS"), "PASS")
+    result = {"status": status}
+    measured = [r for r in runs if "test_s" in r]
+    if not measured:
+        return result
+    for key in ("transactions", "sim_ns", "test_s", "wall_s", "startup_s", "peak_rss_kb"):
+        values = [r[key] for r in measured if r[key] is not None]
+        result[key] = statistics.median(values) if values else None
+    if result["transactions"] is not None:
+        result["transactions"] = int(result["transactions"])
+    test_s = result["test_s"]
+    result["txn_per_s"] = result["transactions"] / test_s if test_s and result["transactions"] else None
+    result["sim_ns_per_s"] = result["sim_ns"] / test_s if test_s else None
+    return result
+
+
+def run_benchmarks(benches, out_dir, seed=1, items=1000, repeat=3, make_args=(), warmup=True,
+                   timeout=None, cache=None, log=print):
+    """
+    Benchmark benches one after the other.
+
+    Args:
+        benches: Dict name -> directory (see regression.discover())
+        out_dir: Output directory
+        seed: COCOTB_RANDOM_SEED of every run
+        items: Transactions per PyUVM run (SEQUENCE_ITEMS)
+        repeat: Measured runs per bench
+        make_args: Extra VAR=value make arguments, for every bench
+        warmup: Run every bench once, unmeasured, first
+        timeout: Per-run timeout in seconds
+        cache: BuildCache for the compiled models (None = always compile)
+        log: Progress output function
+
+    Returns:
+        Dict bench name -> summarized result (see summarize())
+    """
+    out_dir = os.path.abspath(out_dir)
+    results = {}
+    for name, path in benches.items():
+        bench_dir = os.path.join(out_dir, name)
+        sim_build = os.path.join(bench_dir, "sim_build")
+        os.makedirs(bench_dir, exist_ok=True)
+        build, key, model = "off", None, None
+        if cache is not None:
+            build, key, model = cache.prepare(path, sim_build, make_args)
+        if warmup:
+            first = measure(path, os.path.join(bench_dir, "warmup"), sim_build, seed, items, make_args, timeout)
+            if build == "miss":
+                cache.store(key, sim_build, model, name)
+            if first["status"] != "PASS":
+                log(f"{name}: warm-up run {first['status']}, see {os.path.join(bench_dir, 'warmup')}")
+                results[name] = first
+                continue
+        runs = [measure(path, os.path.join(bench_dir, f"run{i}"), sim_build, seed, items, make_args, timeout)
+                for i in range(repeat)]
+        if not warmup and build == "miss":
+            cache.store(key, sim_build, model, name)
+        results[name] = summarize(runs)
+        r = results[name]
+        if "txn_per_s" in r:
+            log(f"{name}: {r['status']}, {r['transactions']} transactions, {_fmt(r['txn_per_s'])} transactions/s, "
+                f"{_fmt(r['sim_ns_per_s'])} sim ns/s, startup {r['startup_s']:.2f} s, "
+                f"peak RSS {r['peak_rss_kb'] / 1024:.0f} MB")
+        else:
+            log(f"{name}: {r['status']}")
+    return results
+
+
+def record(db, results, seed, items, repeat, make_args=(), label=None):
+    """
+    Append a run and its per-bench results to the history.
+
+    Returns:
+        The run id
+    """
+    cursor = db.execute(
+        "INSERT INTO runs (timestamp, label, git_commit, host, seed, items, repeat, make_args) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (time.strftime("%Y-%m-%dT%H:%M:%S"), label, git_commit(), socket.gethostname(), seed, items, repeat,
+         " ".join(make_args)))
+    run_id = cursor.lastrowid
+    for bench, r in results.items():
+        db.execute(
+            "INSERT INTO results (run_id, bench, status, transactions, sim_ns, test_s, wall_s, startup_s, "
+            "txn_per_s, sim_ns_per_s, peak_rss_kb) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (run_id, bench, r["status"], r.get("transactions"), r.get("sim_ns"), r.get("test_s"), r.get("wall_s"),
+             r.get("startup_s"), r.get("txn_per_s"), r.get("sim_ns_per_s"), r.get("peak_rss_kb")))
+    db.commit()
+    return run_id
+
+
+def compare(db, run_id=None, last=5, threshold=10.0):
+    """
+    Compare a run with the median of the previous runs of its configuration.
+
+    Only runs with the same seed, items, make arguments and host count as
+    previous runs, and only their PASS results form the baseline.
+
+    Args:
+        db: History database (open_db())
+        run_id: Run to check (default: the latest)
+        last: Previous runs in the baseline
+        threshold: Percent change in the bad direction that is a regression
+
+    Returns:
+        Dict with the run, the baseline run ids and one row per bench and
+        metric (value, baseline, change in percent, regression flag), or
+        None if there is no such run
+    """
+    if run_id is None:
+        run = db.execute("SELECT * FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+    else:
+        run = db.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+    if run is None:
+        return None
+    previous = [row["id"] for row in db.execute(
+        "SELECT id FROM runs WHERE id < ? AND seed IS ? AND items IS ? AND make_args IS ? AND host IS ? "
+        "ORDER BY id DESC LIMIT ?",
+        (run["id"], run["seed"], run["items"], run["make_args"], run["host"], last))]
+
+    rows = []
+    for result in db.execute("SELECT * FROM results WHERE run_id = ? ORDER BY bench", (run["id"],)):
+        if result["status"] != "PASS":
+            rows.append({"bench": result["bench"], "status": result["status"], "metric": None,
+                         "regression": True})
+            continue
+        history = db.execute(
+            f"SELECT * FROM results WHERE bench = ? AND status = 'PASS' AND run_id IN "
+            f"({', '.join('?' * len(previous))})", (result["bench"], *previous)).fetchall() if previous else []
+        for metric, (_, direction) in METRICS.items():
+            value = result[metric]
+            values = [h[metric] for h in history if h[metric] is not None]
+            baseline = statistics.median(values) if values else None
+            change = None
+            if value is not None and baseline:
+                change = 100.0 * (value - baseline) / baseline
+            rows.append({"bench": result["bench"], "status": "PASS", "metric": metric, "value": value,
+                         "baseline": baseline, "samples": len(values), "change": change,
+                         "regression": change is not None and direction * change < -threshold})
+    return {"run": dict(run), "baseline_runs": previous, "threshold": threshold, "rows": rows}
+
+
+def _fmt(value):
+    """Compact number for the tables."""
+    if value is None:
+        return "-"
+    if abs(value) >= 100:
+        return f"{value:,.0f}"
+    return f"{value:.3g}"
+
+
+def print_comparison(report, out=sys.stdout):
+    """Print the per-bench, per-metric comparison and the regressions."""
+    run = report["run"]
+    out.write(f"\nRun {run['id']} ({run['timestamp']}, {run['git_commit'] or 'no commit'}"
+              f"{', ' + run['label'] if run['label'] else ''}) against the median of "
+              f"{len(report['baseline_runs'])} previous runs (threshold {report['threshold']:g}%)\n")
+    width = max([len(r["bench"]) for r in report["rows"]] + [5])
+    out.write(f"\n{'Bench':{width}}  {'Metric':14}  {'Value':>12}  {'Baseline':>12}  {'Change':>8}\n")
+    out.write(f"{'-' * width}  {'-' * 14}  {'-' * 12}  {'-' * 12}  {'-' * 8}\n")
+    for r in report["rows"]:
+        if r["metric"] is None:
+            out.write(f"{r['bench']:{width}}  {r['status']}\n")
+            continue
+        change = "-" if r["change"] is None else f"{r['change']:+.1f}%"
+        flag = "  REGRESSION" if r["regression"] else ""
+        out.write(f"{r['bench']:{width}}  {METRICS[r['metric']][0]:14}  {_fmt(r['value']):>12}  "
+                  f"{_fmt(r['baseline']):>12}  {change:>8}{flag}\n")
+    regressions = [r for r in report["rows"] if r["regression"]]
+    if not report["baseline_runs"]:
+        out.write("\nNo previous run with this configuration: nothing to compare against\n")
+    out.write(f"\n{len(regressions)} regressions\n")
+
+
+def print_history(db, bench=None, limit=20, out=sys.stdout):
+    """Print the latest results, optionally of one bench."""
+    query = ("SELECT runs.id, runs.timestamp, runs.git_commit, runs.label, results.* FROM results "
+             "JOIN runs ON runs.id = results.run_id")
+    args = ()
+    if bench:
+        query += " WHERE results.bench = ?"
+        args = (bench,)
+    rows = db.execute(query + " ORDER BY runs.id DESC, results.bench LIMIT ?", (*args, limit)).fetchall()
+    out.write(f"{'Run':>4}  {'Timestamp':19}  {'Commit':14}  {'Bench':18}  {'Status':6}  {'Trans/s':>10}  "
+              f"{'Sim ns/s':>10}  {'Startup s':>9}  {'RSS MB':>6}\n")
+    for r in rows:
+        rss = "-" if r["peak_rss_kb"] is None else f"{r['peak_rss_kb'] / 1024:.0f}"
+        startup = "-" if r["startup_s"] is None else f"{r['startup_s']:.2f}"
+        out.write(f"{r['id']:4}  {r['timestamp']:19}  {(r['git_commit'] or '-'):14}  {r['bench']:18}  "
+                  f"{r['status']:6}  {_fmt(r['txn_per_s']):>10}  {_fmt(r['sim_ns_per_s']):>10}  "
+                  f"{startup:>9}  {rss:>6}\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the benches and track their throughput over time.")
+    parser.add_argument("--db", default=DEFAULT_DB, help="history database (default: .bench_history.sqlite)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="benchmark benches and append the results to the history")
+    run.add_argument("args", nargs="*", metavar="BENCH|VAR=value",
+                     help="bench names or prefixes (e.g. PyUVM/, Mux), and make variables")
+    run.add_argument("--seed", type=int, default=1, help="COCOTB_RANDOM_SEED of every run (default: 1)")
+    run.add_argument("--items", type=int, default=1000,
+                     help="transactions per PyUVM run, SEQUENCE_ITEMS (default: 1000)")
+    run.add_argument("--repeat", type=int, default=3, help="measured runs per bench (default: 3)")
+    run.add_argument("--no-warmup", action="store_true", help="skip the unmeasured first run")
+    run.add_argument("--label", default=None, help="free-form note stored with the run")
+    run.add_argument("--timeout", type=float, default=None, help="per-run timeout in seconds")
+    run.add_argument("-o", "--out", default=os.path.join(REPO, "regression", "benchmark"),
+                     help="output directory (default: regression/benchmark/)")
+    run.add_argument("--cache", default=DEFAULT_CACHE, help="build cache directory")
+    run.add_argument("--no-cache", action="store_true", help="compile without the build cache")
+    run.add_argument("--compare", action="store_true", help="compare with the previous runs afterwards")
+    run.add_argument("--last", type=int, default=5, help="previous runs in the baseline (default: 5)")
+    run.add_argument("--threshold", type=float, default=10.0,
+                     help="percent change that is a regression (default: 10)")
+
+    cmp = commands.add_parser("compare", help="compare a run with the previous runs of its configuration")
+    cmp.add_argument("--run", type=int, default=None, help="run id (default: the latest run)")
+    cmp.add_argument("--last", type=int, default=5, help="previous runs in the baseline (default: 5)")
+    cmp.add_argument("--threshold", type=float, default=10.0,
+                     help="percent change that is a regression (default: 10)")
+
+    hist = commands.add_parser("history", help="list the latest results")
+    hist.add_argument("bench", nargs="?", default=None, help="bench name (e.g. PyUVM/Mux)")
+    hist.add_argument("--limit", type=int, default=20, help="rows to show (default: 20)")
+    options = parser.parse_args(argv)
+
+    db = open_db(options.db)
+    if options.command == "history":
+        print_history(db, options.bench, options.limit)
+        return 0
+    if options.command == "run":
+        make_args = [a for a in options.args if "=" in a]
+        patterns = [a for a in options.args if "=" not in a]
+        benches = select(discover(), patterns)
+        if not benches:
+            parser.error("no bench matches " + " ".join(patterns))
+        cache = None if options.no_cache else BuildCache(options.cache)
+        results = run_benchmarks(benches, options.out, options.seed, options.items, options.repeat, make_args,
+                                 not options.no_warmup, options.timeout, cache)
+        run_id = record(db, results, options.seed, options.items, options.repeat, make_args, options.label)
+        print(f"Recorded run {run_id} in {options.db}")
+        if not options.compare:
+            return 1 if any(r["status"] != "PASS" for r in results.values()) else 0
+    else:
+        run_id = options.run
+    report = compare(db, run_id, options.last, options.threshold)
+    if report is None:
+        parser.error("no such run in the history")
+    print_comparison(report)
+    return 1 if any(r["regression"] for r in report["rows"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
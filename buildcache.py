@@ -0,0 +1,270 @@
+"""
+buildcache: Content-hashed simulator build cache shared across regressions.
+
+Every run of regression.py builds into its own SIM_BUILD, so a clean
+output directory (or every seed shard of a bench) pays for the Verilator
+C++ compile again. BuildCache keys a finished sim_build by a SHA-256 of:
+
+- the HDL source contents (VERILOG_SOURCES / VHDL_SOURCES, in order)
+- SIM, TOPLEVEL_LANG and the toplevel (COCOTB_TOPLEVEL / TOPLEVEL)
+- COMPILE_ARGS and EXTRA_ARGS as cocotb's simulator makefile expands them,
+  the Verilator version and the cocotb version
+
+The values come from the bench Makefile itself (a print-build-key target
+read from stdin), so make variables passed on the command line are taken
+into account. On a hit, the cached model is copied into the run's
+SIM_BUILD with fresh timestamps, and make finds it up to date. On a miss,
+the model make builds is stored for the next run. Object files are not
+cached, only what make needs to consider the build done.
+
+Builds that read files from SIM_BUILD itself (Icarus with WAVES=1) and
+builds with missing sources are not cached.
+
+Usage:
+    python3 buildcache.py            # entries, size and hit/miss statistics
+    python3 buildcache.py --clear    # empty the cache
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from importlib import metadata
+
+REPO = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE = os.path.join(REPO, ".sim_build_cache")
+
+KEY_VARS = ("SIM", "TOPLEVEL_LANG", "COCOTB_TOPLEVEL", "TOPLEVEL", "VERILOG_SOURCES",
+            "VHDL_SOURCES", "COMPILE_ARGS", "EXTRA_ARGS", "VLT_VERSION")
+SOURCE_VARS = ("VERILOG_SOURCES", "VHDL_SOURCES")
+# File that marks a finished build, per simulator
+MODELS = {"verilator": "Vtop", "icarus": "sim.vvp"}
+# Placeholder SIM_BUILD for the key probe, so keys do not depend on the run directory
+SIM_BUILD_PROBE = "@SIM_BUILD@"
+KEY_FILE = ".build_key"
+NOT_CACHED = ("*.o", "*.a", "*.d")
+
+_PRINT_BUILD_KEY = "print-build-key:\n" + "".join(
+    f"\t$(info {name}=$({name}))\n" for name in KEY_VARS) + "\t@:\n"
+
+
+def build_inputs(path, make_args=()):
+    """
+    Ask the bench Makefile for the variables that determine its build.
+
+    Returns:
+        Dict KEY_VARS name -> expanded value, or None if make fails
+    """
+    make_args = [a for a in make_args if not a.startswith(("SIM_BUILD=", "COCOTB_RESULTS_FILE="))]
+    cmd = ["make", "-s", "--no-print-directory", "-f", "Makefile", "-f", "-",
+           f"SIM_BUILD={SIM_BUILD_PROBE}", *make_args, "print-build-key"]
+    try:
+        probe = subprocess.run(cmd, input=_PRINT_BUILD_KEY, cwd=path, env=dict(os.environ, PWD=path),
+                               capture_output=True, text=True, timeout=120)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if probe.returncode != 0:
+        return None
+    values = {}
+    for line in probe.stdout.splitlines():
+        name, sep, value = line.partition("=")
+        if sep and name in KEY_VARS:
+            values[name] = value.strip()
+    return values
+
+
+def build_key(path, inputs):
+    """
+    SHA-256 of the build inputs and source contents.
+
+    Returns:
+        Hex digest, or None if the build is not cacheable
+    """
+    if inputs is None or SIM_BUILD_PROBE in inputs.get("VERILOG_SOURCES", ""):
+        return None
+    digest = hashlib.sha256()
+    description = {name: inputs.get(name, "") for name in KEY_VARS if name not in SOURCE_VARS}
+    description["cocotb"] = metadata.version("cocotb")
+    for var in SOURCE_VARS:
+        names = []
+        for source in inputs.get(var, "").split():
+            try:
+                with open(os.path.join(path, source), "rb") as f:
+                    digest.update(f.read())
+            except OSError:
+                return None
+            names.append(os.path.basename(source))
+        description[var] = names
+    digest.update(json.dumps(description, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def _touch_tree(path):
+    """Give every file under path the same, current mtime (newer than the sources)."""
+    now = time.time()
+    for dirpath, _, files in os.walk(path):
+        for name in files:
+            os.utime(os.path.join(dirpath, name), (now, now))
+
+
+class BuildCache:
+    """
+    Directory of finished sim_build trees, one per build key.
+
+    Attributes:
+        hits, misses: Lookups of cacheable builds in this session
+        uncacheable: Benches whose build could not be keyed
+        stored: Builds added to the cache in this session
+    """
+
+    def __init__(self, root=DEFAULT_CACHE):
+        self.root = os.path.abspath(root)
+        os.makedirs(self.root, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self.stored = 0
+        self._lock = threading.Lock()
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def prepare(self, path, sim_build, make_args=()):
+        """
+        Look up the bench build and fill sim_build on a hit.
+
+        On a miss the stale model in sim_build is removed, so that store()
+        only ever caches a model make has just built.
+
+        Returns:
+            Tuple (state, key, model): state is "hit", "miss" or
+            "uncacheable"; model is the file marking a finished build
+        """
+        inputs = build_inputs(path, make_args)
+        key = build_key(path, inputs)
+        model = MODELS.get((inputs or {}).get("SIM", "").lower())
+        if key is None or model is None:
+            self._count("uncacheable")
+            return "uncacheable", None, None
+
+        entry = os.path.join(self.root, key)
+        if os.path.isfile(os.path.join(entry, model)):
+            if self._key_of(sim_build) != key:
+                if os.path.exists(sim_build):
+                    shutil.rmtree(sim_build)
+                shutil.copytree(entry, sim_build)
+            _touch_tree(sim_build)
+            self._count("hits")
+            return "hit", key, model
+
+        for name in (model, KEY_FILE):
+            if os.path.exists(os.path.join(sim_build, name)):
+                os.remove(os.path.join(sim_build, name))
+        self._count("misses")
+        return "miss", key, model
+
+    def store(self, key, sim_build, model, bench=""):
+        """
+        Add a freshly built sim_build to the cache (no-op if make did not
+        produce the model, or another run stored the key first).
+        """
+        if not os.path.isfile(os.path.join(sim_build, model)):
+            return False
+        with open(os.path.join(sim_build, KEY_FILE), "w") as f:
+            f.write(key)
+        entry = os.path.join(self.root, key)
+        if os.path.isdir(entry):
+            return False
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=self.root)
+        try:
+            shutil.copytree(sim_build, tmp, dirs_exist_ok=True, ignore=shutil.ignore_patterns(*NOT_CACHED))
+            with open(os.path.join(tmp, ".build_meta.json"), "w") as f:
+                json.dump({"bench": bench, "created": time.strftime("%Y-%m-%d %H:%M:%S")}, f)
+            os.rename(tmp, entry)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            return False
+        self._count("stored")
+        return True
+
+    @staticmethod
+    def _key_of(sim_build):
+        try:
+            with open(os.path.join(sim_build, KEY_FILE)) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def stats(self):
+        """Session counters plus the totals saved by earlier sessions."""
+        totals = self._load_totals()
+        session = {"hits": self.hits, "misses": self.misses,
+                   "uncacheable": self.uncacheable, "stored": self.stored}
+        return {"dir": self.root, "session": session,
+                "total": {name: totals.get(name, 0) + n for name, n in session.items()}}
+
+    def save_stats(self):
+        """Add the session counters to stats.json in the cache directory."""
+        total = self.stats()["total"]
+        with open(os.path.join(self.root, "stats.json"), "w") as f:
+            json.dump(total, f, indent=2)
+        self.hits = self.misses = self.uncacheable = self.stored = 0
+
+    def _load_totals(self):
+        try:
+            with open(os.path.join(self.root, "stats.json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def entries(self):
+        """Dict key -> (bench, size in bytes) of every cached build."""
+        entries = {}
+        for key in sorted(os.listdir(self.root)):
+            entry = os.path.join(self.root, key)
+            if key.startswith(".") or not os.path.isdir(entry):
+                continue
+            size = sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(entry) for f in files)
+            try:
+                with open(os.path.join(entry, ".build_meta.json")) as f:
+                    bench = json.load(f).get("bench", "")
+            except (OSError, ValueError):
+                bench = ""
+            entries[key] = (bench, size)
+        return entries
+
+    def clear(self):
+        """Remove every cached build and the statistics."""
+        shutil.rmtree(self.root)
+        os.makedirs(self.root)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show or clear the simulator build cache.")
+    parser.add_argument("--cache", default=DEFAULT_CACHE, help="cache directory (default: .sim_build_cache/)")
+    parser.add_argument("--clear", action="store_true", help="remove every cached build")
+    options = parser.parse_args(argv)
+
+    cache = BuildCache(options.cache)
+    if options.clear:
+        cache.clear()
+        print(f"Cleared {cache.root}")
+        return 0
+    entries = cache.entries()
+    for key, (bench, size) in entries.items():
+        print(f"{key[:16]}  {size / 1e6:8.1f} MB  {bench}")
+    total = cache.stats()["total"]
+    print(f"{len(entries)} builds, {sum(s for _, s in entries.values()) / 1e6:.1f} MB in {cache.root}")
+    print(f"{total['hits']} hits, {total['misses']} misses, {total['uncacheable']} uncacheable, "
+          f"{total['stored']} stored")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+"""
+covmerge: Merge coverage DBs of many runs and find the seeds that matter.
+
+Every PyUVM run writes the per-bin counts of its covergroup to COVERAGE_DB
+(default: <bench>/coverage_db/<covergroup>-seed<seed>.json, see
+Common/CoverageDB.py). covmerge reads any number of these files or
+directories, merges the DBs of each covergroup and prints the merged
+report:
+
+    python3 covmerge.py PyUVM/ip-cores-pyuvm/Mealy/coverage_db
+    python3 covmerge.py PyUVM/ip-cores-pyuvm/*/coverage_db -o merged/   # one merged DB per covergroup
+    python3 covmerge.py Mux/coverage_db --details                       # every bin and its count
+
+Seed pruning:
+
+    python3 covmerge.py Mux/coverage_db --unique            # bins each seed hit on its own
+    python3 covmerge.py Mux/coverage_db --only-seed 1234    # which bins only seed 1234 hit
+    python3 covmerge.py Mux/coverage_db --minimize          # small seed set, same coverage
+
+Runs of the same seed (e.g. different sequences) are merged before the
+seeds are compared.
+"""
+
+import argparse
+import os
+import sys
+from collections import defaultdict
+
+from regression import REPO
+
+sys.path.insert(0, os.path.join(REPO, "PyUVM", "ip-cores-pyuvm", "Common"))
+import CoverageDB  # noqa: E402
+
+
+def load(paths):
+    """
+    Read the DBs in paths (files, or directories of *.json files).
+
+    Returns:
+        Dict covergroup -> list of DBs, and the list of unreadable files
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if name.endswith(".json"))
+        else:
+            files.append(path)
+    groups = defaultdict(list)
+    bad = []
+    for path in files:
+        db = CoverageDB.read(path)
+        if db is None or "items" not in db:
+            bad.append(path)
+            continue
+        groups[db["covergroup"]].append(db)
+    return dict(groups), bad
+
+
+def by_seed(dbs):
+    """Merge the DBs of each seed; returns DBs in order of first appearance."""
+    seeds = defaultdict(list)
+    for db in dbs:
+        seeds[CoverageDB.label(db)].append(db)
+    return [group[0] if len(group) == 1 else CoverageDB.merge(group) for group in seeds.values()]
+
+
+def print_unique(dbs, only_seed=None, out=sys.stdout):
+    """Per seed: samples, own coverage and the bins no other seed hit."""
+    unique = CoverageDB.unique_bins(dbs)
+    if only_seed is not None:
+        for db, bins in zip(dbs, unique):
+            if CoverageDB.label(db) == only_seed:
+                total = sum(len(names) for names in bins.values())
+                out.write(f"    Bins hit only by seed {only_seed}: {total}\n")
+                for name, names in bins.items():
+                    for b in names:
+                        out.write(f"        {name} {b}\n")
+                return
+        out.write(f"    No run with seed {only_seed}\n")
+        return
+    out.write(f"    {'Seed':>12}  {'Samples':>8}  {'Coverage':>8}  {'Unique bins':>11}\n")
+    for db, bins in zip(dbs, unique):
+        total = sum(len(names) for names in bins.values())
+        out.write(f"    {CoverageDB.label(db):>12}  {db.get('samples', 0):8}  {db['coverage']:7.2f}%  "
+                  f"{total:11}{'' if total else '  (redundant)'}\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge coverage DBs and report the bins hit per seed.")
+    parser.add_argument("paths", nargs="+", help="coverage DB files or directories")
+    parser.add_argument("-o", "--out", default=None,
+                        help="directory for the merged DBs (<covergroup>.json)")
+    parser.add_argument("--details", action="store_true", help="list every bin and its merged count")
+    parser.add_argument("--unique", action="store_true", help="count the bins each seed hit on its own")
+    parser.add_argument("--only-seed", default=None, metavar="SEED", help="list the bins only SEED hit")
+    parser.add_argument("--minimize", action="store_true",
+                        help="pick a small set of seeds with the same merged coverage")
+    options = parser.parse_args(argv)
+
+    groups, bad = load(options.paths)
+    for path in bad:
+        print(f"Skipping {path}: not a coverage DB", file=sys.stderr)
+    if not groups:
+        parser.error("no coverage DB found")
+    if options.out:
+        os.makedirs(options.out, exist_ok=True)
+
+    status = 0
+    for covergroup, dbs in sorted(groups.items()):
+        try:
+            merged = CoverageDB.merge(dbs)
+        except ValueError as e:
+            print(f"{covergroup}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        print(CoverageDB.report(merged, options.details))
+        if options.out:
+            CoverageDB.write(os.path.join(options.out, f"{covergroup}.json"), merged)
+
+        seeds = by_seed(dbs)
+        if options.unique or options.only_seed is not None:
+            print_unique(seeds, options.only_seed)
+        if options.minimize:
+            keep = CoverageDB.minimal_runs(seeds)
+            print(f"    {len(keep)} of {len(seeds)} seeds reach {merged['coverage']:.2f}%: "
+                  + " ".join(CoverageDB.label(seeds[i]) for i in keep))
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,399 @@
+"""
+regression: Parallel regression runner for every cocotb / PyUVM bench.
+
+Each bench is a directory under PyUVM/ip-cores-pyuvm or CocoTb/ip-cores-cocotb
+whose Makefile includes cocotb's Makefile.sim. The runner discovers them,
+runs `make` in each one on a pool of workers (one per available core by
+default) and merges the results.
+
+Every run is isolated under the output directory (default: regression/):
+
+    regression/
+    ├── PyUVM/Mux/
+    │   ├── sim_build/       # SIM_BUILD of this run
+    │   ├── results.xml      # COCOTB_RESULTS_FILE of this run
+    │   ├── scoreboard.json  # scoreboard pass/fail totals (SCOREBOARD_RESULTS)
+    │   └── console.log      # make stdout + stderr
+    ├── ...
+    ├── results.xml          # merged JUnit report, one testsuite per bench
+    └── report.json          # per-bench status, test counts and wall time
+
+Compiled models are shared across runs through the content-hashed build
+cache (buildcache.py, default .sim_build_cache/): a bench whose sources,
+toplevel and flags were built before skips the compile step.
+
+Benches run with WAVE_CAPTURE=fail by default: no waveform tracing, and
+when a PyUVM bench fails, its failure window (the last transactions before
+the first scoreboard FAIL) is replayed with waves on, into <bench>/waves/.
+
+Benches are started longest first, using the wall times of the previous
+report.json, so the suite wall time approaches that of the longest bench
+instead of the sum of all benches.
+
+Usage:
+    python3 regression.py                       # every bench
+    python3 regression.py -j 4 PyUVM/           # PyUVM benches, 4 workers
+    python3 regression.py --list
+    python3 regression.py SEQUENCE=exhaustive   # VAR=value is passed to make
+    python3 regression.py --no-cache            # always compile
+    python3 regression.py --waves always        # trace every run
+
+test_regression.py runs HalfAdder on SIM=python, passing and with a seeded
+mismatch, and checks the status and the replayed waves.
+"""
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from buildcache import BuildCache, DEFAULT_CACHE
+
+REPO = os.path.dirname(os.path.abspath(__file__))
+BENCH_ROOTS = ("PyUVM/ip-cores-pyuvm", "CocoTb/ip-cores-cocotb")
+
+
+def available_cores():
+    """CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def discover(repo=REPO):
+    """
+    Find every bench directory.
+
+    Returns:
+        Dict bench name (e.g. "PyUVM/Mux") -> absolute directory, sorted
+    """
+    benches = {}
+    for root in BENCH_ROOTS:
+        base = os.path.join(repo, root)
+        if not os.path.isdir(base):
+            continue
+        for entry in sorted(os.listdir(base)):
+            makefile = os.path.join(base, entry, "Makefile")
+            if not os.path.isfile(makefile):
+                continue
+            with open(makefile) as f:
+                if "Makefile.sim" not in f.read():
+                    continue
+            benches[f"{root.split('/')[0]}/{entry}"] = os.path.join(base, entry)
+    return benches
+
+
+def select(benches, patterns):
+    """Keep the benches whose name starts with or equals one of patterns."""
+    if not patterns:
+        return benches
+    return {name: path for name, path in benches.items()
+            if any(name == p or name.startswith(p) or name.split("/")[1] == p for p in patterns)}
+
+
+def parse_results(path):
+    """
+    Count the test cases of a cocotb results.xml.
+
+    Returns:
+        Dict with tests, failures and skipped, plus the failing test names
+        (None if the file is missing or unreadable)
+    """
+    try:
+        tree = ET.parse(path)
+    except (OSError, ET.ParseError):
+        return None
+    tests = failures = skipped = 0
+    failed = []
+    for case in tree.iter("testcase"):
+        tests += 1
+        if case.find("failure") is not None or case.find("error") is not None:
+            failures += 1
+            failed.append(case.get("name"))
+        elif case.find("skipped") is not None:
+            skipped += 1
+    return {"tests": tests, "failures": failures, "skipped": skipped, "failed": failed}
+
+
+def read_scoreboard(path):
+    """
+    Scoreboard totals a PyUVM bench wrote to SCOREBOARD_RESULTS.
+
+    Returns:
+        Dict with passed and failed (None if the file is missing or
+        unreadable, as for the CocoTb benches)
+    """
+    try:
+        with open(path) as f:
+            totals = json.load(f)
+        return {"passed": totals["passed"], "failed": totals["failed"]}
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def wave_capture(make_args):
+    """WAVE_CAPTURE mode given in make_args (the last one wins, as in make)."""
+    modes = [a.partition("=")[2] for a in make_args if a.startswith("WAVE_CAPTURE=")]
+    return modes[-1] if modes else None
+
+
+def replay_window(path, run_dir, make_args, timeout=None):
+    """
+    Replay the failure window of a WAVE_CAPTURE=fail run with waves on.
+
+    The replay builds its own, tracing model in <run_dir>/sim_build_waves
+    and its console log and results go to <run_dir>/waves/, together with
+    the wave files.
+
+    Returns:
+        Wave files, relative to run_dir
+    """
+    waves_dir = os.path.join(run_dir, "waves")
+    sim_build = os.path.join(run_dir, "sim_build_waves")
+    os.makedirs(waves_dir, exist_ok=True)
+    make_args = [a for a in make_args if not a.startswith(("WAVE_CAPTURE=", "WAVE_WINDOW_FILE="))]
+    cmd = ["make", f"SIM_BUILD={sim_build}", f"COCOTB_RESULTS_FILE={os.path.join(waves_dir, 'results.xml')}",
+           *make_args, "WAVE_CAPTURE=replay", f"WAVE_WINDOW_FILE={os.path.join(run_dir, 'wave_window.json')}"]
+    # Verilator writes dump.vcd / dump.fst to the bench directory, Icarus to SIM_BUILD
+    dumps = [os.path.join(path, f"dump.{ext}") for ext in ("vcd", "fst")]
+    for dump in dumps:
+        if os.path.exists(dump):
+            os.remove(dump)
+    with open(os.path.join(waves_dir, "console.log"), "w") as log:
+        try:
+            subprocess.run(cmd, cwd=path, env=dict(os.environ, PWD=path), stdout=log,
+                           stderr=subprocess.STDOUT, timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            log.write(f"{e}\n")
+    waves = []
+    for dump in dumps + glob.glob(os.path.join(sim_build, "*.fst")) + glob.glob(os.path.join(sim_build, "*.vcd")):
+        if os.path.exists(dump):
+            target = os.path.join(waves_dir, os.path.basename(dump))
+            shutil.move(dump, target)
+            waves.append(os.path.relpath(target, run_dir))
+    return waves
+
+
+def run_bench(name, path, out_dir, make_args=(), timeout=None, cache=None):
+    """
+    Run one bench with its own SIM_BUILD and COCOTB_RESULTS_FILE.
+
+    Args:
+        name: Bench name (output subdirectory)
+        path: Bench directory (make runs there)
+        out_dir: Regression output directory
+        make_args: Extra VAR=value make arguments
+        timeout: Seconds before the bench is killed (None = no limit)
+        cache: BuildCache to restore / store the compiled model (None = off)
+
+    With WAVE_CAPTURE=fail in make_args, a run whose scoreboard saved a
+    failure window is replayed with waves on (replay_window()).
+
+    Returns:
+        Result dict (see report.json)
+    """
+    run_dir = os.path.join(out_dir, name)
+    sim_build = os.path.join(run_dir, "sim_build")
+    os.makedirs(run_dir, exist_ok=True)
+    results_file = os.path.join(run_dir, "results.xml")
+    window_file = os.path.join(run_dir, "wave_window.json")
+    scoreboard_file = os.path.join(run_dir, "scoreboard.json")
+    for stale in (results_file, window_file, scoreboard_file):
+        if os.path.exists(stale):
+            os.remove(stale)
+    cmd = ["make", f"SIM_BUILD={sim_build}",
+           f"COCOTB_RESULTS_FILE={results_file}", f"WAVE_WINDOW_FILE={window_file}", *make_args]
+    # The PyUVM Makefiles locate their sources through $(PWD)
+    env = dict(os.environ, PWD=path, SCOREBOARD_RESULTS=scoreboard_file)
+
+    start = time.perf_counter()
+    build, key, model = "off", None, None
+    if cache is not None:
+        build, key, model = cache.prepare(path, sim_build, make_args)
+    with open(os.path.join(run_dir, "console.log"), "w") as log:
+        try:
+            returncode = subprocess.run(cmd, cwd=path, env=env, stdout=log,
+                                        stderr=subprocess.STDOUT, timeout=timeout).returncode
+        except subprocess.TimeoutExpired:
+            returncode = None
+        except OSError as e:
+            log.write(f"{e}\n")
+            returncode = -1
+    wall = time.perf_counter() - start
+    if build == "miss":
+        cache.store(key, sim_build, model, name)
+
+    counts = parse_results(results_file)
+    checks = read_scoreboard(scoreboard_file)
+    if returncode is None:
+        status = "TIMEOUT"
+    elif counts is None:
+        status = "ERROR"
+    elif returncode != 0 or counts["failures"] or counts["tests"] == 0 or (checks and checks["failed"]):
+        status = "FAIL"
+    else:
+        status = "PASS"
+    waves = []
+    # The scoreboard writes the window on its first FAIL
+    if wave_capture(make_args) == "fail" and os.path.exists(window_file):
+        waves = replay_window(path, run_dir, make_args, timeout)
+    result = {"bench": name, "status": status, "returncode": returncode, "wall_s": round(wall, 3),
+              "build": build, "dir": os.path.relpath(run_dir, out_dir), "waves": waves, "checks": checks}
+    result.update(counts or {"tests": 0, "failures": 0, "skipped": 0, "failed": []})
+    return result
+
+
+def previous_times(out_dir):
+    """Bench wall times of the last report.json in out_dir (empty if none)."""
+    try:
+        with open(os.path.join(out_dir, "report.json")) as f:
+            return {r["bench"]: r["wall_s"] for r in json.load(f)["benches"]}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def merge_results(results, out_dir):
+    """Write results.xml with one testsuite per bench (named after it)."""
+    merged = ET.Element("testsuites", name="regression")
+    for result in results:
+        path = os.path.join(out_dir, result["dir"], "results.xml")
+        try:
+            suites = ET.parse(path).getroot().iter("testsuite")
+        except (OSError, ET.ParseError):
+            suite = ET.SubElement(merged, "testsuite", name=result["bench"], package=result["bench"])
+            case = ET.SubElement(suite, "testcase", name=result["bench"], classname=result["bench"],
+                                 time=str(result["wall_s"]))
+            ET.SubElement(case, "error", message=f"{result['status']}: no results.xml")
+            continue
+        for suite in suites:
+            suite.set("name", result["bench"])
+            suite.set("package", result["bench"])
+            merged.append(suite)
+    ET.indent(merged)
+    ET.ElementTree(merged).write(os.path.join(out_dir, "results.xml"), encoding="unicode")
+
+
+def run_regression(benches, out_dir, jobs=None, make_args=(), timeout=None, cache=None, log=print):
+    """
+    Run benches on a pool of jobs workers and write the merged reports.
+
+    Args:
+        benches: Dict name -> directory (see discover())
+        out_dir: Output directory
+        jobs: Concurrent benches (default: available cores)
+        make_args: Extra VAR=value make arguments, for every bench
+        timeout: Per-bench timeout in seconds
+        cache: BuildCache shared by the benches (None = always compile)
+        log: Progress output function
+
+    Returns:
+        Report dict (also written to report.json)
+    """
+    out_dir = os.path.abspath(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = jobs or available_cores()
+    history = previous_times(out_dir)
+    # Longest first (unknown benches first of all): the pool drains evenly
+    order = sorted(benches, key=lambda name: -history.get(name, float("inf")))
+
+    start = time.perf_counter()
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_bench, name, benches[name], out_dir, make_args, timeout, cache)
+                   for name in order]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            log(f"[{len(results)}/{len(order)}] {result['status']:7} {result['bench']} "
+                f"({result['wall_s']:.1f} s, build {result['build']})")
+    wall = time.perf_counter() - start
+
+    results.sort(key=lambda r: r["bench"])
+    serial = sum(r["wall_s"] for r in results)
+    report = {
+        "jobs": jobs,
+        "make_args": list(make_args),
+        "wall_s": round(wall, 3),
+        "serial_s": round(serial, 3),
+        "longest_s": max((r["wall_s"] for r in results), default=0.0),
+        "passed": sum(r["status"] == "PASS" for r in results),
+        "failed": sum(r["status"] != "PASS" for r in results),
+        "build_cache": cache.stats() if cache is not None else None,
+        "benches": results,
+    }
+    if cache is not None:
+        cache.save_stats()
+    with open(os.path.join(out_dir, "report.json"), "w") as f:
+        json.dump(report, f, indent=2)
+    merge_results(results, out_dir)
+    return report
+
+
+def print_report(report, out=sys.stdout):
+    """Print the merged pass/fail and timing table."""
+    width = max([len(r["bench"]) for r in report["benches"]] + [5])
+    out.write(f"\n{'Bench':{width}}  {'Status':7}  {'Tests':>5}  {'Failed':>6}  {'Wall (s)':>8}  Build\n")
+    out.write(f"{'-' * width}  {'-' * 7}  {'-' * 5}  {'-' * 6}  {'-' * 8}  {'-' * 11}\n")
+    for r in report["benches"]:
+        out.write(f"{r['bench']:{width}}  {r['status']:7}  {r['tests']:5}  {r['failures']:6}  {r['wall_s']:8.1f}  "
+                  f"{r['build']}\n")
+        for test in r["failed"]:
+            out.write(f"{'':{width}}    failed: {test}\n")
+        checks = r.get("checks")
+        if checks and checks["failed"]:
+            out.write(f"{'':{width}}    checks: {checks['failed']} of {checks['passed'] + checks['failed']} failed\n")
+        for wave in r.get("waves", []):
+            out.write(f"{'':{width}}    waves:  {os.path.join(r['dir'], wave)}\n")
+    speedup = report["serial_s"] / report["wall_s"] if report["wall_s"] else 0.0
+    out.write(
+        f"\n{report['passed']} passed, {report['failed']} failed on {report['jobs']} workers: "
+        f"wall {report['wall_s']:.1f} s (sum of benches {report['serial_s']:.1f} s, "
+        f"longest bench {report['longest_s']:.1f} s, speedup {speedup:.1f}x)\n")
+    if report["build_cache"]:
+        session = report["build_cache"]["session"]
+        out.write(f"Build cache: {session['hits']} hits, {session['misses']} misses, "
+                  f"{session['uncacheable']} uncacheable ({report['build_cache']['dir']})\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run every cocotb / PyUVM bench in parallel.")
+    parser.add_argument("args", nargs="*", metavar="BENCH|VAR=value",
+                        help="bench names or prefixes (e.g. PyUVM/, Mux), and make variables")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="concurrent benches (default: available cores)")
+    parser.add_argument("-o", "--out", default=os.path.join(REPO, "regression"),
+                        help="output directory (default: regression/)")
+    parser.add_argument("--timeout", type=float, default=None, help="per-bench timeout in seconds")
+    parser.add_argument("--cache", default=DEFAULT_CACHE, help="build cache directory (default: .sim_build_cache/)")
+    parser.add_argument("--no-cache", action="store_true", help="always compile, without the build cache")
+    parser.add_argument("--waves", choices=("fail", "always"), default="fail",
+                        help="WAVE_CAPTURE mode: replay failure windows with waves (default), or trace every run")
+    parser.add_argument("--list", action="store_true", help="list the benches and exit")
+    options = parser.parse_args(argv)
+
+    make_args = [a for a in options.args if "=" in a]
+    patterns = [a for a in options.args if "=" not in a]
+    benches = select(discover(), patterns)
+    if options.list:
+        for name, path in benches.items():
+            print(f"{name:20} {os.path.relpath(path, REPO)}")
+        return 0
+    if not benches:
+        parser.error("no bench matches " + " ".join(patterns))
+
+    if wave_capture(make_args) is None:
+        make_args.insert(0, f"WAVE_CAPTURE={options.waves}")
+    cache = None if options.no_cache else BuildCache(options.cache)
+    report = run_regression(benches, options.out, options.jobs, make_args, options.timeout, cache)
+    print_report(report)
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+shards: Run K seeds of one PyUVM bench in parallel against a merged coverage goal.
+
+The coverage-driven MySequence of a single run keeps going until its own
+coverage reaches 100%. shards.py starts K copies of one bench, each with a
+distinct COCOTB_RANDOM_SEED, and treats their coverage as one:
+
+1. the bench is compiled once (through the build cache), and all shards run
+   the same model from a shared SIM_BUILD
+2. every COVERAGE_SYNC_EVERY samples each shard writes its per-bin counts to
+   its coverage DB (CoverageClosure / CoverageDB)
+3. the runner merges the DBs while the shards run; once the merged coverage
+   reaches the target it creates the stop file, every shard ends its
+   stimulus, and its scoreboard and report phases run as usual
+4. the merged coverage DB and the added-up scoreboard counts are reported
+
+Output (default: regression/shards/<bench>/):
+
+    shard0/ ... shard<K-1>/   # results.xml, console.log, coverage.json, scoreboard.json
+    sim_build/                # shared model
+    coverage.json             # merged coverage DB
+    report.json               # per-shard and merged results
+
+Usage:
+    python3 shards.py Mealy -k 8
+    python3 shards.py Mux -k 4 --seed 1 COVERAGE_ENGINE=native SEQUENCE=holes
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from regression import REPO, available_cores, discover, parse_results, select
+from buildcache import BuildCache, DEFAULT_CACHE, MODELS, build_inputs
+
+sys.path.insert(0, os.path.join(REPO, "PyUVM", "ip-cores-pyuvm", "Common"))
+import CoverageDB  # noqa: E402
+
+
+def prebuild(name, path, sim_build, make_args, cache, log_path):
+    """
+    Compile the bench model once into sim_build (or restore it from cache).
+    A simulator without a compiled model (SIM=python) needs no prebuild.
+
+    Returns:
+        Build state ("hit", "miss", "off", or "none" without a compiled model)
+
+    Raises:
+        RuntimeError: make failed; its output is in log_path
+    """
+    inputs = build_inputs(path, make_args)
+    if inputs is None:
+        # The Makefile itself fails (e.g. simulator not installed): log why
+        with open(log_path, "w") as log:
+            subprocess.run(["make", "-n", f"SIM_BUILD={sim_build}", *make_args],
+                           cwd=path, env=dict(os.environ, PWD=path), stdout=log, stderr=subprocess.STDOUT)
+        raise RuntimeError(f"{name}: make failed, see {log_path}")
+    model = MODELS.get(inputs.get("SIM", "").lower())
+    if model is None:
+        return "none"
+    state, key = "off", None
+    if cache is not None:
+        state, key, _ = cache.prepare(path, sim_build, make_args)
+        if state == "hit":
+            return state
+    with open(log_path, "w") as log:
+        returncode = subprocess.run(
+            ["make", f"SIM_BUILD={sim_build}", *make_args, os.path.join(sim_build, model)],
+            cwd=path, env=dict(os.environ, PWD=path), stdout=log, stderr=subprocess.STDOUT).returncode
+    if returncode != 0:
+        raise RuntimeError(f"{name}: build failed, see {log_path}")
+    if state == "miss":
+        cache.store(key, sim_build, model, name)
+    return state
+
+
+def start_shard(path, shard_dir, sim_build, seed, stop_file, make_args, sync_every):
+    """Launch one shard; returns (Popen, console log file)."""
+    os.makedirs(shard_dir, exist_ok=True)
+    for stale in ("results.xml", "coverage.json", "scoreboard.json"):
+        if os.path.exists(os.path.join(shard_dir, stale)):
+            os.remove(os.path.join(shard_dir, stale))
+    env = dict(os.environ, PWD=path,
+               COCOTB_RANDOM_SEED=str(seed),
+               COVERAGE_DB=os.path.join(shard_dir, "coverage.json"),
+               COVERAGE_STOP_FILE=stop_file,
+               COVERAGE_SYNC_EVERY=str(sync_every),
+               SCOREBOARD_RESULTS=os.path.join(shard_dir, "scoreboard.json"))
+    cmd = ["make", f"SIM_BUILD={sim_build}",
+           f"COCOTB_RESULTS_FILE={os.path.join(shard_dir, 'results.xml')}", *make_args]
+    log = open(os.path.join(shard_dir, "console.log"), "w")
+    return subprocess.Popen(cmd, cwd=path, env=env, stdout=log, stderr=subprocess.STDOUT), log
+
+
+def run_shards(name, path, out_dir, k, seed, target=100.0, make_args=(), sync_every=256,
+               poll=0.5, timeout=None, cache=None, log=print):
+    """
+    Run k shards of one bench until the merged coverage reaches target.
+
+    Args:
+        name: Bench name (e.g. "PyUVM/Mealy")
+        path: Bench directory
+        out_dir: Output directory
+        k: Number of shards
+        seed: Seed of shard 0; shard i uses seed + i
+        target: Merged coverage goal (percent)
+        make_args: Extra VAR=value make arguments
+        sync_every: COVERAGE_SYNC_EVERY of the shards (samples)
+        poll: Seconds between merges of the shard DBs
+        timeout: Seconds before the shards are asked to stop regardless
+        cache: BuildCache for the shared model (None = always compile)
+        log: Progress output function
+
+    Returns:
+        Report dict (also written to report.json)
+    """
+    out_dir = os.path.abspath(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    sim_build = os.path.join(out_dir, "sim_build")
+    stop_file = os.path.join(out_dir, "STOP")
+    if os.path.exists(stop_file):
+        os.remove(stop_file)
+
+    start = time.perf_counter()
+    build = prebuild(name, path, sim_build, make_args, cache, os.path.join(out_dir, "build.log"))
+    build_s = time.perf_counter() - start
+    model = "no compiled model" if build == "none" else f"model {build} ({build_s:.1f} s)"
+    log(f"{name}: {model}, starting {k} shards from seed {seed}")
+
+    shard_dirs = [os.path.join(out_dir, f"shard{i}") for i in range(k)]
+    shards = [start_shard(path, shard_dirs[i], sim_build, seed + i, stop_file, make_args, sync_every)
+              for i in range(k)]
+    run_start = time.perf_counter()
+    ended = [None] * k
+    closure_s = None
+    merged = None
+    last_coverage = -1.0
+    while not all(ended):
+        time.sleep(poll)
+        now = time.perf_counter() - run_start
+        for i, (proc, _) in enumerate(shards):
+            if ended[i] is None and proc.poll() is not None:
+                ended[i] = now
+        dbs = [CoverageDB.read(os.path.join(d, "coverage.json")) for d in shard_dirs]
+        merged = CoverageDB.merge(dbs) or merged
+        if merged and merged["coverage"] > last_coverage:
+            last_coverage = merged["coverage"]
+            log(f"[{now:6.1f} s] merged coverage {merged['coverage']:.2f}% "
+                f"({sum(db is not None for db in dbs)}/{k} shards, {merged['samples']} samples)")
+        if closure_s is None and merged and merged["coverage"] >= target:
+            closure_s = now
+            open(stop_file, "w").close()
+            log(f"[{now:6.1f} s] target {target:.2f}% reached, stopping all shards")
+        elif timeout is not None and now > timeout and not os.path.exists(stop_file):
+            open(stop_file, "w").close()
+            log(f"[{now:6.1f} s] timeout, stopping all shards")
+        elif timeout is not None and now > 2 * timeout:
+            for proc, _ in shards:
+                if proc.poll() is None:
+                    proc.kill()
+    for _, f in shards:
+        f.close()
+    wall = time.perf_counter() - run_start
+
+    dbs = [CoverageDB.read(os.path.join(d, "coverage.json")) for d in shard_dirs]
+    merged = CoverageDB.merge(dbs)
+    if merged is not None:
+        CoverageDB.write(os.path.join(out_dir, "coverage.json"), merged)
+    results = []
+    for i, d in enumerate(shard_dirs):
+        counts = parse_results(os.path.join(d, "results.xml"))
+        try:
+            with open(os.path.join(d, "scoreboard.json")) as f:
+                scoreboard = json.load(f)
+        except (OSError, ValueError):
+            scoreboard = {"passed": 0, "failed": 0}
+        db = dbs[i] or {}
+        ok = shards[i][0].returncode == 0 and counts is not None and counts["tests"] and not counts["failures"]
+        results.append({"shard": i, "seed": seed + i, "status": "PASS" if ok else "FAIL",
+                        "wall_s": round(ended[i], 3), "samples": db.get("samples", 0),
+                        "coverage": db.get("coverage", 0.0),
+                        "passed": scoreboard["passed"], "failed": scoreboard["failed"]})
+
+    report = {
+        "bench": name, "shards": k, "seed": seed, "target": target, "build": build,
+        "build_s": round(build_s, 3), "wall_s": round(wall, 3),
+        "closure_s": None if closure_s is None else round(closure_s, 3),
+        "coverage": merged["coverage"] if merged else 0.0,
+        "samples": merged["samples"] if merged else 0,
+        "passed": sum(r["passed"] for r in results),
+        "failed": sum(r["failed"] for r in results),
+        "results": results,
+    }
+    with open(os.path.join(out_dir, "report.json"), "w") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def print_report(report, out=sys.stdout):
+    """Print per-shard results and the merged coverage / scoreboard totals."""
+    out.write(f"\n{'Shard':>5}  {'Seed':>10}  {'Status':6}  {'Samples':>8}  {'Coverage':>8}  "
+              f"{'Passed':>8}  {'Failed':>6}  {'Wall (s)':>8}\n")
+    for r in report["results"]:
+        out.write(f"{r['shard']:5}  {r['seed']:10}  {r['status']:6}  {r['samples']:8}  {r['coverage']:7.2f}%  "
+                  f"{r['passed']:8}  {r['failed']:6}  {r['wall_s']:8.1f}\n")
+    if report["closure_s"] is None:
+        closure = f"target {report['target']:.2f}% NOT reached"
+    else:
+        closure = f"target {report['target']:.2f}% reached after {report['closure_s']:.1f} s"
+    out.write(
+        f"\n{report['bench']}, {report['shards']} shards: merged coverage {report['coverage']:.2f}% "
+        f"over {report['samples']} samples, {closure} (all shards done after {report['wall_s']:.1f} s)\n"
+        f"Scoreboard: {report['passed']} passed, {report['failed']} failed\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run K seeds of one PyUVM bench against a merged coverage goal.")
+    parser.add_argument("args", nargs="+", metavar="BENCH|VAR=value",
+                        help="PyUVM bench name (e.g. Mealy), and make variables for every shard")
+    parser.add_argument("-k", "--shards", type=int, default=None, help="number of shards (default: available cores)")
+    parser.add_argument("--seed", type=int, default=None, help="seed of shard 0 (default: time based)")
+    parser.add_argument("--target", type=float, default=100.0, help="merged coverage goal in percent")
+    parser.add_argument("--sync", type=int, default=256, help="samples between coverage DB writes per shard")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds before the shards are stopped")
+    parser.add_argument("-o", "--out", default=None, help="output directory (default: regression/shards/<bench>)")
+    parser.add_argument("--cache", default=DEFAULT_CACHE, help="build cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="compile without the build cache")
+    # Intermixed: make variables may follow the options, as in the usage examples
+    options = parser.parse_intermixed_args(argv)
+
+    make_args = [a for a in options.args if "=" in a]
+    patterns = [a for a in options.args if "=" not in a]
+    if len(patterns) != 1:
+        parser.error("name exactly one PyUVM bench")
+    benches = select(discover(), patterns)
+    benches = {n: p for n, p in benches.items() if n.startswith("PyUVM/")}
+    if len(benches) != 1:
+        parser.error(f"'{patterns[0]}' must name exactly one PyUVM bench")
+    (name, path), = benches.items()
+    k = options.shards or available_cores()
+    seed = options.seed if options.seed is not None else int(time.time()) % 1000000000
+    out = options.out or os.path.join(REPO, "regression", "shards", name.split("/")[1])
+    cache = None if options.no_cache else BuildCache(options.cache)
+
+    report = run_shards(name, path, out, k, seed, options.target, make_args, options.sync,
+                        timeout=options.timeout, cache=cache)
+    print_report(report)
+    ok = report["closure_s"] is not None and not report["failed"] and all(
+        r["status"] == "PASS" for r in report["results"])
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+Tests of the coverage DB merge across coverage engines: a Mux run with the
+native engine and one with pyvsc merge into one DB with the same bins,
+crosses included.
+
+    python3 -m pytest test_covmerge.py
+"""
+
+import os
+import shutil
+import sys
+import pytest
+from regression import REPO, run_bench
+
+sys.path.insert(0, os.path.join(REPO, "PyUVM", "ip-cores-pyuvm", "Common"))
+import CoverageDB  # noqa: E402
+
+MUX = os.path.join(REPO, "PyUVM", "ip-cores-pyuvm", "Mux")
+
+pytestmark = pytest.mark.skipif(shutil.which("make") is None, reason="needs make")
+
+
+def test_native_and_pyvsc_dbs_merge(tmp_path):
+    pytest.importorskip("vsc")
+    dbs = []
+    for engine in ("native", "pyvsc"):
+        path = str(tmp_path / f"{engine}.json")
+        result = run_bench("Mux", MUX, str(tmp_path / engine),
+                           ["SIM=python", f"COVERAGE_ENGINE={engine}", f"COVERAGE_DB={path}"])
+        assert result["status"] == "PASS"
+        dbs.append(CoverageDB.read(path))
+
+    native, pyvsc = dbs
+    assert native["items"]["cp1X2"]["bins"] == pyvsc["items"]["cp1X2"]["bins"]
+    merged = CoverageDB.merge(dbs)
+    assert merged["samples"] == native["samples"] + pyvsc["samples"]
+    assert merged["coverage"] == 100.0
+    assert [sum(a) for a in zip(native["items"]["cp1X2"]["counts"], pyvsc["items"]["cp1X2"]["counts"])] \
+        == merged["items"]["cp1X2"]["counts"]
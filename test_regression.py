@@ -0,0 +1,42 @@
+"""
+Tests of regression.py on the pure-Python backend (SIM=python): a scoreboard
+mismatch fails the bench, and its failure window is replayed with waves on.
+
+The mismatch is seeded with a stuck-at fault on a DUT output (PYSIM_FORCE).
+
+    python3 -m pytest test_regression.py
+"""
+
+import os
+import shutil
+import pytest
+from regression import REPO, run_bench
+
+HALF_ADDER = os.path.join(REPO, "PyUVM", "ip-cores-pyuvm", "HalfAdder")
+MAKE_ARGS = ["WAVE_CAPTURE=fail", "SIM=python", "COVERAGE_ENGINE=native", "COVERAGE_DB="]
+
+pytestmark = pytest.mark.skipif(shutil.which("make") is None, reason="needs make")
+
+
+def test_pass_has_no_waves(tmp_path, monkeypatch):
+    monkeypatch.delenv("PYSIM_FORCE", raising=False)
+    result = run_bench("HalfAdder", HALF_ADDER, str(tmp_path), MAKE_ARGS)
+    assert result["status"] == "PASS"
+    assert result["checks"]["passed"] > 0 and result["checks"]["failed"] == 0
+    assert result["waves"] == []
+    assert not os.path.exists(tmp_path / "HalfAdder" / "wave_window.json")
+
+
+def test_mismatch_fails_and_replays_window(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYSIM_FORCE", "c=1")
+    result = run_bench("HalfAdder", HALF_ADDER, str(tmp_path), MAKE_ARGS)
+    assert result["status"] == "FAIL"
+    assert result["failures"] == 1
+    assert result["checks"]["failed"] > 0
+    run_dir = tmp_path / "HalfAdder"
+    assert os.path.exists(run_dir / "wave_window.json")
+    assert result["waves"] == [os.path.join("waves", "dump.vcd")]
+    with open(run_dir / "waves" / "dump.vcd") as f:
+        dump = f.read()
+    assert " c $end" in dump
+    assert not os.path.exists(os.path.join(HALF_ADDER, "dump.vcd"))